@@ -0,0 +1,88 @@
+"""Compare per-call connections against the pooled keep-alive session.
+
+Starts a local HTTP/1.1 server that answers ``system/db-changed-time`` and
+measures requests per second for
+
+* ``requests.get`` per call (how ``GrocyApiClient`` behaved before pooling)
+* ``GrocyApiClient`` with its pooled keep-alive session
+
+Run with ``python -m benchmarks.bench_connection_pool``.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+
+import requests
+
+from pygrocytoo.grocy_api_client import GrocyApiClient
+
+_BODY = b'{"changed_time": "2022-07-10 21:10:53"}'
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _run(call, requests_count: int, threads: int) -> float:
+    start = time.perf_counter()
+    if threads <= 1:
+        for _ in range(requests_count):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(call) for _ in range(requests_count)]:
+                future.result()
+    return requests_count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    server = _start_server()
+    host, port = server.server_address
+    client = GrocyApiClient(
+        "http://" + host, "api_key", port=port, pool_maxsize=max(args.threads, 1)
+    )
+    url = f"{client._base_url}system/db-changed-time"
+
+    def unpooled():
+        requests.get(url, headers=client._headers).json()
+
+    try:
+        before = _run(unpooled, args.requests, args.threads)
+        after = _run(client.get_last_db_changed, args.requests, args.threads)
+    finally:
+        client.close()
+        server.shutdown()
+
+    print(f"per-call connections: {before:10.1f} req/s")
+    print(f"pooled session:       {after:10.1f} req/s ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
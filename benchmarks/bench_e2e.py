@@ -0,0 +1,313 @@
+"""End-to-end latency and throughput of the ``Grocy`` facade.
+
+Starts the local Grocy stand-in (``benchmarks.grocy_server``) for every
+``--presets`` dataset in its own process and drives each scenario against it
+at every ``--concurrency`` level, running each combination in a fresh client
+process. Per combination it reports
+
+* p50, p95 and p99 latency of one call and the calls per second
+* HTTP requests issued and response bytes received
+* client CPU time spent in the network layer, in JSON parsing and
+  validation, and in total
+* peak RSS of the client process
+
+``--output`` writes the results as JSON. With ``--baseline`` the p95
+latencies are compared against an earlier JSON file and the script exits with
+status 1 if any got slower than ``--tolerance`` allows.
+
+Run with ``python -m benchmarks.bench_e2e``.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from pygrocytoo import grocy_api_client
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.grocy import Grocy
+
+
+def _barcode_writes(grocy: Grocy, barcodes: list[str], index: int):
+    barcode = barcodes[index % len(barcodes)]
+    grocy.add_product_by_barcode(barcode, 1, 1.0)
+    grocy.consume_product_by_barcode(barcode, 1)
+
+
+SCENARIOS = {
+    "stock": lambda grocy, barcodes, index: grocy.stock(),
+    "due_products_details": lambda grocy, barcodes, index: grocy.due_products(
+        get_details=True
+    ),
+    "chores_details": lambda grocy, barcodes, index: grocy.chores(get_details=True),
+    "meal_plan_details": lambda grocy, barcodes, index: grocy.meal_plan(
+        get_details=True
+    ),
+    "all_products": lambda grocy, barcodes, index: grocy.all_products(),
+    "product_by_barcode": lambda grocy, barcodes, index: grocy.product_by_barcode(
+        barcodes[index % len(barcodes)]
+    ),
+    "barcode_writes": _barcode_writes,
+}
+
+
+class _Counters(object):
+    """Client side request, byte and CPU counters shared by all threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+        self.network_cpu = 0.0
+        self.parse_cpu = 0.0
+
+    def count_response(self, response, *args, **kwargs):
+        with self._lock:
+            self.requests += 1
+            self.bytes += len(response.content)
+
+    def timed(self, function, counter: str):
+        def wrapper(*args, **kwargs):
+            start = time.thread_time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - start
+                with self._lock:
+                    setattr(self, counter, getattr(self, counter) + elapsed)
+
+        return wrapper
+
+
+class _TimedJson(object):
+    """Stands in for the ``json`` module of the client to time ``loads``."""
+
+    def __init__(self, counters: _Counters):
+        self.loads = counters.timed(json.loads, "parse_cpu")
+
+    def __getattr__(self, name: str):
+        return getattr(json, name)
+
+
+def _instrument(grocy: Grocy) -> _Counters:
+    counters = _Counters()
+    api_client = grocy._api_client
+    api_client.transport.session.hooks["response"].append(counters.count_response)
+    api_client._fetch = counters.timed(api_client._fetch, "network_cpu")
+    for name in ("parse_list", "parse_model"):
+        function = getattr(grocy_api_client, name)
+        setattr(grocy_api_client, name, counters.timed(function, "parse_cpu"))
+    grocy_api_client.json = _TimedJson(counters)
+    return counters
+
+
+def _percentile(timings: list[float], percent: int) -> float:
+    if len(timings) == 1:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+
+def run_worker(scenario: str, port: int, concurrency: int, iterations: int) -> dict:
+    """Run one scenario against the stand-in on ``port`` in this process."""
+    grocy = Grocy("http://127.0.0.1", "api_key", port=port, verify_ssl=False)
+    barcodes = [
+        row["barcode"]
+        for row in grocy.get_generic_objects_for_type(
+            EntityType.PRODUCT_BARCODES, limit=100
+        )
+    ]
+    call = SCENARIOS[scenario]
+    call(grocy, barcodes, 0)
+    counters = _instrument(grocy)
+
+    def timed_call(index: int) -> float:
+        start = time.perf_counter()
+        call(grocy, barcodes, index)
+        return time.perf_counter() - start
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = list(executor.map(timed_call, range(iterations)))
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    grocy.close()
+
+    return {
+        "latency_ms": {
+            "p50": _percentile(timings, 50) * 1000,
+            "p95": _percentile(timings, 95) * 1000,
+            "p99": _percentile(timings, 99) * 1000,
+            "mean": statistics.fmean(timings) * 1000,
+        },
+        "calls_per_second": iterations / elapsed,
+        "requests": counters.requests,
+        "bytes": counters.bytes,
+        "cpu_seconds": {
+            "total": cpu,
+            "network": counters.network_cpu,
+            "parsing": counters.parse_cpu,
+        },
+        # ru_maxrss is in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _start_server(preset: str, latency: float) -> tuple[subprocess.Popen, int]:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.grocy_server",
+            "--preset",
+            preset,
+            "--port",
+            "0",
+            "--latency",
+            str(latency),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = server.stdout.readline()
+    port = int(line.rsplit(":", 1)[1].split("/", 1)[0])
+    return server, port
+
+
+def _run_scenario(scenario: str, port: int, concurrency: int, iterations: int) -> dict:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_e2e",
+            "--worker",
+            scenario,
+            "--port",
+            str(port),
+            "--concurrency",
+            str(concurrency),
+            "--iterations",
+            str(iterations),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _regressions(results: list[dict], baseline_path: str, tolerance: float) -> list:
+    with open(baseline_path) as baseline_file:
+        baseline = {
+            (row["preset"], row["scenario"], row["concurrency"]): row
+            for row in json.load(baseline_file)["results"]
+        }
+    regressions = []
+    for row in results:
+        before = baseline.get((row["preset"], row["scenario"], row["concurrency"]))
+        if before is None:
+            continue
+        ratio = row["latency_ms"]["p95"] / before["latency_ms"]["p95"]
+        if ratio > 1 + tolerance:
+            regressions.append((row, ratio))
+    return regressions
+
+
+def _csv(value: str) -> list[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--presets", type=_csv, default=["small", "medium"])
+    parser.add_argument("--scenarios", type=_csv, default=list(SCENARIOS))
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(v) for v in _csv(value)],
+        default=[1, 4],
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="server latency in seconds"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(
+            args.worker, args.port, args.concurrency[0], args.iterations
+        )
+        print(json.dumps(result))
+        return
+
+    results = []
+    print(
+        f"{'preset':<8}{'scenario':<22}{'conc':>5}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'p99 ms':>9}{'calls/s':>9}{'reqs':>7}{'KiB':>8}{'net ms':>8}"
+        f"{'parse ms':>9}{'cpu ms':>8}{'rss MB':>8}"
+    )
+    for preset in args.presets:
+        server, port = _start_server(preset, args.latency)
+        try:
+            for scenario in args.scenarios:
+                for concurrency in args.concurrency:
+                    row = {
+                        "preset": preset,
+                        "scenario": scenario,
+                        "concurrency": concurrency,
+                        "iterations": args.iterations,
+                        **_run_scenario(scenario, port, concurrency, args.iterations),
+                    }
+                    results.append(row)
+                    latency, cpu = row["latency_ms"], row["cpu_seconds"]
+                    print(
+                        f"{preset:<8}{scenario:<22}{concurrency:>5}"
+                        f"{latency['p50']:>9.1f}{latency['p95']:>9.1f}"
+                        f"{latency['p99']:>9.1f}{row['calls_per_second']:>9.1f}"
+                        f"{row['requests']:>7}{row['bytes'] / 1024:>8.0f}"
+                        f"{cpu['network'] * 1000:>8.1f}{cpu['parsing'] * 1000:>9.1f}"
+                        f"{cpu['total'] * 1000:>8.1f}{row['peak_rss_mb']:>8.1f}"
+                    )
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(
+                {
+                    "meta": {
+                        "created": datetime.datetime.now().isoformat(),
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "latency": args.latency,
+                    },
+                    "results": results,
+                },
+                output,
+                indent=2,
+            )
+
+    if args.baseline:
+        regressions = _regressions(results, args.baseline, args.tolerance)
+        for row, ratio in regressions:
+            print(
+                f"REGRESSION {row['preset']}/{row['scenario']}/"
+                f"{row['concurrency']}: p95 {ratio:.2f}x the baseline"
+            )
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
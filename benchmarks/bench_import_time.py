@@ -0,0 +1,73 @@
+"""Measure the cold import time of the pygrocytoo entry points.
+
+Every import runs in a fresh interpreter. The best of ``--runs`` is reported
+per module together with the heavy third party packages it pulled in, and the
+script exits with status 1 if a module takes longer than its threshold, so it
+can guard against import time regressions in CI.
+
+Run with ``python -m benchmarks.bench_import_time``.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Default regression thresholds in milliseconds.
+THRESHOLDS_MS = {
+    "pygrocytoo": 10.0,
+    "pygrocytoo.grocy": 80.0,
+    "pygrocytoo.async_grocy": 120.0,
+}
+HEAVY_MODULES = ("asyncio", "httpx", "pydantic", "requests")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+
+def _measure(module: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the thresholds, e.g. for slow CI machines",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<26}{'best ms':>10}{'median ms':>12}{'limit ms':>10}  loads")
+    for module, threshold in THRESHOLDS_MS.items():
+        results = [_measure(module) for _ in range(args.runs)]
+        timings = [result["ms"] for result in results]
+        best = min(timings)
+        limit = threshold * args.scale
+        failed |= best > limit
+        print(
+            f"{module:<26}{best:>10.1f}{statistics.median(timings):>12.1f}"
+            f"{limit:>10.1f}  {', '.join(results[0]['heavy']) or '-'}"
+            f"{'  REGRESSION' if best > limit else ''}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
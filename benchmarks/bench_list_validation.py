@@ -0,0 +1,103 @@
+"""Compare per-item model construction against batched list validation.
+
+Builds synthetic JSON arrays for the large list endpoints and measures
+
+* ``json.loads`` followed by ``Model(**item)`` per item (the old path)
+* a cached ``TypeAdapter(list[Model])`` validating the raw bytes in one pass
+
+Run with ``python -m benchmarks.bench_list_validation``.
+"""
+
+import argparse
+import json
+import time
+
+from pygrocytoo.grocy_api_client import (
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    ProductData,
+)
+from pygrocytoo.parsing import parse_list
+
+
+def _product(product_id: int) -> dict:
+    return {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "description": "",
+        "location_id": product_id % 7 or "",
+        "product_group_id": product_id % 11 or "",
+        "qu_id_stock": 1,
+        "qu_id_purchase": 2,
+        "picture_file_name": None,
+        "allow_partial_units_in_stock": 0,
+        "row_created_timestamp": "2022-07-10 21:10:53",
+        "min_stock_amount": "0",
+        "default_best_before_days": 7,
+    }
+
+
+def _stock_entry(product_id: int) -> dict:
+    return {
+        "product_id": product_id,
+        "amount": "3",
+        "amount_aggregated": "3",
+        "amount_opened": "0",
+        "amount_opened_aggregated": "0",
+        "best_before_date": "2022-08-01",
+        "is_aggregated_amount": "0",
+        "product": _product(product_id),
+    }
+
+
+def _chore(chore_id: int) -> dict:
+    return {
+        "chore_id": chore_id,
+        "last_tracked_time": "2022-07-10 21:10:53",
+        "next_estimated_execution_time": "2022-07-17 21:10:53",
+        "track_date_only": "0",
+        "next_execution_assigned_to_user_id": "",
+    }
+
+
+PAYLOADS = {
+    "products": (ProductData, _product),
+    "stock": (CurrentStockResponse, _stock_entry),
+    "chores": (CurrentChoreResponse, _chore),
+}
+
+
+def _per_item(model, content: bytes) -> list:
+    parsed_json = json.loads(content)
+    return [model(**item) for item in parsed_json]
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=8000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (model, factory) in PAYLOADS.items():
+        content = json.dumps([factory(i) for i in range(1, args.items + 1)]).encode()
+        assert _per_item(model, content) == parse_list(model, content)
+
+        before = _best_of(lambda: _per_item(model, content), args.repeat)
+        after = _best_of(lambda: parse_list(model, content), args.repeat)
+        print(
+            f"{name:10} {args.items} items: per-item {before * 1000:8.1f} ms, "
+            f"batched {after * 1000:8.1f} ms ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure the memory used per ``DataModel`` wrapper instance.
+
+Builds ``--items`` wrappers of the most common models from a single response
+and reports the bytes allocated per instance, as measured by ``tracemalloc``,
+for
+
+* the slotted ``DataModel`` classes
+* the same classes rebuilt without ``__slots__`` (a per-instance ``__dict__``,
+  how they behaved before)
+
+Run with ``python -m benchmarks.bench_model_memory``.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks.bench_list_validation import _chore, _stock_entry
+from pygrocytoo.data_models.chore import Chore
+from pygrocytoo.data_models.meal_items import MealPlanItem
+from pygrocytoo.data_models.product import Product, ShoppingListProduct
+from pygrocytoo.grocy_api_client import (
+    ChoreDetailsResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    MealPlanResponse,
+    MissingProductResponse,
+    ShoppingListItem,
+)
+
+RESPONSES = {
+    "Product (stock)": (Product, CurrentStockResponse(**_stock_entry(1))),
+    "Product (missing)": (
+        Product,
+        MissingProductResponse(
+            id=1, name="Cookies", amount_missing=2, is_partly_in_stock=0
+        ),
+    ),
+    "Chore": (Chore, CurrentChoreResponse(**_chore(1))),
+    "Chore (details)": (
+        Chore,
+        ChoreDetailsResponse(
+            chore={
+                "id": 1,
+                "name": "Vacuum",
+                "period_type": "weekly",
+                "track_date_only": 0,
+                "rollover": 0,
+            },
+            track_count=3,
+        ),
+    ),
+    "MealPlanItem": (
+        MealPlanItem,
+        MealPlanResponse(
+            id=1,
+            day="2022-04-18",
+            type="recipe",
+            recipe_id=1,
+            row_created_timestamp="2022-04-22 08:37:58",
+        ),
+    ),
+    "ShoppingListProduct": (
+        ShoppingListProduct,
+        ShoppingListItem(
+            id=1,
+            product_id=1,
+            amount=1,
+            row_created_timestamp="2022-04-22 08:37:58",
+            shopping_list_id=1,
+            done=0,
+        ),
+    ),
+}
+
+
+def _without_slots(cls: type) -> type:
+    """Copy ``cls`` and its bases as classes storing attributes in a dict."""
+    namespace = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        slots = set(vars(klass).get("__slots__", ()))
+        namespace.update(
+            (key, value)
+            for key, value in vars(klass).items()
+            if key not in slots and key not in ("__slots__", "__dict__")
+        )
+    return type(cls.__name__, (object,), namespace)
+
+
+def _bytes_per_instance(cls: type, response, items: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(response) for _ in range(items)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return size / items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, (cls, response) in RESPONSES.items():
+        before = _bytes_per_instance(_without_slots(cls), response, args.items)
+        after = _bytes_per_instance(cls, response, args.items)
+        print(
+            f"{name:20} {args.items} instances: __dict__ {before:7.1f} B, "
+            f"__slots__ {after:7.1f} B ({1 - after / before:.0%} less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare ways of turning Grocy detail responses into response models.
+
+Measures, for synthetic ``ProductDetailsResponse`` bodies,
+
+* ``json.loads`` followed by ``Model(**data)`` (how the client used to parse)
+* validation straight from the raw bytes (how the client parses now)
+* ``json.loads`` followed by an unvalidated ``model_construct`` of the model
+  and its nested models, i.e. what a "trusted" parse mode would have to do
+
+Run with ``python -m benchmarks.bench_parse_mode``.
+"""
+
+import argparse
+import json
+
+from benchmarks.bench_list_validation import _best_of, _product
+from pygrocytoo.grocy_api_client import (
+    LocationData,
+    ProductBarcodeData,
+    ProductData,
+    ProductDetailsResponse,
+    QuantityUnitData,
+)
+from pygrocytoo.parsing import parse_model
+
+
+def _product_details(product_id: int) -> dict:
+    quantity_unit = {
+        "id": 1,
+        "name": "Piece",
+        "name_plural": "Pieces",
+        "description": None,
+        "row_created_timestamp": "2022-07-10 21:10:53",
+    }
+    return {
+        "last_purchased": "2022-07-01",
+        "last_used": "2022-07-09 10:00:00",
+        "stock_amount": "3",
+        "stock_amount_opened": "0",
+        "next_best_before_date": "2022-08-01",
+        "last_price": "1.99",
+        "product": _product(product_id),
+        "quantity_unit_stock": quantity_unit,
+        "default_quantity_unit_purchase": quantity_unit,
+        "product_barcodes": [{"barcode": f"400{product_id}", "amount": None}],
+        "location": {
+            "id": 1,
+            "name": "Fridge",
+            "row_created_timestamp": "2022-07-10 21:10:53",
+        },
+    }
+
+
+def _kwargs(content: bytes) -> ProductDetailsResponse:
+    return ProductDetailsResponse(**json.loads(content))
+
+
+def _construct(content: bytes) -> ProductDetailsResponse:
+    data = json.loads(content)
+    return ProductDetailsResponse.model_construct(
+        **{
+            key: value
+            for key, value in data.items()
+            if not isinstance(value, (dict, list))
+        },
+        product=ProductData.model_construct(**data["product"]),
+        quantity_unit_stock=QuantityUnitData.model_construct(
+            **data["quantity_unit_stock"]
+        ),
+        default_quantity_unit_purchase=QuantityUnitData.model_construct(
+            **data["default_quantity_unit_purchase"]
+        ),
+        barcodes=[
+            ProductBarcodeData.model_construct(**barcode)
+            for barcode in data["product_barcodes"]
+        ],
+        location=LocationData.model_construct(**data["location"]),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=8000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = [
+        json.dumps(_product_details(i)).encode() for i in range(1, args.items + 1)
+    ]
+    paths = {
+        "json.loads + Model(**data)": _kwargs,
+        "validate raw bytes": lambda content: parse_model(
+            ProductDetailsResponse, content
+        ),
+        "unvalidated construct": _construct,
+    }
+
+    baseline = None
+    for name, parse in paths.items():
+        elapsed = _best_of(lambda: [parse(body) for body in bodies], args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:28} {args.items} bodies: {elapsed * 1000:8.1f} ms "
+            f"({baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
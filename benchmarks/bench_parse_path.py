@@ -0,0 +1,260 @@
+"""Per-model cost of the parse path, measured on the recorded cassettes.
+
+Loads real Grocy response bodies from ``test/cassettes`` and scales each one
+up to ``--objects`` objects (list bodies by repeating their items, single
+object bodies by parsing the body that many times). For every response model
+it then times, separately,
+
+* ``decode``: ``json.loads`` of the body
+* ``validate``: pydantic validation of the decoded data
+* ``validate_json``: validation straight from the bytes, the client's path
+* ``wrap``: construction of the ``DataModel`` the ``Grocy`` facade returns
+
+and reports the best per-object time in microseconds. A second, untimed pass
+under ``tracemalloc`` reports the peak bytes allocated and the memory blocks
+still held by the result, both per object.
+
+Run with ``python -m benchmarks.bench_parse_path``.
+"""
+
+import argparse
+from itertools import cycle, islice
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from pygrocytoo.data_models.battery import Battery
+from pygrocytoo.data_models.chore import Chore
+from pygrocytoo.data_models.meal_items import MealPlanItem
+from pygrocytoo.data_models.product import Product, ShoppingListProduct
+from pygrocytoo.data_models.system import SystemConfig, SystemInfo, SystemTime
+from pygrocytoo.data_models.task import Task
+from pygrocytoo.data_models.user import User
+from pygrocytoo.grocy_api_client import (
+    BatteryDetailsResponse,
+    ChoreDetailsResponse,
+    CurrentBatteryResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    MealPlanResponse,
+    ProductData,
+    ProductDetailsResponse,
+    ShoppingListItem,
+    SystemConfigDto,
+    SystemInfoDto,
+    SystemTimeDto,
+    TaskResponse,
+    UserDto,
+)
+from pygrocytoo.parsing import _adapter
+
+CASSETTES = pathlib.Path(__file__).parent.parent / "test" / "cassettes"
+
+# Case name: (cassette, request path, response model, wrapper, list body).
+CASES = {
+    "CurrentStockResponse": (
+        "test_stock/TestStock.test_get_stock_valid.yaml",
+        "stock",
+        CurrentStockResponse,
+        Product,
+        True,
+    ),
+    "ProductDetailsResponse": (
+        "test_product/TestProduct.test_product_get_details_valid.yaml",
+        "stock/products/8",
+        ProductDetailsResponse,
+        Product,
+        False,
+    ),
+    "ProductData": (
+        "test_product/TestProduct.test_get_all_products.yaml",
+        "objects/products",
+        ProductData,
+        Product,
+        True,
+    ),
+    "CurrentChoreResponse": (
+        "test_chores/TestChores.test_get_chores_valid.yaml",
+        "chores",
+        CurrentChoreResponse,
+        Chore,
+        True,
+    ),
+    "ChoreDetailsResponse": (
+        "test_chores/TestChores.test_get_chore_details.yaml",
+        "chores/3",
+        ChoreDetailsResponse,
+        Chore,
+        False,
+    ),
+    "CurrentBatteryResponse": (
+        "test_battery/TestBattery.test_get_batteries_valid.yaml",
+        "batteries",
+        CurrentBatteryResponse,
+        Battery,
+        True,
+    ),
+    "BatteryDetailsResponse": (
+        "test_battery/TestBattery.test_get_battery_details_valid.yaml",
+        "batteries/1",
+        BatteryDetailsResponse,
+        Battery,
+        False,
+    ),
+    "TaskResponse": (
+        "test_tasks/TestTasks.test_get_task_valid.yaml",
+        "objects/tasks/2",
+        TaskResponse,
+        Task,
+        False,
+    ),
+    "MealPlanResponse": (
+        "test_meal_plan/TestMealPlan.test_get_meal_plan_valid.yaml",
+        "objects/meal_plan",
+        MealPlanResponse,
+        MealPlanItem,
+        True,
+    ),
+    "ShoppingListItem": (
+        "test_shoppinglist/TestShoppingList.test_get_shopping_list_valid.yaml",
+        "objects/shopping_list",
+        ShoppingListItem,
+        ShoppingListProduct,
+        True,
+    ),
+    "UserDto": (
+        "test_users/TestUsers.test_get_users_valid.yaml",
+        "users",
+        UserDto,
+        User,
+        True,
+    ),
+    "SystemInfoDto": (
+        "test_system/TestSystem.test_get_system_info_valid.yaml",
+        "system/info",
+        SystemInfoDto,
+        SystemInfo,
+        False,
+    ),
+    "SystemTimeDto": (
+        "test_system/TestSystem.test_get_system_time_valid.yaml",
+        "system/time",
+        SystemTimeDto,
+        SystemTime,
+        False,
+    ),
+    "SystemConfigDto": (
+        "test_system/TestSystem.test_get_system_config_valid.yaml",
+        "system/config",
+        SystemConfigDto,
+        SystemConfig,
+        False,
+    ),
+}
+
+
+def load_body(cassette: str, path: str) -> bytes:
+    """The recorded response body of the first GET of ``path`` in ``cassette``."""
+    with open(CASSETTES / cassette) as cassette_file:
+        interactions = yaml.safe_load(cassette_file)["interactions"]
+    for interaction in interactions:
+        request = interaction["request"]
+        if request["method"] == "GET" and request["uri"].endswith(f"/api/{path}"):
+            return interaction["response"]["body"]["string"].encode()
+    raise LookupError(f"No GET /api/{path} in {cassette}")
+
+
+def scaled_bodies(body: bytes, objects: int, is_list: bool) -> list[bytes]:
+    """Bodies holding ``objects`` objects in total, built from ``body``."""
+    if not is_list:
+        return [body] * objects
+    items = json.loads(body)
+    return [json.dumps(list(islice(cycle(items), objects))).encode()]
+
+
+def stages(model, wrapper, bodies: list[bytes], is_list: bool) -> dict:
+    """The measured stages of one case, each taking no arguments."""
+    annotation = list[model] if is_list else model
+    adapter = _adapter(annotation)
+    decoded = [json.loads(body) for body in bodies]
+    validated = [adapter.validate_python(data) for data in decoded]
+    if is_list:
+        validated = validated[0]
+
+    return {
+        "decode": lambda: [json.loads(body) for body in bodies],
+        "validate": lambda: [adapter.validate_python(data) for data in decoded],
+        "validate_json": lambda: [adapter.validate_json(body) for body in bodies],
+        "wrap": lambda: [wrapper(response) for response in validated],
+    }
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _allocations(fn) -> tuple[int, int]:
+    """Peak bytes allocated by ``fn`` and blocks still held by its result."""
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    held = sys.getallocatedblocks() - blocks
+    del result
+    return peak, held
+
+
+def measure(name: str, objects: int, repeat: int) -> dict:
+    """Per-object time in microseconds and allocations of each stage."""
+    cassette, path, model, wrapper, is_list = CASES[name]
+    bodies = scaled_bodies(load_body(cassette, path), objects, is_list)
+    results = {}
+    for stage, fn in stages(model, wrapper, bodies, is_list).items():
+        seconds = _best_of(fn, repeat)
+        peak, held = _allocations(fn)
+        results[stage] = {
+            "us": seconds / objects * 1e6,
+            "peak_bytes": peak / objects,
+            "blocks": held / objects,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--models",
+        type=lambda value: value.split(","),
+        default=list(CASES),
+        help="comma separated subset of: " + ", ".join(CASES),
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<24}{'stage':<15}{'us/obj':>9}{'peak B/obj':>12}"
+        f"{'blocks/obj':>12}"
+    )
+    for name in args.models:
+        for stage, result in measure(name, args.objects, args.repeat).items():
+            print(
+                f"{name:<24}{stage:<15}{result['us']:>9.2f}"
+                f"{result['peak_bytes']:>12.0f}{result['blocks']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
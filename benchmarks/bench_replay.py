@@ -0,0 +1,151 @@
+"""Record a dashboard refresh once and replay it to profile the client.
+
+``record`` runs one dashboard refresh (stock, volatile stock, chores,
+batteries, tasks, meal plan and shopping list, with details) against a Grocy
+server through a ``RecordingTransport`` and saves the traffic to a gzip
+compressed file. Without ``--url`` the local stand-in
+(``benchmarks.grocy_server``) is started and recorded instead.
+
+``replay`` runs the same refresh ``--runs`` times against a
+``ReplayTransport`` serving that file, with the recorded latency scaled by
+``--latency-scale`` (0 by default, so only the client is measured), and
+reports per refresh
+
+* wall and process CPU time
+* peak memory traced by ``tracemalloc`` and blocks left allocated afterwards
+
+``--output`` writes the numbers as JSON. With ``--baseline`` the CPU time is
+compared against an earlier JSON file and the script exits with status 1 if
+it grew by more than ``--tolerance``.
+
+Run with ``python -m benchmarks.bench_replay record dashboard.json.gz`` and
+``python -m benchmarks.bench_replay replay dashboard.json.gz``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.dataset import PRESETS, generate_dataset
+from benchmarks.grocy_server import GrocyStandIn
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.replay import RecordingTransport, ReplayTransport
+from pygrocytoo.transport import HttpTransport
+
+
+def dashboard_refresh(grocy: Grocy):
+    """The calls of one refresh of a typical Grocy dashboard."""
+    grocy.stock()
+    grocy.volatile_stock()
+    grocy.chores(get_details=True)
+    grocy.batteries(get_details=True)
+    grocy.tasks()
+    grocy.meal_plan(get_details=True)
+    grocy.shopping_list(get_details=True)
+
+
+def record(args):
+    standin = None
+    url, port = args.url, args.port
+    if url is None:
+        standin = GrocyStandIn(generate_dataset(args.preset)).start()
+        url, port = standin.url, standin.port
+
+    transport = RecordingTransport(HttpTransport(verify_ssl=not args.insecure))
+    try:
+        with Grocy(url, args.api_key, port=port, transport=transport) as grocy:
+            dashboard_refresh(grocy)
+        transport.save(args.recording)
+    finally:
+        if standin is not None:
+            standin.stop()
+    print(f"Recorded {len(transport.exchanges)} requests to {args.recording}")
+
+
+def _traced(grocy: Grocy, runs: int) -> tuple[float, float]:
+    """Peak traced KiB of one refresh and blocks it left allocated."""
+    peak = 0
+    blocks = sys.getallocatedblocks()
+    for _ in range(runs):
+        tracemalloc.start()
+        dashboard_refresh(grocy)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak / 1024, (sys.getallocatedblocks() - blocks) / runs
+
+
+def replay(args):
+    transport = ReplayTransport(args.recording, args.latency_scale)
+    grocy = Grocy("http://localhost", "api_key", transport=transport)
+    dashboard_refresh(grocy)
+    requests_per_refresh = transport.served
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        dashboard_refresh(grocy)
+    wall = (time.perf_counter() - start) / args.runs
+    cpu = (time.process_time() - cpu_start) / args.runs
+    peak_kib, blocks = _traced(grocy, args.trace_runs)
+
+    result = {
+        "recording": args.recording,
+        "runs": args.runs,
+        "latency_scale": args.latency_scale,
+        "requests_per_refresh": requests_per_refresh,
+        "wall_ms": wall * 1000,
+        "cpu_ms": cpu * 1000,
+        "peak_kib": peak_kib,
+        "blocks_left": blocks,
+        "python": platform.python_version(),
+    }
+    print(
+        f"{args.runs} refreshes of {requests_per_refresh} requests: "
+        f"{result['wall_ms']:.2f} ms wall, {result['cpu_ms']:.2f} ms CPU, "
+        f"{peak_kib:.0f} KiB peak, {blocks:.1f} blocks left per refresh"
+    )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(result, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        ratio = result["cpu_ms"] / baseline["cpu_ms"]
+        print(f"CPU time is {ratio:.2f}x the baseline")
+        sys.exit(1 if ratio > 1 + args.tolerance else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="record a dashboard refresh")
+    record_parser.add_argument("recording", help="file to write, e.g. run.json.gz")
+    record_parser.add_argument("--url", help="Grocy base URL, default: stand-in")
+    record_parser.add_argument("--port", type=int, default=9192)
+    record_parser.add_argument("--api-key", default="api_key")
+    record_parser.add_argument("--insecure", action="store_true")
+    record_parser.add_argument("--preset", choices=PRESETS, default="medium")
+    record_parser.set_defaults(run=record)
+
+    replay_parser = commands.add_parser("replay", help="replay a recording")
+    replay_parser.add_argument("recording")
+    replay_parser.add_argument("--runs", type=int, default=1000)
+    replay_parser.add_argument("--trace-runs", type=int, default=10)
+    replay_parser.add_argument("--latency-scale", type=float, default=0.0)
+    replay_parser.add_argument("--output", help="write the results to this file")
+    replay_parser.add_argument("--baseline", help="JSON results of an earlier run")
+    replay_parser.add_argument("--tolerance", type=float, default=0.1)
+    replay_parser.set_defaults(run=replay)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare ``DataModel`` serialization against the previous implementation.
+
+Builds ``--items`` stock products, each with two barcodes and a purchase
+quantity unit, and measures
+
+* ``as_dict`` rescanning the class ``__dict__`` for properties on every call,
+  with nested models handled by ``json.dumps(default=...)`` (the old path)
+* ``as_dict`` using the cached per-class field plan
+* ``dump_json`` writing the whole list to a file-like object
+
+Run with ``python -m benchmarks.bench_serialization``.
+"""
+
+import argparse
+import datetime
+import io
+import json
+import time
+
+from benchmarks.bench_list_validation import _stock_entry
+from pygrocytoo.base import dump_json, get_val
+from pygrocytoo.data_models.product import Product, ProductBarcode, QuantityUnit
+from pygrocytoo.grocy_api_client import (
+    CurrentStockResponse,
+    ProductBarcodeData,
+    QuantityUnitData,
+)
+
+
+def _products(items: int) -> list[Product]:
+    quantity_unit = QuantityUnit(
+        QuantityUnitData(id=3, name="Pack", row_created_timestamp="2022-07-10")
+    )
+    products = []
+    for product_id in range(1, items + 1):
+        product = Product(CurrentStockResponse(**_stock_entry(product_id)))
+        barcodes = [
+            ProductBarcode(ProductBarcodeData(barcode=f"{product_id}{suffix}"))
+            for suffix in "01"
+        ]
+        product.apply_catalog_data(barcodes, quantity_unit)
+        products.append(product)
+    return products
+
+
+def _legacy_as_dict(model) -> dict:
+    return {
+        k: get_val(getattr(model, k))
+        for k, v in model.__class__.__dict__.items()
+        if isinstance(v, property)
+    }
+
+
+def _legacy_default(obj):
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return _legacy_as_dict(obj)
+
+
+def _legacy_to_json(products: list[Product]) -> str:
+    return json.dumps([_legacy_as_dict(p) for p in products], default=_legacy_default)
+
+
+def _dump_json(products: list[Product]) -> str:
+    fp = io.StringIO()
+    dump_json(products, fp)
+    return fp.getvalue()
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    products = _products(args.items)
+    assert json.loads(_dump_json(products)) == json.loads(_legacy_to_json(products))
+
+    cases = {
+        "as_dict (legacy)": lambda: [_legacy_as_dict(p) for p in products],
+        "as_dict": lambda: [p.as_dict() for p in products],
+        "to_json (legacy)": lambda: _legacy_to_json(products),
+        "dump_json": lambda: _dump_json(products),
+    }
+    for name, fn in cases.items():
+        elapsed = _best_of(fn, args.repeat)
+        print(
+            f"{name:18} {args.items} products: {elapsed * 1000:8.1f} ms "
+            f"({elapsed / args.items * 1e6:.2f} us/item)"
+        )
+
+
+if __name__ == "__main__":
+    main()
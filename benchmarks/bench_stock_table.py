@@ -0,0 +1,95 @@
+"""Compare stock reports over ``Product`` objects against ``StockTable``.
+
+Builds a synthetic ``GET /stock`` body of ``--items`` entries and measures,
+for "total opened amount per product group" and "everything expiring within
+3 days",
+
+* parsing into ``Product`` objects and looping over them (``Grocy.stock``)
+* building a ``StockTable`` backed by NumPy arrays
+* building a ``StockTable`` backed by ``array.array`` (no NumPy installed)
+
+Build and query times are reported separately.
+
+Run with ``python -m benchmarks.bench_stock_table``.
+"""
+
+import argparse
+import datetime
+import json
+import time
+
+from benchmarks.bench_list_validation import _stock_entry
+from pygrocytoo.data_models.product import Product
+from pygrocytoo.grocy_api_client import CurrentStockResponse
+from pygrocytoo.parsing import parse_list
+from pygrocytoo.stock_table import StockTable
+
+TODAY = datetime.date(2022, 8, 1)
+
+
+def _content(items: int) -> bytes:
+    entries = []
+    for product_id in range(1, items + 1):
+        entry = _stock_entry(product_id)
+        entry["amount_opened"] = str(product_id % 3)
+        entry["best_before_date"] = str(TODAY + datetime.timedelta(product_id % 30))
+        entries.append(entry)
+    return json.dumps(entries).encode()
+
+
+def _object_report(products: list[Product]):
+    opened = {}
+    for product in products:
+        group = product.product_group_id
+        opened[group] = opened.get(group, 0) + product.amount_opened
+    limit = datetime.datetime.combine(TODAY, datetime.time()) + datetime.timedelta(3)
+    expiring = [p for p in products if p.best_before_date <= limit]
+    return opened, expiring
+
+
+def _table_report(table: StockTable):
+    return table.sum_by("amount_opened"), table.expiring_within(3, today=TODAY)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = _content(args.items)
+    products = [Product(r) for r in parse_list(CurrentStockResponse, content)]
+    cases = {
+        "Product objects": (
+            lambda: [Product(r) for r in parse_list(CurrentStockResponse, content)],
+            lambda: _object_report(products),
+        ),
+    }
+    for name, use_numpy in (("StockTable numpy", True), ("StockTable array", False)):
+        table = StockTable.from_json(content, use_numpy)
+        assert len(_table_report(table)[1]) == len(_object_report(products)[1])
+        cases[name] = (
+            lambda use_numpy=use_numpy: StockTable.from_json(content, use_numpy),
+            lambda table=table: _table_report(table),
+        )
+
+    for name, (build, query) in cases.items():
+        build_time = _best_of(build, args.repeat)
+        query_time = _best_of(query, args.repeat)
+        print(
+            f"{name:18} {args.items} entries: build {build_time * 1000:7.1f} ms, "
+            f"query {query_time * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare the per-call cost of the client transports.
+
+Serves one ``benchmarks.dataset`` database through the local Grocy stand-in
+and times the same ``Grocy`` calls over
+
+* ``http``: the default pooled ``requests`` transport over TCP
+* ``unix``: ``UnixSocketTransport`` over a Unix domain socket
+* ``inprocess``: ``InProcessTransport`` calling the stand-in directly
+
+The stand-in's own work is identical for all three, so the differences are
+the cost of the transport itself.
+
+Run with ``python -m benchmarks.bench_transport``.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.dataset import PRESETS, generate_dataset
+from benchmarks.grocy_server import GrocyStandIn
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.transport import UnixSocketTransport
+
+CALLS = {
+    "system_time": lambda grocy: grocy.get_system_time(),
+    "stock": lambda grocy: grocy.stock(),
+    "add_product": lambda grocy: grocy.add_product(1, 1, 1.0),
+}
+
+
+def _time_calls(grocy: Grocy, call, calls: int) -> float:
+    call(grocy)
+    start = time.perf_counter()
+    for _ in range(calls):
+        call(grocy)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "grocy.sock")
+        with GrocyStandIn(generate_dataset(args.preset)) as tcp, GrocyStandIn(
+            generate_dataset(args.preset), unix_socket=socket_path
+        ) as unix:
+            clients = {
+                "http": Grocy(tcp.url, "api_key", port=tcp.port),
+                "unix": Grocy(
+                    unix.url, "api_key", transport=UnixSocketTransport(socket_path)
+                ),
+                "inprocess": Grocy(tcp.url, "api_key", transport=tcp.transport()),
+            }
+            print(f"{'call':<14}" + "".join(f"{name:>12}" for name in clients))
+            for name, call in CALLS.items():
+                timings = [
+                    _time_calls(grocy, call, args.calls) for grocy in clients.values()
+                ]
+                cells = "".join(f"{seconds * 1e6:>10.0f}us" for seconds in timings)
+                print(f"{name:<14}{cells}")
+            for grocy in clients.values():
+                grocy.close()
+
+
+if __name__ == "__main__":
+    main()
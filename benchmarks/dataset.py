@@ -0,0 +1,385 @@
+"""Seeded synthetic Grocy database for the local stand-in server.
+
+``generate_dataset`` returns the rows of every Grocy table the stand-in
+serves, keyed on the table name as used by ``objects/{entity}``. The same
+preset, seed and day always produce the same rows, so benchmark runs are
+comparable. Best before dates, chore executions and task due dates are spread
+around ``today`` so the volatile stock and due lists are never empty.
+"""
+
+import datetime
+import random
+
+# Number of rows per table of each size preset.
+PRESETS = {
+    "small": {
+        "products": 100,
+        "stock_log": 500,
+        "chores": 20,
+        "batteries": 5,
+        "tasks": 20,
+        "recipes": 20,
+        "meal_plan": 30,
+        "shopping_list": 20,
+    },
+    "medium": {
+        "products": 1_000,
+        "stock_log": 5_000,
+        "chores": 100,
+        "batteries": 20,
+        "tasks": 200,
+        "recipes": 100,
+        "meal_plan": 200,
+        "shopping_list": 100,
+    },
+    "large": {
+        "products": 10_000,
+        "stock_log": 50_000,
+        "chores": 500,
+        "batteries": 100,
+        "tasks": 1_000,
+        "recipes": 500,
+        "meal_plan": 1_000,
+        "shopping_list": 500,
+    },
+}
+USERS = 5
+QUANTITY_UNITS = 10
+LOCATIONS = 10
+PRODUCT_GROUPS = 20
+TASK_CATEGORIES = 5
+MEAL_PLAN_SECTIONS = 4
+SHOPPING_LISTS = 2
+# First barcode; product barcodes count up from here.
+BARCODE_BASE = 4_000_000_000_000
+
+_PERIOD_DAYS = {"daily": 1, "weekly": 7, "monthly": 30, "manually": None}
+_WORDS = (
+    "Apple Bread Butter Cheese Coffee Flour Honey Jam Milk Oat Pasta Pepper Rice "
+    "Salt Soap Sugar Tea Tomato Tuna Water Yogurt"
+).split()
+
+
+def timestamp(value: datetime.datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _name(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {index}"
+
+
+class _Generator(object):
+    def __init__(self, sizes: dict[str, int], seed: int, today: datetime.date):
+        self._sizes = sizes
+        self._rng = random.Random(seed)
+        self._today = today
+        self._now = datetime.datetime.combine(today, datetime.time(12))
+        self._created = timestamp(self._now - datetime.timedelta(days=365))
+        self.tables: dict[str, list[dict]] = {}
+
+    def _day(self, low: int, high: int) -> str:
+        offset = self._rng.randint(low, high)
+        return str(self._today + datetime.timedelta(days=offset))
+
+    def _time(self, low_days: int, high_days: int) -> str:
+        seconds = self._rng.randint(low_days * 86400, high_days * 86400)
+        return timestamp(self._now + datetime.timedelta(seconds=seconds))
+
+    def _named(self, table: str, label: str, count: int, **fields):
+        self.tables[table] = [
+            {
+                "id": row_id,
+                "name": f"{label} {row_id}",
+                "description": None,
+                **fields,
+                "row_created_timestamp": self._created,
+            }
+            for row_id in range(1, count + 1)
+        ]
+
+    def generate(self) -> dict[str, list[dict]]:
+        self._users()
+        self._named("quantity_units", "Unit", QUANTITY_UNITS, name_plural=None)
+        self._named("locations", "Location", LOCATIONS)
+        self._named("product_groups", "Group", PRODUCT_GROUPS)
+        self._named("task_categories", "Category", TASK_CATEGORIES)
+        self._named("shopping_lists", "List", SHOPPING_LISTS)
+        self._products()
+        self._stock()
+        self._stock_log()
+        self._chores()
+        self._batteries()
+        self._tasks()
+        self._meal_plan()
+        self._shopping_list()
+        return self.tables
+
+    def _users(self):
+        self.tables["users"] = [
+            {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "first_name": f"First{user_id}",
+                "last_name": f"Last{user_id}",
+                "display_name": f"First{user_id} Last{user_id}",
+                "row_created_timestamp": self._created,
+            }
+            for user_id in range(1, USERS + 1)
+        ]
+
+    def _products(self):
+        rng = self._rng
+        products = []
+        barcodes = []
+        for product_id in range(1, self._sizes["products"] + 1):
+            qu_id = rng.randint(1, QUANTITY_UNITS)
+            products.append(
+                {
+                    "id": product_id,
+                    "name": _name(rng, product_id),
+                    "description": None,
+                    "location_id": rng.randint(1, LOCATIONS),
+                    "product_group_id": (
+                        rng.randint(1, PRODUCT_GROUPS) if rng.random() < 0.9 else ""
+                    ),
+                    "qu_id_stock": qu_id,
+                    "qu_id_purchase": qu_id,
+                    "picture_file_name": None,
+                    "allow_partial_units_in_stock": 0,
+                    "row_created_timestamp": self._created,
+                    "min_stock_amount": rng.choice((0, 0, 0, 1, 2, 5)),
+                    "default_best_before_days": rng.choice((0, 3, 7, 30, 365)),
+                    "due_type": rng.choice((1, 1, 2)),
+                }
+            )
+            for _ in range(rng.choice((0, 1, 1, 1, 2))):
+                barcodes.append(
+                    {
+                        "id": len(barcodes) + 1,
+                        "product_id": product_id,
+                        "barcode": str(BARCODE_BASE + len(barcodes) + 1),
+                        "amount": None,
+                        "row_created_timestamp": self._created,
+                    }
+                )
+        self.tables["products"] = products
+        self.tables["product_barcodes"] = barcodes
+
+    def _stock(self):
+        rng = self._rng
+        stock = []
+        for product in self.tables["products"]:
+            if rng.random() < 0.3:
+                continue
+            for _ in range(rng.randint(1, 3)):
+                stock.append(
+                    {
+                        "id": len(stock) + 1,
+                        "product_id": product["id"],
+                        "amount": float(rng.randint(1, 10)),
+                        "best_before_date": self._day(-10, 60),
+                        "purchased_date": self._day(-30, 0),
+                        "stock_id": f"{rng.getrandbits(48):012x}",
+                        "price": round(rng.uniform(0.5, 20), 2),
+                        "open": 0,
+                        "opened_date": None,
+                        "location_id": product["location_id"],
+                        "shopping_location_id": None,
+                        "row_created_timestamp": self._created,
+                    }
+                )
+                if rng.random() < 0.2:
+                    stock[-1]["open"] = 1
+                    stock[-1]["opened_date"] = self._day(-5, 0)
+        self.tables["stock"] = stock
+
+    def _stock_log(self):
+        rng = self._rng
+        stock = self.tables["stock"]
+        rows = []
+        for log_id in range(1, self._sizes["stock_log"] + 1):
+            entry = rng.choice(stock)
+            transaction_type = rng.choice(("purchase", "consume", "consume"))
+            rows.append(
+                {
+                    "id": log_id,
+                    "product_id": entry["product_id"],
+                    "amount": float(rng.randint(1, 3)),
+                    "best_before_date": entry["best_before_date"],
+                    "purchased_date": entry["purchased_date"],
+                    "used_date": self._day(-30, 0),
+                    "spoiled": 0,
+                    "stock_id": entry["stock_id"],
+                    "transaction_type": transaction_type,
+                    "price": entry["price"],
+                    "undone": 0,
+                    "undone_timestamp": None,
+                    "opened_date": None,
+                    "row_created_timestamp": self._time(-30, 0),
+                    "location_id": entry["location_id"],
+                    "recipe_id": None,
+                    "correlation_id": None,
+                    "transaction_id": f"{rng.getrandbits(48):012x}",
+                    "stock_row_id": entry["id"],
+                    "shopping_location_id": None,
+                    "user_id": rng.randint(1, USERS),
+                }
+            )
+        self.tables["stock_log"] = rows
+
+    def _chores(self):
+        rng = self._rng
+        chores = []
+        log = []
+        for chore_id in range(1, self._sizes["chores"] + 1):
+            period_type = rng.choice(tuple(_PERIOD_DAYS))
+            chores.append(
+                {
+                    "id": chore_id,
+                    "name": f"Chore {chore_id}",
+                    "description": None,
+                    "period_type": period_type,
+                    "period_config": None,
+                    "period_days": _PERIOD_DAYS[period_type] or 0,
+                    "track_date_only": 0,
+                    "rollover": 0,
+                    "assignment_type": None,
+                    "assignment_config": None,
+                    "next_execution_assigned_to_user_id": None,
+                    "row_created_timestamp": self._created,
+                }
+            )
+            for _ in range(rng.randint(0, 3)):
+                log.append(
+                    {
+                        "id": len(log) + 1,
+                        "chore_id": chore_id,
+                        "tracked_time": self._time(-40, 0),
+                        "done_by_user_id": rng.randint(1, USERS),
+                        "row_created_timestamp": self._created,
+                        "undone": 0,
+                        "undone_timestamp": None,
+                        "skipped": 0,
+                    }
+                )
+        self.tables["chores"] = chores
+        self.tables["chores_log"] = log
+
+    def _batteries(self):
+        rng = self._rng
+        batteries = []
+        cycles = []
+        for battery_id in range(1, self._sizes["batteries"] + 1):
+            batteries.append(
+                {
+                    "id": battery_id,
+                    "name": f"Battery {battery_id}",
+                    "description": None,
+                    "used_in": f"Device {battery_id}",
+                    "charge_interval_days": rng.choice((0, 30, 90)),
+                    "row_created_timestamp": self._created,
+                    "active": 1,
+                }
+            )
+            for _ in range(rng.randint(0, 2)):
+                cycles.append(
+                    {
+                        "id": len(cycles) + 1,
+                        "battery_id": battery_id,
+                        "tracked_time": self._time(-120, 0),
+                        "row_created_timestamp": self._created,
+                        "undone": 0,
+                        "undone_timestamp": None,
+                    }
+                )
+        self.tables["batteries"] = batteries
+        self.tables["battery_charge_cycles"] = cycles
+
+    def _tasks(self):
+        rng = self._rng
+        self.tables["tasks"] = [
+            {
+                "id": task_id,
+                "name": f"Task {task_id}",
+                "description": None,
+                "due_date": self._day(-5, 30) if rng.random() < 0.8 else None,
+                "done": int(rng.random() < 0.2),
+                "done_timestamp": None,
+                "category_id": rng.randint(1, TASK_CATEGORIES),
+                "assigned_to_user_id": rng.choice((None, rng.randint(1, USERS))),
+                "row_created_timestamp": self._created,
+            }
+            for task_id in range(1, self._sizes["tasks"] + 1)
+        ]
+
+    def _meal_plan(self):
+        rng = self._rng
+        self.tables["recipes"] = [
+            {
+                "id": recipe_id,
+                "name": f"Recipe {recipe_id}",
+                "description": None,
+                "base_servings": 2,
+                "desired_servings": 2,
+                "picture_file_name": None,
+                "type": "normal",
+                "row_created_timestamp": self._created,
+            }
+            for recipe_id in range(1, self._sizes["recipes"] + 1)
+        ]
+        self.tables["meal_plan_sections"] = [
+            {
+                "id": section_id,
+                "name": f"Section {section_id}",
+                "sort_number": section_id,
+                "row_created_timestamp": self._created,
+            }
+            for section_id in range(1, MEAL_PLAN_SECTIONS + 1)
+        ]
+        self.tables["meal_plan"] = [
+            {
+                "id": entry_id,
+                "day": self._day(-7, 21),
+                "type": "recipe",
+                "recipe_id": rng.randint(1, self._sizes["recipes"]),
+                "recipe_servings": 2,
+                "note": None,
+                "product_id": None,
+                "product_amount": None,
+                "product_qu_id": None,
+                "row_created_timestamp": self._created,
+                "section_id": rng.randint(1, MEAL_PLAN_SECTIONS),
+            }
+            for entry_id in range(1, self._sizes["meal_plan"] + 1)
+        ]
+
+    def _shopping_list(self):
+        rng = self._rng
+        self.tables["shopping_list"] = [
+            {
+                "id": item_id,
+                "product_id": rng.randint(1, self._sizes["products"]),
+                "note": None,
+                "amount": float(rng.randint(1, 5)),
+                "row_created_timestamp": self._created,
+                "shopping_list_id": rng.randint(1, SHOPPING_LISTS),
+                "done": 0,
+            }
+            for item_id in range(1, self._sizes["shopping_list"] + 1)
+        ]
+
+
+def generate_dataset(
+    preset: str = "small",
+    seed: int = 0,
+    today: datetime.date | None = None,
+    **sizes: int,
+) -> dict[str, list[dict]]:
+    """Rows of every table for ``preset``, with ``sizes`` overriding counts."""
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown preset {preset!r}, expected one of {list(PRESETS)}")
+    unknown = set(sizes) - set(PRESETS[preset])
+    if unknown:
+        raise ValueError(f"Unknown table sizes: {sorted(unknown)}")
+    counts = {**PRESETS[preset], **sizes}
+    return _Generator(counts, seed, today or datetime.date.today()).generate()
@@ -0,0 +1,970 @@
+"""Local stand-in for a Grocy server, for load tests and benchmarks.
+
+Serves a ``benchmarks.dataset`` database over HTTP/1.1 keep-alive and
+implements the API routes ``GrocyApiClient`` uses:
+
+* ``stock``, ``stock/volatile``, ``stock/products/{id}`` and the by-barcode
+  lookups, plus the add, consume, open and inventory writes
+* ``objects/{entity}`` with ``query[]`` filters, ``order``, ``limit`` and
+  ``offset``, and creating, updating and deleting rows
+* ``chores``, ``batteries``, ``tasks``, ``users`` and ``userfields``
+* ``stock/shoppinglist/*``, ``recipes/{id}/consume`` and ``files/*``
+* ``system/info``, ``system/time``, ``system/config`` and
+  ``system/db-changed-time``, which moves on every write
+
+Every response can be delayed by ``latency`` seconds plus a random
+``jitter`` to simulate a remote server. Besides TCP the stand-in can listen
+on a Unix domain socket, or skip the network entirely through ``transport()``.
+
+Run with ``python -m benchmarks.grocy_server --preset large --port 9192``.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from benchmarks.dataset import PRESETS, generate_dataset, timestamp
+from pygrocytoo.transport import InProcessTransport
+
+GROCY_VERSION = "4.2.0"
+DEFAULT_DUE_SOON_DAYS = 5
+
+# Grocy filter operators, longest first so "!=" is not read as "=".
+_FILTER = re.compile(r"^(\w+)(!=|!~|<=|>=|=|~|<|>|§)(.*)$", re.DOTALL)
+_PERIOD_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+
+class GrocyApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _number(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _matches(row: dict, query: str) -> bool:
+    match = _FILTER.match(query)
+    if match is None:
+        raise GrocyApiError(400, f"Invalid query filter {query!r}")
+    field, op, target = match.groups()
+    value = row.get(field)
+    text = "" if value is None else str(value)
+    if op == "=":
+        number = _number(target)
+        return text == target or (number is not None and _number(value) == number)
+    if op == "!=":
+        return not _matches(row, f"{field}={target}")
+    if op == "~":
+        return target.lower() in text.lower()
+    if op == "!~":
+        return target.lower() not in text.lower()
+    if op == "§":
+        return re.search(target, text) is not None
+    if value is None:
+        # Like SQLite, NULL is neither smaller nor larger than anything.
+        return False
+    left, right = _number(value), _number(target)
+    if left is None or right is None:
+        left, right = text, target
+    return {
+        "<": left < right,
+        ">": left > right,
+        "<=": left <= right,
+        ">=": left >= right,
+    }[op]
+
+
+def _sort_key(field: str):
+    def key(row: dict):
+        value = row.get(field)
+        number = _number(value)
+        if number is not None:
+            return (1, number, "")
+        return (0 if value in (None, "") else 2, 0, str(value))
+
+    return key
+
+
+def apply_query(rows: list[dict], params: dict[str, list[str]]) -> list[dict]:
+    """Filter, sort and page ``rows`` like Grocy's ``query[]``/order/limit."""
+    for query in params.get("query[]", ()):
+        rows = [row for row in rows if _matches(row, query)]
+    if "order" in params:
+        field, _, direction = params["order"][0].partition(":")
+        rows = sorted(rows, key=_sort_key(field), reverse=direction == "desc")
+    start = int(params.get("offset", ["0"])[0])
+    if "limit" in params:
+        end = start + int(params["limit"][0])
+        return rows[start:end]
+    return rows[start:]
+
+
+class GrocyStandIn(object):
+    """In-memory Grocy database and the HTTP server answering for it.
+
+    ``start`` serves on a background thread, ``url`` and ``port`` are what
+    ``Grocy``/``GrocyApiClient`` should be given. With ``unix_socket`` it
+    listens on that path instead of ``host`` and ``port``. Reads and writes are
+    serialized by one lock, like requests against Grocy's SQLite database.
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict]] | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        today: datetime.date | None = None,
+        unix_socket: str | None = None,
+    ):
+        self.tables = tables if tables is not None else generate_dataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.request_count = 0
+        self.userfields: dict[tuple[str, int], dict] = {}
+        self._today = today or datetime.date.today()
+        self._lock = threading.RLock()
+        self._views: dict = {}
+        self._changed_time = datetime.datetime.now().replace(microsecond=0)
+        self._rng = random.Random(0)
+        self._unix_socket = unix_socket
+        if unix_socket:
+            self._server = _UnixHTTPServer(unix_socket, _UnixHandler)
+        else:
+            self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.standin = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._unix_socket:
+            return "http://localhost"
+        return f"http://{self._server.server_address[0]}"
+
+    @property
+    def port(self) -> int:
+        if self._unix_socket:
+            return 80
+        return self._server.server_address[1]
+
+    @property
+    def unix_socket(self) -> str | None:
+        return self._unix_socket
+
+    @property
+    def db_changed_time(self) -> str:
+        return timestamp(self._changed_time)
+
+    def start(self) -> "GrocyStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+        self._server.server_close()
+        if self._unix_socket:
+            os.unlink(self._unix_socket)
+
+    def __enter__(self) -> "GrocyStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Request dispatch
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self._rng.uniform(0, self.jitter))
+
+    def transport(self) -> InProcessTransport:
+        """A transport answering requests directly, without a socket."""
+        return InProcessTransport(self.handle_request)
+
+    def handle_request(
+        self, method: str, url: str, headers, content: bytes | None
+    ) -> tuple[int, bytes]:
+        """``handle`` for an encoded request body, JSON bodies are decoded."""
+        body = None
+        if content and "json" in headers.get("Content-Type", ""):
+            body = json.loads(content)
+        return self.handle(method, url, body or {})
+
+    def handle(self, method: str, url: str, body: dict) -> tuple[int, bytes]:
+        """Answer one API request with a status and the encoded JSON body.
+
+        GET responses are kept until the next write, so large lists are only
+        encoded once.
+        """
+        with self._lock:
+            self.request_count += 1
+            key = ("response", url)
+            if method == "GET" and key in self._views:
+                return self._views[key]
+            split = urlsplit(url)
+            parts = [unquote(part) for part in split.path.strip("/").split("/")]
+            if parts[:1] == ["api"]:
+                parts = parts[1:]
+            try:
+                handler, args = _route(method, parts)
+                result = handler(
+                    self, parse_qs(split.query, keep_blank_values=True), body, *args
+                )
+            except GrocyApiError as error:
+                return error.status, json.dumps({"error_message": str(error)}).encode()
+            if method != "GET":
+                self._changed()
+            if result is None:
+                return 204, b""
+            response = 200, json.dumps(result).encode()
+            if method == "GET" and parts != ["system", "time"]:
+                self._views[key] = response
+            return response
+
+    def _changed(self):
+        # Grocy reports whole seconds; keep the time moving on every write.
+        self._views.clear()
+        now = datetime.datetime.now().replace(microsecond=0)
+        self._changed_time = max(
+            now, self._changed_time + datetime.timedelta(seconds=1)
+        )
+
+    def _view(self, name: str, build):
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+
+    # Lookups
+
+    def _table(self, entity: str) -> list[dict]:
+        if entity not in self.tables:
+            raise GrocyApiError(400, f"Entity {entity} does not exist")
+        return self.tables[entity]
+
+    def _by_id(self, entity: str) -> dict[int, dict]:
+        return self._view(
+            ("by_id", entity), lambda: {row["id"]: row for row in self._table(entity)}
+        )
+
+    def _row(self, entity: str, object_id) -> dict:
+        row = self._by_id(entity).get(int(object_id))
+        if row is None:
+            raise GrocyApiError(400, f"No {entity} with id {object_id} found")
+        return row
+
+    def _next_id(self, entity: str) -> int:
+        return max(self._by_id(entity), default=0) + 1
+
+    def _product_id_for_barcode(self, barcode: str) -> int:
+        barcodes = self._view(
+            "barcodes",
+            lambda: {
+                row["barcode"]: row["product_id"]
+                for row in self.tables["product_barcodes"]
+            },
+        )
+        if barcode not in barcodes:
+            raise GrocyApiError(400, f"No product with barcode {barcode} found")
+        return barcodes[barcode]
+
+    def _stock_entries(self) -> dict[int, list[dict]]:
+        def build():
+            entries = {}
+            for row in self.tables["stock"]:
+                entries.setdefault(row["product_id"], []).append(row)
+            for rows in entries.values():
+                rows.sort(key=lambda row: row["best_before_date"])
+            return entries
+
+        return self._view("stock_entries", build)
+
+    def _now(self) -> str:
+        return timestamp(datetime.datetime.now())
+
+    # Stock
+
+    def _current_stock(self) -> list[dict]:
+        def build():
+            products = self._by_id("products")
+            stock = []
+            for product_id, entries in sorted(self._stock_entries().items()):
+                amount = sum(row["amount"] for row in entries)
+                if amount <= 0:
+                    continue
+                opened = sum(row["amount"] for row in entries if row["open"])
+                stock.append(
+                    {
+                        "product_id": product_id,
+                        "amount": amount,
+                        "amount_aggregated": amount,
+                        "amount_opened": opened,
+                        "amount_opened_aggregated": opened,
+                        "best_before_date": entries[0]["best_before_date"],
+                        "is_aggregated_amount": 0,
+                        "due_type": products[product_id]["due_type"],
+                        "product": products[product_id],
+                    }
+                )
+            return stock
+
+        return self._view("stock", build)
+
+    def get_stock(self, params, body):
+        return self._current_stock()
+
+    def get_volatile_stock(self, params, body):
+        days = int(params.get("due_soon_days", [DEFAULT_DUE_SOON_DAYS])[0])
+        today = str(self._today)
+        due_limit = str(self._today + datetime.timedelta(days=days))
+        result = {
+            "due_products": [],
+            "overdue_products": [],
+            "expired_products": [],
+            "missing_products": [],
+        }
+        amounts = {}
+        for entry in self._current_stock():
+            amounts[entry["product_id"]] = entry["amount"]
+            best_before = entry["best_before_date"]
+            if best_before < today:
+                key = "expired" if entry["due_type"] == 2 else "overdue"
+                result[f"{key}_products"].append(entry)
+            elif best_before <= due_limit:
+                result["due_products"].append(entry)
+        for product in self.tables["products"]:
+            amount = amounts.get(product["id"], 0)
+            if amount < product["min_stock_amount"]:
+                result["missing_products"].append(
+                    {
+                        "id": product["id"],
+                        "name": product["name"],
+                        "amount_missing": product["min_stock_amount"] - amount,
+                        "is_partly_in_stock": int(amount > 0),
+                    }
+                )
+        return result
+
+    def get_product_details(self, params, body, product_id):
+        product = self._row("products", product_id)
+        entries = self._stock_entries().get(product["id"], [])
+        quantity_units = self._by_id("quantity_units")
+        return {
+            "product": product,
+            "product_barcodes": [
+                row
+                for row in self.tables["product_barcodes"]
+                if row["product_id"] == product["id"]
+            ],
+            "quantity_unit_stock": quantity_units[product["qu_id_stock"]],
+            "default_quantity_unit_purchase": quantity_units[product["qu_id_purchase"]],
+            "location": self._by_id("locations").get(product["location_id"]),
+            "stock_amount": sum(row["amount"] for row in entries),
+            "stock_amount_opened": sum(row["amount"] for row in entries if row["open"]),
+            "next_best_before_date": (
+                entries[0]["best_before_date"] if entries else None
+            ),
+            "last_purchased": None,
+            "last_used": None,
+            "last_price": entries[-1]["price"] if entries else None,
+        }
+
+    def get_product_by_barcode(self, params, body, barcode):
+        return self.get_product_details(
+            params, body, self._product_id_for_barcode(barcode)
+        )
+
+    def _log(self, product_id: int, amount: float, transaction_type: str, entry: dict):
+        row = {
+            "id": self._next_id("stock_log"),
+            "product_id": product_id,
+            "amount": amount,
+            "best_before_date": entry["best_before_date"],
+            "purchased_date": entry["purchased_date"],
+            "used_date": str(self._today),
+            "spoiled": 0,
+            "stock_id": entry["stock_id"],
+            "transaction_type": transaction_type,
+            "price": entry["price"],
+            "undone": 0,
+            "undone_timestamp": None,
+            "opened_date": None,
+            "row_created_timestamp": self._now(),
+            "location_id": entry["location_id"],
+            "recipe_id": None,
+            "correlation_id": None,
+            "transaction_id": f"{self._rng.getrandbits(48):012x}",
+            "stock_row_id": entry["id"],
+            "shopping_location_id": None,
+            "user_id": 1,
+        }
+        self.tables["stock_log"].append(row)
+        self._by_id("stock_log")[row["id"]] = row
+        return row
+
+    def _add(self, product_id: int, body: dict, transaction_type: str) -> list[dict]:
+        product = self._row("products", product_id)
+        best_before = body.get("best_before_date") or str(
+            self._today + datetime.timedelta(product["default_best_before_days"])
+        )
+        entry = {
+            "id": self._next_id("stock"),
+            "product_id": product["id"],
+            "amount": float(body["amount"]),
+            "best_before_date": best_before,
+            "purchased_date": str(self._today),
+            "stock_id": f"{self._rng.getrandbits(48):012x}",
+            "price": body.get("price"),
+            "open": 0,
+            "opened_date": None,
+            "location_id": body.get("location_id") or product["location_id"],
+            "shopping_location_id": body.get("shopping_location_id"),
+            "row_created_timestamp": self._now(),
+        }
+        self.tables["stock"].append(entry)
+        self._views.clear()
+        return [self._log(product["id"], entry["amount"], transaction_type, entry)]
+
+    def _consume(
+        self, product_id: int, amount: float, transaction_type: str
+    ) -> list[dict]:
+        product = self._row("products", product_id)
+        entries = self._stock_entries().get(product["id"], [])
+        if amount > sum(row["amount"] for row in entries):
+            raise GrocyApiError(
+                400, "Amount to be consumed cannot be > current stock amount"
+            )
+        logs = []
+        for entry in list(entries):
+            taken = min(amount, entry["amount"])
+            entry["amount"] -= taken
+            amount -= taken
+            logs.append(self._log(product["id"], -taken, transaction_type, entry))
+            if entry["amount"] <= 0:
+                self.tables["stock"].remove(entry)
+            if amount <= 0:
+                break
+        self._views.clear()
+        return logs
+
+    def add_product(self, params, body, product_id):
+        return self._add(
+            int(product_id), body, body.get("transaction_type", "purchase")
+        )
+
+    def consume_product(self, params, body, product_id):
+        return self._consume(
+            int(product_id),
+            float(body.get("amount", 1)),
+            body.get("transaction_type", "consume"),
+        )
+
+    def open_product(self, params, body, product_id):
+        amount = float(body.get("amount", 1))
+        logs = []
+        for entry in self._stock_entries().get(int(product_id), []):
+            if amount <= 0:
+                break
+            if not entry["open"]:
+                entry["open"] = 1
+                entry["opened_date"] = str(self._today)
+                amount -= entry["amount"]
+                logs.append(self._log(entry["product_id"], 0, "product-opened", entry))
+        self._views.clear()
+        return logs
+
+    def inventory_product(self, params, body, product_id):
+        product_id = int(product_id)
+        current = sum(
+            row["amount"] for row in self._stock_entries().get(product_id, [])
+        )
+        difference = float(body["new_amount"]) - current
+        if difference > 0:
+            return self._add(
+                product_id, {**body, "amount": difference}, "inventory-correction"
+            )
+        if difference < 0:
+            return self._consume(product_id, -difference, "inventory-correction")
+        return []
+
+    def add_product_by_barcode(self, params, body, barcode):
+        return self.add_product(params, body, self._product_id_for_barcode(barcode))
+
+    def consume_product_by_barcode(self, params, body, barcode):
+        return self.consume_product(params, body, self._product_id_for_barcode(barcode))
+
+    def open_product_by_barcode(self, params, body, barcode):
+        return self.open_product(params, body, self._product_id_for_barcode(barcode))
+
+    def inventory_product_by_barcode(self, params, body, barcode):
+        return self.inventory_product(
+            params, body, self._product_id_for_barcode(barcode)
+        )
+
+    # Shopping list
+
+    def add_product_to_shopping_list(self, params, body):
+        row = {
+            "id": self._next_id("shopping_list"),
+            "product_id": body["product_id"],
+            "note": None,
+            "amount": float(body.get("product_amount", 1)),
+            "row_created_timestamp": self._now(),
+            "shopping_list_id": body.get("list_id", 1),
+            "done": 0,
+        }
+        self.tables["shopping_list"].append(row)
+        return None
+
+    def remove_product_from_shopping_list(self, params, body):
+        list_id = body.get("list_id", 1)
+        amount = float(body.get("product_amount", 1))
+        for row in list(self.tables["shopping_list"]):
+            if row["product_id"] == body["product_id"] and (
+                row["shopping_list_id"] == list_id
+            ):
+                row["amount"] -= amount
+                if row["amount"] <= 0:
+                    self.tables["shopping_list"].remove(row)
+                break
+        return None
+
+    def clear_shopping_list(self, params, body):
+        list_id = (body or {}).get("list_id", 1)
+        self.tables["shopping_list"] = [
+            row
+            for row in self.tables["shopping_list"]
+            if row["shopping_list_id"] != list_id
+        ]
+        return None
+
+    def add_missing_products(self, params, body):
+        list_id = (body or {}).get("list_id", 1)
+        for product in self.get_volatile_stock({}, None)["missing_products"]:
+            self.add_product_to_shopping_list(
+                params,
+                {
+                    "product_id": product["id"],
+                    "list_id": list_id,
+                    "product_amount": product["amount_missing"],
+                },
+            )
+        return None
+
+    def consume_recipe(self, params, body, recipe_id):
+        self._row("recipes", recipe_id)
+        return None
+
+    # Chores
+
+    def _chore_state(self, chore: dict) -> tuple:
+        def build():
+            log = {}
+            for row in self.tables["chores_log"]:
+                if not row["undone"]:
+                    log.setdefault(row["chore_id"], []).append(row)
+            for rows in log.values():
+                rows.sort(key=lambda row: row["tracked_time"])
+            return log
+
+        executions = self._view("chores_log", build).get(chore["id"], [])
+        last = executions[-1] if executions else None
+        next_time = None
+        period_days = _PERIOD_DAYS.get(chore["period_type"])
+        if period_days:
+            base = (
+                datetime.datetime.fromisoformat(last["tracked_time"])
+                if last
+                else datetime.datetime.combine(self._today, datetime.time())
+            )
+            next_time = timestamp(base + datetime.timedelta(days=period_days))
+        return last, next_time, len(executions)
+
+    def get_chores(self, params, body):
+        chores = []
+        for chore in self.tables["chores"]:
+            last, next_time, _ = self._chore_state(chore)
+            chores.append(
+                {
+                    "id": chore["id"],
+                    "chore_id": chore["id"],
+                    "chore_name": chore["name"],
+                    "last_tracked_time": last["tracked_time"] if last else None,
+                    "next_estimated_execution_time": next_time,
+                    "track_date_only": chore["track_date_only"],
+                    "next_execution_assigned_to_user_id": chore[
+                        "next_execution_assigned_to_user_id"
+                    ],
+                    "is_rescheduled": 0,
+                    "is_reassigned": 0,
+                }
+            )
+        return apply_query(chores, params)
+
+    def get_chore(self, params, body, chore_id):
+        chore = self._row("chores", chore_id)
+        last, next_time, count = self._chore_state(chore)
+        users = self._by_id("users")
+        return {
+            "chore": chore,
+            "last_tracked": last["tracked_time"] if last else None,
+            "next_estimated_execution_time": next_time,
+            "track_count": count,
+            "last_done_by": users.get(last["done_by_user_id"]) if last else None,
+            "next_execution_assigned_user": users.get(
+                chore["next_execution_assigned_to_user_id"]
+            ),
+        }
+
+    def execute_chore(self, params, body, chore_id):
+        chore = self._row("chores", chore_id)
+        row = {
+            "id": self._next_id("chores_log"),
+            "chore_id": chore["id"],
+            "tracked_time": body.get("tracked_time") or self._now(),
+            "done_by_user_id": body.get("done_by", 1),
+            "row_created_timestamp": self._now(),
+            "undone": 0,
+            "undone_timestamp": None,
+            "skipped": int(bool(body.get("skipped"))),
+        }
+        self.tables["chores_log"].append(row)
+        return row
+
+    # Batteries
+
+    def _battery_state(self, battery: dict) -> tuple:
+        cycles = sorted(
+            row["tracked_time"]
+            for row in self.tables["battery_charge_cycles"]
+            if row["battery_id"] == battery["id"] and not row["undone"]
+        )
+        last = cycles[-1] if cycles else None
+        next_time = None
+        if last and battery["charge_interval_days"]:
+            interval = datetime.timedelta(days=battery["charge_interval_days"])
+            next_time = timestamp(datetime.datetime.fromisoformat(last) + interval)
+        return last, next_time, len(cycles)
+
+    def get_batteries(self, params, body):
+        batteries = []
+        for battery in self.tables["batteries"]:
+            last, next_time, _ = self._battery_state(battery)
+            batteries.append(
+                {
+                    "id": battery["id"],
+                    "battery_id": battery["id"],
+                    "last_tracked_time": last,
+                    "next_estimated_charge_time": next_time,
+                }
+            )
+        return apply_query(batteries, params)
+
+    def get_battery(self, params, body, battery_id):
+        battery = self._row("batteries", battery_id)
+        last, next_time, count = self._battery_state(battery)
+        return {
+            "battery": battery,
+            "charge_cycles_count": count,
+            "last_charged": last,
+            "last_tracked_time": last,
+            "next_estimated_charge_time": next_time,
+        }
+
+    def charge_battery(self, params, body, battery_id):
+        battery = self._row("batteries", battery_id)
+        row = {
+            "id": self._next_id("battery_charge_cycles"),
+            "battery_id": battery["id"],
+            "tracked_time": body.get("tracked_time") or self._now(),
+            "row_created_timestamp": self._now(),
+            "undone": 0,
+            "undone_timestamp": None,
+        }
+        self.tables["battery_charge_cycles"].append(row)
+        return row
+
+    # Tasks, users and userfields
+
+    def get_tasks(self, params, body):
+        categories = self._by_id("task_categories")
+        users = self._by_id("users")
+        tasks = [
+            {
+                **task,
+                "category": categories.get(task["category_id"]),
+                "assigned_to_user": users.get(task["assigned_to_user_id"]),
+            }
+            for task in self.tables["tasks"]
+            if not task["done"]
+        ]
+        return apply_query(tasks, params)
+
+    def complete_task(self, params, body, task_id):
+        task = self._row("tasks", task_id)
+        task["done"] = 1
+        task["done_timestamp"] = body.get("done_time") or self._now()
+        return None
+
+    def get_users(self, params, body):
+        return apply_query(self.tables["users"], params)
+
+    def get_userfields(self, params, body, entity, object_id):
+        return self.userfields.get((entity, int(object_id)), {})
+
+    def set_userfields(self, params, body, entity, object_id):
+        self.userfields.setdefault((entity, int(object_id)), {}).update(body)
+        return None
+
+    def put_file(self, params, body, group, name):
+        return None
+
+    # Generic objects
+
+    def get_objects(self, params, body, entity):
+        return apply_query(self._table(entity), params)
+
+    def get_object(self, params, body, entity, object_id):
+        self._table(entity)
+        return self._by_id(entity).get(int(object_id))
+
+    def add_object(self, params, body, entity):
+        table = self._table(entity)
+        row = {**body, "id": self._next_id(entity)}
+        row.setdefault("row_created_timestamp", self._now())
+        table.append(row)
+        return {"created_object_id": row["id"]}
+
+    def update_object(self, params, body, entity, object_id):
+        self._row(entity, object_id).update(body)
+        return None
+
+    def delete_object(self, params, body, entity, object_id):
+        row = self._row(entity, object_id)
+        self._table(entity).remove(row)
+        return None
+
+    # System
+
+    def get_system_info(self, params, body):
+        return {
+            "grocy_version": {"Version": GROCY_VERSION, "ReleaseDate": "2024-03-01"},
+            "php_version": "8.2.0",
+            "sqlite_version": "3.44.0",
+            "os": "Linux",
+            "client": "grocy stand-in",
+        }
+
+    def get_system_time(self, params, body):
+        now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        return {
+            "timezone": "UTC",
+            "time_local": timestamp(now),
+            "time_local_sqlite3": timestamp(now),
+            "time_utc": timestamp(now),
+            "timestamp": int(now.timestamp()),
+        }
+
+    def get_system_config(self, params, body):
+        return {
+            "USER_USERNAME": "admin",
+            "BASE_PATH": "",
+            "BASE_URL": "/",
+            "MODE": "production",
+            "DEFAULT_LOCALE": "en",
+            "LOCALE": "en",
+            "CURRENCY": "EUR",
+            "FEATURE_FLAG_STOCK": True,
+            "FEATURE_FLAG_SHOPPINGLIST": True,
+            "FEATURE_FLAG_RECIPES": True,
+            "FEATURE_FLAG_CHORES": True,
+            "FEATURE_FLAG_TASKS": True,
+            "FEATURE_FLAG_BATTERIES": True,
+        }
+
+    def get_db_changed_time(self, params, body):
+        return {"changed_time": self.db_changed_time}
+
+
+_ROUTES = [
+    ("GET", ("stock",), GrocyStandIn.get_stock),
+    ("GET", ("stock", "volatile"), GrocyStandIn.get_volatile_stock),
+    (
+        "GET",
+        ("stock", "products", "by-barcode", "*"),
+        GrocyStandIn.get_product_by_barcode,
+    ),
+    ("GET", ("stock", "products", "*"), GrocyStandIn.get_product_details),
+    (
+        "POST",
+        ("stock", "products", "by-barcode", "*", "add"),
+        GrocyStandIn.add_product_by_barcode,
+    ),
+    (
+        "POST",
+        ("stock", "products", "by-barcode", "*", "consume"),
+        GrocyStandIn.consume_product_by_barcode,
+    ),
+    (
+        "POST",
+        ("stock", "products", "by-barcode", "*", "open"),
+        GrocyStandIn.open_product_by_barcode,
+    ),
+    (
+        "POST",
+        ("stock", "products", "by-barcode", "*", "inventory"),
+        GrocyStandIn.inventory_product_by_barcode,
+    ),
+    ("POST", ("stock", "products", "*", "add"), GrocyStandIn.add_product),
+    ("POST", ("stock", "products", "*", "consume"), GrocyStandIn.consume_product),
+    ("POST", ("stock", "products", "*", "open"), GrocyStandIn.open_product),
+    ("POST", ("stock", "products", "*", "inventory"), GrocyStandIn.inventory_product),
+    (
+        "POST",
+        ("stock", "shoppinglist", "add-product"),
+        GrocyStandIn.add_product_to_shopping_list,
+    ),
+    (
+        "POST",
+        ("stock", "shoppinglist", "remove-product"),
+        GrocyStandIn.remove_product_from_shopping_list,
+    ),
+    ("POST", ("stock", "shoppinglist", "clear"), GrocyStandIn.clear_shopping_list),
+    (
+        "POST",
+        ("stock", "shoppinglist", "add-missing-products"),
+        GrocyStandIn.add_missing_products,
+    ),
+    ("POST", ("recipes", "*", "consume"), GrocyStandIn.consume_recipe),
+    ("GET", ("chores",), GrocyStandIn.get_chores),
+    ("GET", ("chores", "*"), GrocyStandIn.get_chore),
+    ("POST", ("chores", "*", "execute"), GrocyStandIn.execute_chore),
+    ("GET", ("batteries",), GrocyStandIn.get_batteries),
+    ("GET", ("batteries", "*"), GrocyStandIn.get_battery),
+    ("POST", ("batteries", "*", "charge"), GrocyStandIn.charge_battery),
+    ("GET", ("tasks",), GrocyStandIn.get_tasks),
+    ("POST", ("tasks", "*", "complete"), GrocyStandIn.complete_task),
+    ("GET", ("users",), GrocyStandIn.get_users),
+    ("GET", ("userfields", "*", "*"), GrocyStandIn.get_userfields),
+    ("PUT", ("userfields", "*", "*"), GrocyStandIn.set_userfields),
+    ("PUT", ("files", "*", "*"), GrocyStandIn.put_file),
+    ("GET", ("objects", "*"), GrocyStandIn.get_objects),
+    ("GET", ("objects", "*", "*"), GrocyStandIn.get_object),
+    ("POST", ("objects", "*"), GrocyStandIn.add_object),
+    ("PUT", ("objects", "*", "*"), GrocyStandIn.update_object),
+    ("DELETE", ("objects", "*", "*"), GrocyStandIn.delete_object),
+    ("GET", ("system", "info"), GrocyStandIn.get_system_info),
+    ("GET", ("system", "time"), GrocyStandIn.get_system_time),
+    ("GET", ("system", "config"), GrocyStandIn.get_system_config),
+    ("GET", ("system", "db-changed-time"), GrocyStandIn.get_db_changed_time),
+]
+
+
+def _route(method: str, parts: list[str]) -> tuple:
+    for route_method, pattern, handler in _ROUTES:
+        if route_method != method or len(pattern) != len(parts):
+            continue
+        args = []
+        for expected, part in zip(pattern, parts):
+            if expected == "*":
+                args.append(part)
+            elif expected != part:
+                break
+        else:
+            return handler, args
+    raise GrocyApiError(404, f"No route for {method} /{'/'.join(parts)}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _dispatch(self, method: str):
+        standin = self.server.standin
+        length = int(self.headers.get("Content-Length") or 0)
+        content = self.rfile.read(length) if length else None
+        standin.delay()
+        status, content = standin.handle_request(
+            method, self.path, self.headers, content
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self):  # noqa: N802
+        self._dispatch("POST")
+
+    def do_PUT(self):  # noqa: N802
+        self._dispatch("PUT")
+
+    def do_DELETE(self):  # noqa: N802
+        self._dispatch("DELETE")
+
+    def log_message(self, *args):
+        pass
+
+
+class _UnixHandler(_Handler):
+    # TCP_NODELAY does not exist for Unix domain sockets.
+    disable_nagle_algorithm = False
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9192)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--unix-socket", help="listen on this socket path instead")
+    args = parser.parse_args()
+
+    standin = GrocyStandIn(
+        generate_dataset(args.preset, args.seed),
+        latency=args.latency,
+        jitter=args.jitter,
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+    )
+    address = args.unix_socket or f"{standin.url}:{standin.port}/api/"
+    print(f"Serving the {args.preset} dataset on {address}", flush=True)
+    try:
+        standin.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
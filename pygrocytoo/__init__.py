@@ -1,3 +1,43 @@
 """The pygrocytoo module."""
 
+import importlib
+
 name = "pygrocytoo"
+
+# Public names and the submodule defining them, imported on first access so
+# ``import pygrocytoo`` does not load requests, httpx or pydantic.
+_LAZY_EXPORTS = {
+    "AsyncGrocy": "async_grocy",
+    "AsyncGrocyApiClient": "async_grocy_api_client",
+    "BarcodeCache": "cache",
+    "EntityType": "data_models.generic",
+    "Grocy": "grocy",
+    "GrocyApiClient": "grocy_api_client",
+    "GrocyDetailsError": "errors",
+    "GrocyError": "errors",
+    "HttpTransport": "transport",
+    "InProcessTransport": "transport",
+    "PersistentResponseCache": "cache",
+    "ProductCatalog": "catalog",
+    "RecordingTransport": "replay",
+    "ReplayTransport": "replay",
+    "ResponseCache": "cache",
+    "StockTable": "stock_table",
+    "Transport": "transport",
+    "UnixSocketTransport": "transport",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(attribute: str):
+    module_name = _LAZY_EXPORTS.get(attribute)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attribute!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attribute)
+    globals()[attribute] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -0,0 +1,583 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+import logging
+
+from .async_grocy_api_client import DEFAULT_MAX_CONNECTIONS, AsyncGrocyApiClient
+from .cache import BarcodeCache
+from .catalog import ProductCatalog
+from .data_models.battery import Battery
+from .data_models.chore import Chore
+from .data_models.generic import EntityType
+from .data_models.meal_items import MealPlanItem, MealPlanSection, RecipeItem
+from .data_models.product import Group, Product, ShoppingListProduct, VolatileStock
+from .data_models.system import SystemConfig, SystemInfo, SystemTime
+from .data_models.task import Task
+from .data_models.user import User
+from .errors import GrocyDetailsError, GrocyError
+from .grocy_api_client import DEFAULT_PORT_NUMBER, ObjectsById, TransactionType
+from .loader import DetailsLoader
+from .stock_table import StockTable
+
+DEFAULT_MAX_CONCURRENCY = DEFAULT_MAX_CONNECTIONS
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+
+
+class AsyncGrocy(object):
+    """Asyncio twin of ``Grocy``.
+
+    ``get_details`` lookups of list methods run concurrently, at most
+    ``max_concurrency`` at a time.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        api_key,
+        port: int = DEFAULT_PORT_NUMBER,
+        path: str | None = None,
+        verify_ssl=True,
+        debug=False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport=None,
+        coalesce_requests: bool = True,
+        barcode_cache: BarcodeCache | None = None,
+    ):
+        self._api_client = AsyncGrocyApiClient(
+            base_url,
+            api_key,
+            port,
+            path,
+            verify_ssl,
+            debug,
+            max_connections=max_connections,
+            transport=transport,
+            coalesce_requests=coalesce_requests,
+            barcode_cache=barcode_cache,
+        )
+        self._max_concurrency = max_concurrency
+        self._product_catalog: ProductCatalog | None = None
+
+        if debug:
+            _LOGGER.setLevel(logging.DEBUG)
+
+    async def close(self):
+        await self._api_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _load_details(self, items: list):
+        """Fetch the objects referenced by ``items`` in one request per type."""
+        loader = DetailsLoader()
+        loader.request_all(items)
+        await loader.async_load(self._api_client)
+        for item in items:
+            item.apply_details(loader)
+
+    async def _get_details(self, items: list):
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        errors = []
+
+        async def get_item_details(index, item):
+            async with semaphore:
+                try:
+                    await item.async_get_details(self._api_client)
+                except GrocyError as error:
+                    errors.append((index, error))
+
+        await asyncio.gather(
+            *(get_item_details(index, item) for index, item in enumerate(items))
+        )
+
+        if errors:
+            errors.sort(key=lambda error: error[0])
+            raise GrocyDetailsError(items, errors)
+
+    async def stock(self) -> list[Product]:
+        raw_stock = await self._api_client.get_stock()
+        return [Product(resp) for resp in raw_stock]
+
+    async def stock_table(self, use_numpy: bool | None = None) -> StockTable:
+        content = await self._api_client.get_stock_content()
+        return StockTable.from_json(content, use_numpy)
+
+    async def iter_stock(self) -> AsyncIterator[Product]:
+        """Like ``stock`` but parses the response while it is downloaded."""
+        async for resp in self._api_client.iter_stock():
+            yield Product(resp)
+
+    async def volatile_stock(
+        self, get_details: bool = False, *, due_soon_days: int | None = None
+    ) -> VolatileStock:
+        """Due, overdue, expired and missing products from a single request."""
+        volatile_stock = VolatileStock(
+            await self._api_client.get_volatile_stock(due_soon_days)
+        )
+
+        if get_details:
+            await self._get_details(volatile_stock.all_products)
+        return volatile_stock
+
+    async def due_products(
+        self, get_details: bool = False, *, due_soon_days: int | None = None
+    ) -> list[Product]:
+        raw_due_products = (
+            await self._api_client.get_volatile_stock(due_soon_days)
+        ).due_products
+        due_products = [Product(resp) for resp in raw_due_products]
+
+        if get_details:
+            await self._get_details(due_products)
+        return due_products
+
+    async def overdue_products(self, get_details: bool = False) -> list[Product]:
+        raw_overdue_products = (
+            await self._api_client.get_volatile_stock()
+        ).overdue_products
+        overdue_products = [Product(resp) for resp in raw_overdue_products]
+
+        if get_details:
+            await self._get_details(overdue_products)
+        return overdue_products
+
+    async def expired_products(self, get_details: bool = False) -> list[Product]:
+        raw_expired_products = (
+            await self._api_client.get_volatile_stock()
+        ).expired_products
+        expired_products = [Product(resp) for resp in raw_expired_products]
+
+        if get_details:
+            await self._get_details(expired_products)
+        return expired_products
+
+    async def missing_products(self, get_details: bool = False) -> list[Product]:
+        raw_missing_products = (
+            await self._api_client.get_volatile_stock()
+        ).missing_products
+        missing_products = [Product(resp) for resp in raw_missing_products]
+
+        if get_details:
+            await self._get_details(missing_products)
+        return missing_products
+
+    async def product(self, product_id: int) -> Product:
+        resp = await self._api_client.get_product(product_id)
+        if resp:
+            return Product(resp)
+        return None
+
+    async def product_by_barcode(self, barcode: str) -> Product:
+        resp = await self._api_client.get_product_by_barcode(barcode)
+        if resp:
+            return Product(resp)
+        return None
+
+    async def all_products(self) -> list[Product]:
+        return [Product(product) for product in await self._api_client.get_products()]
+
+    async def iter_all_products(self) -> AsyncIterator[Product]:
+        async for product in self._api_client.iter_products():
+            yield Product(product)
+
+    async def product_catalog(self) -> ProductCatalog:
+        """The shared ``ProductCatalog``, loaded or refreshed if the db changed."""
+        if self._product_catalog is None:
+            self._product_catalog = ProductCatalog(self._api_client)
+        await self._product_catalog.async_refresh()
+        return self._product_catalog
+
+    async def chores(
+        self, get_details: bool = False, query_filters: list[str] | None = None
+    ) -> list[Chore]:
+        raw_chores = await self._api_client.get_chores(query_filters)
+        chores = [Chore(chore) for chore in raw_chores]
+
+        if get_details:
+            await self._get_details(chores)
+        return chores
+
+    async def execute_chore(
+        self,
+        chore_id: int,
+        done_by: int = None,
+        tracked_time: datetime = None,
+        skipped: bool = False,
+    ):
+        return await self._api_client.execute_chore(
+            chore_id, done_by, tracked_time, skipped
+        )
+
+    async def chore(self, chore_id: int) -> Chore:
+        resp = await self._api_client.get_chore(chore_id)
+        return Chore(resp)
+
+    async def add_product(
+        self,
+        product_id,
+        amount: float,
+        price: float,
+        best_before_date: datetime | None = None,
+        transaction_type: TransactionType = TransactionType.PURCHASE,
+    ):
+        return await self._api_client.add_product(
+            product_id, amount, price, best_before_date, transaction_type
+        )
+
+    async def consume_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        spoiled: bool = False,
+        transaction_type: TransactionType = TransactionType.CONSUME,
+        allow_subproduct_substitution: bool = False,
+    ):
+        return await self._api_client.consume_product(
+            product_id, amount, spoiled, transaction_type, allow_subproduct_substitution
+        )
+
+    async def consume_recipe(
+        self,
+        recipe_id: int,
+    ):
+        return await self._api_client.consume_recipe(recipe_id)
+
+    async def open_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        allow_subproduct_substitution: bool = False,
+    ):
+        return await self._api_client.open_product(
+            product_id, amount, allow_subproduct_substitution
+        )
+
+    async def inventory_product(
+        self,
+        product_id: int,
+        new_amount: float,
+        best_before_date: datetime | None = None,
+        shopping_location_id: int | None = None,
+        location_id: int | None = None,
+        price: float | None = None,
+        get_details: bool = True,
+    ) -> Product:
+        product = Product(
+            await self._api_client.inventory_product(
+                product_id,
+                new_amount,
+                best_before_date,
+                shopping_location_id,
+                location_id,
+                price,
+            )
+        )
+
+        if get_details:
+            await product.async_get_details(self._api_client)
+        return product
+
+    async def _barcode_product_details(self, product: Product, barcode: str) -> Product:
+        """Details after a by-barcode write, refilling the barcode cache if set."""
+        if self._api_client.barcode_cache is None:
+            await product.async_get_details(self._api_client)
+            return product
+        product._apply_details(await self._api_client.get_product_by_barcode(barcode))
+        return product
+
+    async def add_product_by_barcode(
+        self,
+        barcode: str,
+        amount: float,
+        price: float,
+        best_before_date: datetime | None = None,
+        get_details: bool = True,
+    ) -> Product:
+        product = Product(
+            await self._api_client.add_product_by_barcode(
+                barcode, amount, price, best_before_date
+            )
+        )
+
+        if get_details:
+            product = await self._barcode_product_details(product, barcode)
+        return product
+
+    async def consume_product_by_barcode(
+        self,
+        barcode: str,
+        amount: float = 1,
+        spoiled: bool = False,
+        get_details: bool = True,
+    ) -> Product:
+        product = Product(
+            await self._api_client.consume_product_by_barcode(barcode, amount, spoiled)
+        )
+
+        if get_details:
+            product = await self._barcode_product_details(product, barcode)
+        return product
+
+    async def inventory_product_by_barcode(
+        self,
+        barcode: str,
+        new_amount: float,
+        best_before_date: datetime | None = None,
+        location_id: int | None = None,
+        price: float | None = None,
+        get_details: bool = True,
+    ) -> Product:
+        product = Product(
+            await self._api_client.inventory_product_by_barcode(
+                barcode, new_amount, best_before_date, location_id, price
+            )
+        )
+
+        if get_details:
+            product = await self._barcode_product_details(product, barcode)
+        return product
+
+    async def shopping_list(
+        self,
+        get_details: bool = False,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ShoppingListProduct]:
+        raw_shoppinglist = await self._api_client.get_shopping_list(
+            query_filters, order, limit, offset
+        )
+        shopping_list = [ShoppingListProduct(resp) for resp in raw_shoppinglist]
+
+        if get_details:
+            await self._get_details(shopping_list)
+        return shopping_list
+
+    async def add_missing_product_to_shopping_list(self, shopping_list_id: int = 1):
+        return await self._api_client.add_missing_product_to_shopping_list(
+            shopping_list_id
+        )
+
+    async def add_product_to_shopping_list(
+        self,
+        product_id: int,
+        shopping_list_id: int | None = None,
+        amount: float | None = None,
+        quantity_unit_id: int | None = None,
+    ):
+        return await self._api_client.add_product_to_shopping_list(
+            product_id, shopping_list_id, amount, quantity_unit_id
+        )
+
+    async def clear_shopping_list(self, shopping_list_id: int = 1):
+        return await self._api_client.clear_shopping_list(shopping_list_id)
+
+    async def remove_product_in_shopping_list(
+        self, product_id: int, shopping_list_id: int = 1, amount: float = 1
+    ):
+        return await self._api_client.remove_product_in_shopping_list(
+            product_id, shopping_list_id, amount
+        )
+
+    async def product_groups(
+        self,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[Group]:
+        raw_groups = await self._api_client.get_product_groups(
+            query_filters, order, limit, offset
+        )
+        return [Group(resp) for resp in raw_groups]
+
+    async def add_product_pic(self, product_id: int, pic_path: str):
+        await self._api_client.upload_product_picture(product_id, pic_path)
+        return await self._api_client.update_product_pic(product_id)
+
+    async def get_userfields(self, entity: str, object_id: int):
+        return await self._api_client.get_userfields(entity, object_id)
+
+    async def set_userfields(self, entity: str, object_id: int, key: str, value):
+        return await self._api_client.set_userfields(entity, object_id, key, value)
+
+    async def get_last_db_changed(self):
+        return await self._api_client.get_last_db_changed()
+
+    async def get_system_info(self) -> SystemInfo:
+        raw_system_info = await self._api_client.get_system_info()
+        if raw_system_info:
+            return SystemInfo(raw_system_info)
+        return None
+
+    async def get_system_time(self) -> SystemTime:
+        raw_system_time = await self._api_client.get_system_time()
+        if raw_system_time:
+            return SystemTime(raw_system_time)
+        return None
+
+    async def get_system_config(self) -> SystemConfig:
+        raw_system_config = await self._api_client.get_system_config()
+        if raw_system_config:
+            return SystemConfig(raw_system_config)
+        return None
+
+    async def tasks(self, query_filters: list[str] | None = None) -> list[Task]:
+        raw_tasks = await self._api_client.get_tasks(query_filters)
+        return [Task(task) for task in raw_tasks]
+
+    async def task(self, task_id: int) -> Task:
+        resp = await self._api_client.get_task(task_id)
+        return Task(resp)
+
+    async def complete_task(self, task_id, done_time: datetime | None = None):
+        return await self._api_client.complete_task(task_id, done_time)
+
+    async def meal_plan(
+        self,
+        get_details: bool = False,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[MealPlanItem]:
+        """The meal plan, with recipes and sections when ``get_details`` is set.
+
+        Details are fetched with one bulk request per entity type.
+        """
+        raw_meal_plan = await self._api_client.get_meal_plan(
+            query_filters, order, limit, offset
+        )
+        meal_plan = [MealPlanItem(data) for data in raw_meal_plan]
+
+        if get_details:
+            await self._load_details(meal_plan)
+        return meal_plan
+
+    async def recipe(self, recipe_id: int) -> RecipeItem:
+        recipe = await self._api_client.get_recipe(recipe_id)
+        if recipe:
+            return RecipeItem(recipe)
+        return None
+
+    async def batteries(
+        self, query_filters: list[str] | None = None, get_details: bool = False
+    ) -> list[Battery]:
+        raw_batteries = await self._api_client.get_batteries(query_filters)
+        batteries = [Battery(bat) for bat in raw_batteries]
+
+        if get_details:
+            await self._get_details(batteries)
+        return batteries
+
+    async def battery(self, battery_id: int) -> Battery:
+        battery = await self._api_client.get_battery(battery_id)
+        if battery:
+            return Battery(battery)
+        return None
+
+    async def charge_battery(
+        self, battery_id: int, tracked_time: datetime | None = None
+    ):
+        return await self._api_client.charge_battery(battery_id, tracked_time)
+
+    async def add_generic(self, entity_type: EntityType, data):
+        return await self._api_client.add_generic(entity_type.value, data)
+
+    async def get_generic(self, entity_type: EntityType, object_id: int):
+        return await self._api_client.get_generic(entity_type.value, object_id)
+
+    async def get_generic_many(
+        self, entity_type: EntityType, ids: Iterable[int]
+    ) -> ObjectsById:
+        return await self._api_client.get_generic_many(entity_type.value, ids)
+
+    async def update_generic(
+        self, entity_type: EntityType, object_id: int, updated_data
+    ):
+        return await self._api_client.update_generic(
+            entity_type.value, object_id, updated_data
+        )
+
+    async def delete_generic(self, entity_type: EntityType, object_id: int):
+        return await self._api_client.delete_generic(entity_type.value, object_id)
+
+    async def get_generic_objects_for_type(
+        self,
+        entity_type: EntityType,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ):
+        return await self._api_client.get_generic_objects_for_type(
+            entity_type.value, query_filters, order, limit, offset
+        )
+
+    def iter_generic_object_pages(
+        self,
+        entity_type: EntityType,
+        page_size: int,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of objects, requesting each page only when needed."""
+        return self._api_client.iter_generic_object_pages(
+            entity_type.value, page_size, query_filters, order
+        )
+
+    def iter_generic_objects(
+        self,
+        entity_type: EntityType,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Yield the objects of ``entity_type`` while the response downloads."""
+        return self._api_client.iter_generic_objects(
+            entity_type.value, query_filters, order, limit, offset
+        )
+
+    async def meal_plan_sections(
+        self,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[MealPlanSection]:
+        raw_sections = await self._api_client.get_meal_plan_sections(
+            query_filters, order, limit, offset
+        )
+        return [MealPlanSection(section) for section in raw_sections]
+
+    async def meal_plan_section(self, meal_plan_section_id: int) -> MealPlanSection:
+        section = await self._api_client.get_meal_plan_section(meal_plan_section_id)
+
+        if section:
+            return MealPlanSection(section)
+        return None
+
+    async def users(self) -> list[User]:
+        user_dtos = await self._api_client.get_users()
+        return [User(user) for user in user_dtos]
+
+    async def user(self, user_id: int | None = None) -> User:
+        user = await self._api_client.get_user(user_id=user_id)
+        if user:
+            return User(user)
+        return None
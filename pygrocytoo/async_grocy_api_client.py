@@ -0,0 +1,826 @@
+import asyncio
+import base64
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+import json
+import logging
+from typing import Any
+from urllib.parse import urljoin
+
+import httpx
+from pydantic import BaseModel
+
+from .cache import BarcodeCache
+from .data_models.generic import EntityType
+from .errors import GrocyError
+from .grocy_api_client import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PORT_NUMBER,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    BatteryDetailsResponse,
+    ChoreDetailsResponse,
+    CurrentBatteryResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    CurrentVolatilStockResponse,
+    LocationData,
+    MealPlanResponse,
+    MealPlanSectionResponse,
+    ObjectsById,
+    ProductData,
+    ProductDetailsResponse,
+    RecipeDetailsResponse,
+    ShoppingListItem,
+    StockLogResponse,
+    SystemConfigDto,
+    SystemInfoDto,
+    SystemTimeDto,
+    TaskResponse,
+    TransactionType,
+    UserDto,
+    _build_base_url,
+    _build_headers,
+    _build_params,
+    _id_filters,
+    _objects_by_id,
+    _page_params,
+    _request_key,
+)
+from .parsing import JsonArrayParser, parse_list, parse_model
+from .singleflight import AsyncSingleFlight
+from .utils import grocy_datetime_str, localize_datetime, parse_date
+
+DEFAULT_MAX_CONNECTIONS = DEFAULT_POOL_MAXSIZE
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+
+
+class AsyncGrocyApiClient(object):
+    """Non-blocking twin of ``GrocyApiClient`` built on ``httpx.AsyncClient``.
+
+    Every endpoint method is a coroutine returning the same response models as
+    the synchronous client.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        api_key,
+        port: int = DEFAULT_PORT_NUMBER,
+        path: str | None = None,
+        verify_ssl=True,
+        debug=False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        coalesce_requests: bool = True,
+        barcode_cache: BarcodeCache | None = None,
+    ):
+        if debug:
+            _LOGGER.setLevel(logging.DEBUG)
+
+        self._base_url = _build_base_url(base_url, port, path)
+        _LOGGER.debug(f"generated base url: {self._base_url}")
+
+        self._api_key = api_key
+        self._verify_ssl = verify_ssl
+        self._headers = _build_headers(api_key)
+
+        if max_keepalive_connections is None:
+            max_keepalive_connections = max_connections
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._client = httpx.AsyncClient(
+            verify=verify_ssl, limits=limits, transport=transport
+        )
+        self._barcode_cache = barcode_cache
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+    @property
+    def barcode_cache(self) -> BarcodeCache | None:
+        return self._barcode_cache
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of GET requests answered by an identical in-flight request."""
+        if self._single_flight is None:
+            return 0
+        return self._single_flight.coalesced
+
+    async def close(self):
+        """Close all pooled connections held by this client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _do_get_request(
+        self,
+        end_url: str,
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ):
+        content = await self._get_content(end_url, _build_params(query_filters, params))
+        if len(content) > 0:
+            return json.loads(content)
+        return None
+
+    async def _do_get_list_request(
+        self,
+        end_url: str,
+        model: type[BaseModel],
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list:
+        content = await self._get_content(end_url, _build_params(query_filters, params))
+        return parse_list(model, content)
+
+    async def _do_get_model_request(
+        self,
+        end_url: str,
+        model: type[BaseModel],
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ):
+        content = await self._get_content(end_url, _build_params(query_filters, params))
+        return parse_model(model, content)
+
+    async def _get_content(
+        self, end_url: str, params: dict[str, Any] | None = None
+    ) -> bytes:
+        if self._single_flight is None:
+            return await self._fetch(end_url, params)
+        return await self._single_flight.do(
+            _request_key(end_url, params), lambda: self._fetch(end_url, params)
+        )
+
+    async def _fetch(self, end_url: str, params: dict[str, Any] | None = None) -> bytes:
+        req_url = urljoin(self._base_url, end_url)
+        resp = await self._client.get(req_url, headers=self._headers, params=params)
+
+        _LOGGER.debug("-->\tGET /%s", end_url)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+        return resp.content
+
+    async def _iter_get_request(
+        self,
+        end_url: str,
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator:
+        """Yield the items of a JSON array response while it is downloaded.
+
+        Streamed responses bypass request coalescing.
+        """
+        req_url = urljoin(self._base_url, end_url)
+        async with self._client.stream(
+            "GET",
+            req_url,
+            headers=self._headers,
+            params=_build_params(query_filters, params),
+        ) as resp:
+            _LOGGER.debug("-->\tGET /%s (streamed)", end_url)
+            _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+
+            if resp.status_code >= 400:
+                await resp.aread()
+                raise GrocyError(resp)
+
+            parser = JsonArrayParser()
+            async for chunk in resp.aiter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+
+    def _invalidate_cache(self, end_url: str):
+        if self._single_flight is not None:
+            # GETs issued from now on must not get a response from before.
+            self._single_flight.forget()
+        if self._barcode_cache is not None:
+            self._barcode_cache.invalidate_for_write(end_url)
+
+    def _check_barcode(self, barcode: str):
+        """Raise the cached error of a barcode known to be unknown."""
+        if self._barcode_cache is not None:
+            self._barcode_cache.raise_if_unknown(barcode)
+
+    def _forget_barcode_product(self, stock_log: StockLogResponse | None):
+        """Drop the cached barcodes of the product a by-barcode write changed."""
+        if self._barcode_cache is None:
+            return
+        if stock_log is None:
+            self._barcode_cache.clear()
+        else:
+            self._barcode_cache.invalidate_product(stock_log.product_id)
+
+    async def _do_post_request(self, end_url: str, data: dict):
+        req_url = urljoin(self._base_url, end_url)
+        resp = await self._client.post(req_url, headers=self._headers, json=data)
+
+        _LOGGER.debug("-->\tPOST /%s", end_url)
+        _LOGGER.debug("\t\t%s", data)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+        if len(resp.content) > 0:
+            return resp.json()
+        return None
+
+    async def _do_put_request(self, end_url: str, data):
+        req_url = urljoin(self._base_url, end_url)
+        up_header = self._headers.copy()
+        up_header["accept"] = "*/*"
+        if isinstance(data, dict):
+            up_header["Content-Type"] = "application/json"
+            data = json.dumps(data)
+        else:
+            up_header["Content-Type"] = "application/octet-stream"
+        resp = await self._client.put(req_url, headers=up_header, content=data)
+
+        _LOGGER.debug("-->\tPUT /%s", end_url)
+        _LOGGER.debug("\t\t%s", data)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+
+        if len(resp.content) > 0:
+            return resp.json()
+        return None
+
+    async def _do_delete_request(self, end_url: str):
+        req_url = urljoin(self._base_url, end_url)
+        resp = await self._client.delete(req_url, headers=self._headers)
+
+        _LOGGER.debug("-->\tDELETE /%s", end_url)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+
+        if len(resp.content) > 0:
+            return resp.json()
+        return None
+
+    async def get_stock(self) -> list[CurrentStockResponse]:
+        return await self._do_get_list_request("stock", CurrentStockResponse)
+
+    async def get_stock_content(self) -> bytes:
+        return await self._get_content("stock")
+
+    async def iter_stock(self) -> AsyncIterator[CurrentStockResponse]:
+        async for data in self._iter_get_request("stock"):
+            yield CurrentStockResponse.model_validate(data)
+
+    async def get_volatile_stock(
+        self, due_soon_days: int | None = None
+    ) -> CurrentVolatilStockResponse:
+        params = None
+        if due_soon_days is not None:
+            params = {"due_soon_days": due_soon_days}
+        volatile_stock = await self._do_get_model_request(
+            "stock/volatile", CurrentVolatilStockResponse, params=params
+        )
+        return volatile_stock or CurrentVolatilStockResponse()
+
+    async def get_product(self, product_id) -> ProductDetailsResponse:
+        url = f"stock/products/{product_id}"
+        return await self._do_get_model_request(url, ProductDetailsResponse)
+
+    async def get_product_by_barcode(self, barcode) -> ProductDetailsResponse:
+        url = f"stock/products/by-barcode/{barcode}"
+        if self._barcode_cache is None:
+            return await self._do_get_model_request(url, ProductDetailsResponse)
+
+        details = self._barcode_cache.get(barcode)
+        if details is None:
+            try:
+                details = await self._do_get_model_request(url, ProductDetailsResponse)
+            except GrocyError as error:
+                self._barcode_cache.set_unknown(barcode, error)
+                raise
+            self._barcode_cache.set(barcode, details)
+        return details
+
+    async def get_chores(
+        self, query_filters: list[str] | None = None
+    ) -> list[CurrentChoreResponse]:
+        return await self._do_get_list_request(
+            "chores", CurrentChoreResponse, query_filters
+        )
+
+    async def get_chore(self, chore_id: int) -> ChoreDetailsResponse:
+        url = f"chores/{chore_id}"
+        return await self._do_get_model_request(url, ChoreDetailsResponse)
+
+    async def execute_chore(
+        self,
+        chore_id: int,
+        done_by: int | None = None,
+        tracked_time: datetime | None = None,
+        skipped: bool = False,
+    ):
+        if tracked_time is None:
+            tracked_time = datetime.now()
+
+        localized_tracked_time = localize_datetime(tracked_time)
+
+        data = {
+            "tracked_time": grocy_datetime_str(localized_tracked_time),
+            "skipped": skipped,
+        }
+
+        if done_by is not None:
+            data["done_by"] = done_by
+
+        return await self._do_post_request(f"chores/{chore_id}/execute", data)
+
+    async def add_product(
+        self,
+        product_id,
+        amount: float,
+        price: float,
+        best_before_date: datetime | None = None,
+        transaction_type: TransactionType = TransactionType.PURCHASE,
+    ):
+        data = {
+            "amount": amount,
+            "transaction_type": transaction_type.value,
+            "price": price,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = best_before_date.strftime("%Y-%m-%d")
+
+        return await self._do_post_request(f"stock/products/{product_id}/add", data)
+
+    async def consume_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        spoiled: bool = False,
+        transaction_type: TransactionType = TransactionType.CONSUME,
+        allow_subproduct_substitution: bool = False,
+    ):
+        data = {
+            "amount": amount,
+            "spoiled": spoiled,
+            "transaction_type": transaction_type.value,
+            "allow_subproduct_substitution": allow_subproduct_substitution,
+        }
+
+        await self._do_post_request(f"stock/products/{product_id}/consume", data)
+
+    async def open_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        allow_subproduct_substitution: bool = False,
+    ):
+        data = {
+            "amount": amount,
+            "allow_subproduct_substitution": allow_subproduct_substitution,
+        }
+
+        await self._do_post_request(f"stock/products/{product_id}/open", data)
+
+    async def consume_recipe(
+        self,
+        recipe_id: int,
+    ):
+        await self._do_post_request(f"recipes/{recipe_id}/consume", None)
+
+    async def inventory_product(
+        self,
+        product_id: int,
+        new_amount: float,
+        best_before_date: datetime = None,
+        shopping_location_id: int = None,
+        location_id: int = None,
+        price: float = None,
+    ):
+        data = {
+            "new_amount": new_amount,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+        if shopping_location_id is not None:
+            data["shopping_location_id"] = shopping_location_id
+
+        if location_id is not None:
+            data["location_id"] = location_id
+
+        if price is not None:
+            data["price"] = price
+
+        parsed_json = await self._do_post_request(
+            f"stock/products/{product_id}/inventory", data
+        )
+
+        if parsed_json:
+            stock_log = [StockLogResponse(**response) for response in parsed_json]
+            return stock_log[0]
+        return None
+
+    async def add_product_by_barcode(
+        self,
+        barcode: str,
+        amount: float,
+        price: float,
+        best_before_date: datetime | None = None,
+    ) -> StockLogResponse:
+        data = {
+            "amount": amount,
+            "transaction_type": TransactionType.PURCHASE.value,
+            "price": price,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+
+        self._check_barcode(barcode)
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/add", data
+        )
+        stock_log = None
+        if parsed_json:
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
+
+    async def consume_product_by_barcode(
+        self, barcode: str, amount: float = 1, spoiled: bool = False
+    ):
+        data = {
+            "amount": amount,
+            "spoiled": spoiled,
+            "transaction_type": TransactionType.CONSUME.value,
+        }
+
+        self._check_barcode(barcode)
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/consume", data
+        )
+        stock_log = None
+        if parsed_json:
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
+
+    async def inventory_product_by_barcode(
+        self,
+        barcode: str,
+        new_amount: float,
+        best_before_date: datetime | None = None,
+        location_id: int | None = None,
+        price: float | None = None,
+    ):
+        data = {
+            "new_amount": new_amount,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+
+        if location_id is not None:
+            data["location_id"] = location_id
+
+        if price is not None:
+            data["price"] = price
+
+        self._check_barcode(barcode)
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/inventory", data
+        )
+        stock_log = None
+        if parsed_json:
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
+
+    async def get_shopping_list(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ShoppingListItem]:
+        return await self._do_get_list_request(
+            "objects/shopping_list",
+            ShoppingListItem,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    async def add_missing_product_to_shopping_list(self, shopping_list_id: int = None):
+        data = None
+        if shopping_list_id:
+            data = {"list_id": shopping_list_id}
+
+        await self._do_post_request("stock/shoppinglist/add-missing-products", data)
+
+    async def add_product_to_shopping_list(
+        self,
+        product_id: int,
+        shopping_list_id: int = 1,
+        amount: float = 1,
+        quantity_unit_id: int = None,
+    ):
+        data = {
+            "product_id": product_id,
+            "list_id": shopping_list_id,
+            "product_amount": amount,
+        }
+        if quantity_unit_id:
+            data["qu_id"] = quantity_unit_id
+        await self._do_post_request("stock/shoppinglist/add-product", data)
+
+    async def clear_shopping_list(self, shopping_list_id: int = 1):
+        data = {"list_id": shopping_list_id}
+
+        await self._do_post_request("stock/shoppinglist/clear", data)
+
+    async def remove_product_in_shopping_list(
+        self, product_id: int, shopping_list_id: int = 1, amount: float = 1
+    ):
+        data = {
+            "product_id": product_id,
+            "list_id": shopping_list_id,
+            "product_amount": amount,
+        }
+        await self._do_post_request("stock/shoppinglist/remove-product", data)
+
+    async def get_product_groups(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[LocationData]:
+        return await self._do_get_list_request(
+            "objects/product_groups",
+            LocationData,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    async def upload_product_picture(self, product_id: int, pic_path: str):
+        b64fn = base64.b64encode(f"{product_id}.jpg".encode("ascii"))
+        req_url = "files/productpictures/" + str(b64fn, "utf-8")
+        pic = await asyncio.to_thread(_read_file, pic_path)
+        await self._do_put_request(req_url, pic)
+
+    async def update_product_pic(self, product_id: int):
+        pic_name = f"{product_id}.jpg"
+        data = {"picture_file_name": pic_name}
+        await self._do_put_request(f"objects/products/{product_id}", data)
+
+    async def get_userfields(self, entity: str, object_id: int):
+        url = f"userfields/{entity}/{object_id}"
+        return await self._do_get_request(url)
+
+    async def set_userfields(self, entity: str, object_id: int, key: str, value):
+        data = {key: value}
+        await self._do_put_request(f"userfields/{entity}/{object_id}", data)
+
+    async def get_last_db_changed(self):
+        resp = await self._do_get_request("system/db-changed-time")
+        return parse_date(resp.get("changed_time"))
+
+    async def get_system_info(self) -> SystemInfoDto:
+        return await self._do_get_model_request("system/info", SystemInfoDto)
+
+    async def get_system_time(self) -> SystemTimeDto:
+        return await self._do_get_model_request("system/time", SystemTimeDto)
+
+    async def get_system_config(self) -> SystemConfigDto:
+        system_config = await self._do_get_model_request(
+            "system/config", SystemConfigDto
+        )
+        _LOGGER.debug("System config: %s", system_config)
+        return system_config
+
+    async def get_tasks(
+        self, query_filters: list[str] | None = None
+    ) -> list[TaskResponse]:
+        return await self._do_get_list_request("tasks", TaskResponse, query_filters)
+
+    async def get_task(self, task_id: int) -> TaskResponse:
+        url = f"objects/tasks/{task_id}"
+        return await self._do_get_model_request(url, TaskResponse)
+
+    async def complete_task(self, task_id: int, done_time: datetime | None = None):
+        url = f"tasks/{task_id}/complete"
+
+        if done_time is None:
+            done_time = datetime.now()
+
+        localized_done_time = localize_datetime(done_time)
+
+        data = {"done_time": grocy_datetime_str(localized_done_time)}
+        await self._do_post_request(url, data)
+
+    async def get_meal_plan(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[MealPlanResponse]:
+        return await self._do_get_list_request(
+            "objects/meal_plan",
+            MealPlanResponse,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    async def get_recipe(self, object_id: int) -> RecipeDetailsResponse:
+        return await self._do_get_model_request(
+            f"objects/recipes/{object_id}", RecipeDetailsResponse
+        )
+
+    async def get_batteries(
+        self, query_filters: list[str] | None = None
+    ) -> list[CurrentBatteryResponse]:
+        return await self._do_get_list_request(
+            "batteries", CurrentBatteryResponse, query_filters
+        )
+
+    async def get_battery(self, battery_id: int) -> BatteryDetailsResponse:
+        return await self._do_get_model_request(
+            f"batteries/{battery_id}", BatteryDetailsResponse
+        )
+
+    async def charge_battery(
+        self, battery_id: int, tracked_time: datetime | None = None
+    ):
+        if tracked_time is None:
+            tracked_time = datetime.now()
+
+        localized_tracked_time = localize_datetime(tracked_time)
+        data = {"tracked_time": grocy_datetime_str(localized_tracked_time)}
+
+        return await self._do_post_request(f"batteries/{battery_id}/charge", data)
+
+    async def add_generic(self, entity_type: str, data):
+        return await self._do_post_request(f"objects/{entity_type}", data)
+
+    async def get_generic(self, entity_type: str, object_id: int):
+        return await self._do_get_request(f"objects/{entity_type}/{object_id}")
+
+    async def get_generic_many(
+        self, entity_type: str, ids: Iterable[int]
+    ) -> ObjectsById:
+        """Fetch the objects of ``entity_type`` with the given ids.
+
+        The ids are sent as regex ``query[]`` filters, split so URLs stay
+        short, and the chunks are requested concurrently. Ids that do not exist
+        are listed in ``missing`` of the result instead of raising.
+        """
+        wanted = sorted({int(object_id) for object_id in ids})
+        end_url = f"objects/{entity_type}"
+        pages = await asyncio.gather(
+            *(
+                self._do_get_request(end_url, [id_filter])
+                for id_filter in _id_filters(wanted)
+            )
+        )
+        return _objects_by_id(wanted, pages)
+
+    async def update_generic(self, entity_type: str, object_id: int, data):
+        return await self._do_put_request(f"objects/{entity_type}/{object_id}", data)
+
+    async def delete_generic(self, entity_type: str, object_id: int):
+        return await self._do_delete_request(f"objects/{entity_type}/{object_id}")
+
+    async def get_generic_objects_for_type(
+        self,
+        entity_type: str,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ):
+        return await self._do_get_request(
+            f"objects/{entity_type}", query_filters, _page_params(order, limit, offset)
+        )
+
+    async def iter_generic_object_pages(
+        self,
+        entity_type: str,
+        page_size: int,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the objects of ``entity_type`` in pages of ``page_size``.
+
+        A page is only requested once the previous one has been consumed. Pass
+        ``order`` so that pages are taken from a stable sort order.
+        """
+        offset = 0
+        while True:
+            page = await self.get_generic_objects_for_type(
+                entity_type, query_filters, order, page_size, offset
+            )
+            if page:
+                yield page
+            if not page or len(page) < page_size:
+                return
+            offset += page_size
+
+    def iter_generic_objects(
+        self,
+        entity_type: str,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> AsyncIterator[dict]:
+        return self._iter_get_request(
+            f"objects/{entity_type}", query_filters, _page_params(order, limit, offset)
+        )
+
+    async def iter_products(
+        self, query_filters: list[str] | None = None
+    ) -> AsyncIterator[ProductData]:
+        async for data in self.iter_generic_objects(
+            EntityType.PRODUCTS.value, query_filters
+        ):
+            yield ProductData.model_validate(data)
+
+    async def get_products(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ProductData]:
+        return await self._do_get_list_request(
+            f"objects/{EntityType.PRODUCTS.value}",
+            ProductData,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    async def get_meal_plan_sections(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[MealPlanSectionResponse]:
+        return await self._do_get_list_request(
+            f"objects/{EntityType.MEAL_PLAN_SECTIONS.value}",
+            MealPlanSectionResponse,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    async def get_meal_plan_section(
+        self, meal_plan_section_id
+    ) -> MealPlanSectionResponse:
+        parsed_json = await self._do_get_request(
+            f"objects/meal_plan_sections?query%5B%5D=id%3D{meal_plan_section_id}"
+        )
+        if parsed_json and len(parsed_json) == 1:
+            return MealPlanSectionResponse(**parsed_json[0])
+        return None
+
+    async def get_users(self) -> list[UserDto]:
+        return await self._do_get_list_request("users", UserDto)
+
+    async def get_user(self, user_id: int) -> UserDto:
+        parsed_json = await self._do_get_request("users")
+        if parsed_json:
+            return UserDto(**parsed_json[0])
+        return None
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as pic:  # noqa: PTH123
+        return pic.read()
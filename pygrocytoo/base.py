@@ -1,20 +1,101 @@
+import datetime
+import functools
 import json
+from enum import Enum
+from typing import Callable, Iterable, TextIO
+
+# Values ``as_dict`` passes through without inspecting them further.
+_PLAIN_TYPES = frozenset(
+    (str, int, float, bool, type(None), datetime.datetime, datetime.date)
+)
+# Number of models encoded per ``write`` call by ``dump_json``.
+_DUMP_BATCH_SIZE = 1000
 
 
 def get_val(obj):
+    if obj.__class__ in _PLAIN_TYPES:
+        return obj
+    if isinstance(obj, DataModel):
+        return obj.as_dict()
+    if isinstance(obj, list):
+        return [
+            item if item.__class__ in _PLAIN_TYPES else get_val(item) for item in obj
+        ]
+    if isinstance(obj, (Enum, datetime.time)):
+        return obj
     if hasattr(obj, "as_dict"):
         as_attr = getattr(obj, "as_dict")
         return as_attr()
     return obj
 
 
+def _json_default(obj):
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+_encoder = json.JSONEncoder(default=_json_default)
+
+
+@functools.cache
+def _field_plan(cls: type) -> tuple[tuple[str, Callable], ...]:
+    """The ``(name, getter)`` pairs of every property of ``cls``.
+
+    Built once per class, walking the MRO so inherited properties are included
+    and overridden ones keep their original position.
+    """
+    getters = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, property):
+                getters[name] = value.fget
+            else:
+                getters.pop(name, None)
+    return tuple(getters.items())
+
+
 class DataModel(object):
+    __slots__ = ()
+
     def to_json(self):
-        return json.dumps(self.as_dict())
+        return _encoder.encode(self.as_dict())
 
     def as_dict(self):
-        return {
-            k: get_val(getattr(self, k))
-            for k, v in self.__class__.__dict__.items()
-            if isinstance(v, property)
-        }
+        """The model's properties as a dict, nested models converted too.
+
+        Properties whose value the response did not set are None.
+        """
+        result = {}
+        for name, getter in _field_plan(self.__class__):
+            try:
+                value = getter(self)
+            except AttributeError:
+                value = None
+            result[name] = value if value.__class__ in _PLAIN_TYPES else get_val(value)
+        return result
+
+
+def dump_json(models: Iterable[DataModel], fp: TextIO):
+    """Write ``models`` to ``fp`` as a JSON array.
+
+    Models are encoded in batches, so the whole list is never held as one
+    string. Dates and times are written in ISO 8601 format and enums as their
+    value.
+    """
+    fp.write("[")
+    batch = []
+    separator = ""
+    for model in models:
+        batch.append(model.as_dict())
+        if len(batch) == _DUMP_BATCH_SIZE:
+            fp.write(separator)
+            fp.write(_encoder.encode(batch)[1:-1])
+            batch.clear()
+            separator = ","
+    if batch:
+        fp.write(separator)
+        fp.write(_encoder.encode(batch)[1:-1])
+    fp.write("]")
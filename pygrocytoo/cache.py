@@ -0,0 +1,559 @@
+from collections import OrderedDict
+from collections.abc import Callable
+import json
+import math
+import re
+import threading
+import time
+
+from .errors import GrocyError
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 60.0
+DB_CHANGED_TIME_ENDPOINT = "system/db-changed-time"
+SYSTEM_INFO_ENDPOINT = "system/info"
+DEFAULT_PROBE_INTERVAL = 5.0
+DEFAULT_BARCODE_TTL = 300.0
+DEFAULT_NEGATIVE_BARCODE_TTL = 30.0
+BY_BARCODE_ENDPOINT = "stock/products/by-barcode/"
+DEFAULT_TTLS = {
+    "system/time": 0,
+    DB_CHANGED_TIME_ENDPOINT: 0,
+}
+# Endpoints whose content changes with the date alone, without a db change.
+# A coherent cache still expires them after this TTL unless ``ttls`` says else.
+DATE_DEPENDENT_TTL = 3600.0
+DATE_DEPENDENT_ENDPOINTS = ("stock/volatile", "chores", "batteries", "tasks")
+
+# Read endpoints whose content changes when a write below the key is issued.
+# The longest matching key wins.
+_WRITE_INVALIDATIONS = {
+    "stock": ("stock", "objects/stock", "objects/stock_log", "objects/shopping_list"),
+    "stock/shoppinglist": ("objects/shopping_list",),
+    # Executing a chore may consume a product (consume_product_on_execution).
+    "chores": (
+        "chores",
+        "objects/chores",
+        "objects/chores_log",
+        "stock",
+        "objects/stock",
+        "objects/stock_log",
+    ),
+    "batteries": ("batteries", "objects/batteries", "objects/battery_charge_cycles"),
+    "tasks": ("tasks", "objects/tasks"),
+    "recipes": (
+        "recipes",
+        "objects/recipes",
+        "stock",
+        "objects/stock",
+        "objects/stock_log",
+    ),
+    "files": (),
+}
+
+# Non-generic endpoints that embed rows of an entity.
+_ENTITY_ENDPOINTS = {
+    "products": ("stock",),
+    "product_barcodes": ("stock",),
+    "product_groups": ("stock",),
+    "locations": ("stock",),
+    "quantity_units": ("stock",),
+    "chores": ("chores",),
+    "batteries": ("batteries",),
+    "tasks": ("tasks",),
+    "task_categories": ("tasks",),
+}
+
+_PRODUCT_STOCK_WRITE = re.compile(r"stock/products/(\d+)(?:/|$)")
+
+
+def matches_endpoint(end_url: str, prefix: str) -> bool:
+    """Whether ``end_url`` is ``prefix`` or a sub path / query of it."""
+    if not end_url.startswith(prefix):
+        return False
+    return len(end_url) == len(prefix) or end_url[len(prefix)] in "/?"
+
+
+def _params_key(key: tuple) -> str:
+    """The query parameters of a request key as stored on disk."""
+    return json.dumps(key[1])
+
+
+def invalidated_endpoints(end_url: str) -> tuple[str, ...] | None:
+    """Return the read endpoint prefixes a write to ``end_url`` makes stale.
+
+    ``None`` means the write is unknown and everything should be dropped.
+    """
+    parts = end_url.split("?", 1)[0].split("/")
+    if parts[0] in ("objects", "userfields") and len(parts) > 1:
+        entity = parts[1]
+        endpoints = (f"objects/{entity}",) + _ENTITY_ENDPOINTS.get(entity, ())
+        if parts[0] == "userfields":
+            endpoints += (f"userfields/{entity}",)
+        return endpoints
+
+    matching = [
+        prefix for prefix in _WRITE_INVALIDATIONS if matches_endpoint(end_url, prefix)
+    ]
+    if not matching:
+        return None
+    return _WRITE_INVALIDATIONS[max(matching, key=len)]
+
+
+class ResponseCache(object):
+    """Thread-safe LRU cache for the raw bodies of GET responses.
+
+    Entries are keyed on the endpoint and its query parameters and expire after
+    the TTL of the longest matching prefix in ``ttls`` (``default_ttl``
+    otherwise). A TTL of 0 disables caching for that endpoint.
+
+    With ``db_changed_probe_interval`` set the cache is also kept coherent
+    with the Grocy database: the client probes ``system/db-changed-time`` at
+    most once per interval and everything is dropped as soon as it moves.
+    ``default_ttl`` no longer applies then, but the TTLs in ``ttls`` still do,
+    as does ``DATE_DEPENDENT_TTL`` for ``DATE_DEPENDENT_ENDPOINTS``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+        db_changed_probe_interval: float | None = None,
+    ):
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._ttls = dict(DEFAULT_TTLS)
+        if db_changed_probe_interval is not None:
+            self._ttls.update(
+                dict.fromkeys(DATE_DEPENDENT_ENDPOINTS, DATE_DEPENDENT_TTL)
+            )
+        if ttls:
+            self._ttls.update(ttls)
+
+        self._entries: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+
+        self._probe_interval = db_changed_probe_interval
+        self._next_probe = 0.0
+        self._db_changed_time: str | None = None
+
+    @property
+    def is_coherent(self) -> bool:
+        """Whether entries are validated against the db change time."""
+        return self._probe_interval is not None
+
+    @property
+    def db_changed_time(self) -> str | None:
+        return self._db_changed_time
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever entries are invalidated or flushed.
+
+        Capture it before fetching a response and pass it to ``set``, so a body
+        fetched before a write is not stored after that write invalidated it.
+        """
+        return self._generation
+
+    def claim_probe(self) -> bool:
+        """Return True if the db change time should be probed now.
+
+        Only one caller per interval gets True, so concurrent readers do not
+        probe at the same time.
+        """
+        if self._probe_interval is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_probe:
+                return False
+            self._next_probe = now + self._probe_interval
+            return True
+
+    def verify_server(self, fetch: Callable[[str], bytes]):
+        """Called with the client's GET function before each probe is applied.
+
+        Nothing to verify for an in-memory cache.
+        """
+
+    def update_db_changed_time(self, changed_time: str) -> bool:
+        """Record the probed db change time, flushing everything if it moved.
+
+        Returns True if the cache was flushed.
+        """
+        with self._lock:
+            if changed_time == self._db_changed_time:
+                return False
+            flushed = self._db_changed_time is not None or bool(self._entries)
+            self._db_changed_time = changed_time
+            self._entries.clear()
+            self._generation += 1
+            return flushed
+
+    def ttl_for(self, end_url: str) -> float:
+        """TTL of ``end_url``, infinite if only a db change drops it."""
+        matching = [
+            prefix for prefix in self._ttls if matches_endpoint(end_url, prefix)
+        ]
+        if matching:
+            return self._ttls[max(matching, key=len)]
+        if self.is_coherent:
+            return math.inf
+        return self._default_ttl
+
+    def _is_expired(self, entry: tuple[float, bytes]) -> bool:
+        return entry[0] <= time.monotonic()
+
+    def get(self, key: tuple) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def _is_stale(self, generation: int | None) -> bool:
+        return generation is not None and generation != self._generation
+
+    def set(self, key: tuple, content: bytes, generation: int | None = None) -> bool:
+        """Store ``content``, unless the cache was invalidated since ``generation``.
+
+        Returns True if the entry was stored.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return False
+        with self._lock:
+            if self._is_stale(generation):
+                return False
+            self._add(key, content, ttl)
+            return True
+
+    def _add(self, key: tuple, content: bytes, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoints: tuple[str, ...] | None = None) -> int:
+        """Drop the entries below any of ``endpoints``, or all when None."""
+        with self._lock:
+            self._generation += 1
+            if endpoints is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+
+            stale = [
+                key
+                for key in self._entries
+                if any(matches_endpoint(key[0], prefix) for prefix in endpoints)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def invalidate_for_write(self, end_url: str) -> int:
+        return self.invalidate(invalidated_endpoints(end_url))
+
+    def clear(self):
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+
+class PersistentResponseCache(ResponseCache):
+    """``ResponseCache`` that also keeps its entries in a SQLite file.
+
+    Every stored response is tagged with the db change time it was fetched
+    under, so a restarted process probes ``system/db-changed-time`` once and
+    serves everything still tagged with that time straight from disk. Rows
+    with another tag are deleted when the change time moves. Responses of
+    endpoints with a TTL, like ``DATE_DEPENDENT_ENDPOINTS``, are only kept in
+    memory.
+
+    The Grocy version of the server is kept as well. The first probe of a
+    process fetches ``system/info`` before any row is served and empties the
+    file if the version differs from the stored one, which covers server
+    upgrades that did not touch the database; later ``system/info`` responses
+    are checked the same way.
+
+    The cache is always coherent, ``db_changed_probe_interval`` cannot be
+    None. Several processes may share one file, but it should only hold the
+    responses of a single Grocy server.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: dict[str, float] | None = None,
+        db_changed_probe_interval: float = DEFAULT_PROBE_INTERVAL,
+    ):
+        import sqlite3
+
+        super().__init__(
+            max_entries=max_entries,
+            ttls=ttls,
+            db_changed_probe_interval=db_changed_probe_interval,
+        )
+        self._disk_hits = 0
+        self._server_verified = False
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (endpoint TEXT, params TEXT,"
+                " changed_time TEXT, content BLOB, PRIMARY KEY (endpoint, params))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def close(self):
+        self._db.close()
+
+    @property
+    def disk_hits(self) -> int:
+        """Number of hits served from the file rather than from memory."""
+        return self._disk_hits
+
+    @property
+    def server_version(self) -> str | None:
+        """The Grocy version of the last ``system/info`` response stored."""
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE name = 'server_version'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def verify_server(self, fetch: Callable[[str], bytes]):
+        """Check the server version once, before rows are served from disk."""
+        if self._server_verified:
+            return
+        self._check_server_version(fetch(SYSTEM_INFO_ENDPOINT))
+        self._server_verified = True
+
+    def update_db_changed_time(self, changed_time: str) -> bool:
+        flushed = super().update_db_changed_time(changed_time)
+        with self._lock, self._db:
+            deleted = self._db.execute(
+                "DELETE FROM responses WHERE changed_time != ?", (changed_time,)
+            ).rowcount
+        return flushed or deleted > 0
+
+    def get(self, key: tuple) -> bytes | None:
+        content = super().get(key)
+        if content is not None or self._db_changed_time is None:
+            return content
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content FROM responses"
+                " WHERE endpoint = ? AND params = ? AND changed_time = ?",
+                (key[0], _params_key(key), self._db_changed_time),
+            ).fetchone()
+            if row is None:
+                return None
+            self._add(key, row[0], self.ttl_for(key[0]))
+            self._misses -= 1
+            self._hits += 1
+            self._disk_hits += 1
+            return row[0]
+
+    def set(self, key: tuple, content: bytes, generation: int | None = None) -> bool:
+        if key[0] == SYSTEM_INFO_ENDPOINT:
+            self._check_server_version(content)
+        if not super().set(key, content, generation) or self._db_changed_time is None:
+            return False
+        if not math.isinf(self.ttl_for(key[0])):
+            # The file does not record the age of a row.
+            return True
+        with self._lock, self._db:
+            if self._is_stale(generation):
+                return False
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key[0], _params_key(key), self._db_changed_time, content),
+            )
+        return True
+
+    def _check_server_version(self, content: bytes):
+        try:
+            version = json.loads(content)["grocy_version"]["Version"]
+        except (ValueError, KeyError, TypeError):
+            return
+        stored = self.server_version
+        if version == stored:
+            return
+        if stored is not None:
+            self.invalidate()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('server_version', ?)", (version,)
+            )
+
+    def invalidate(self, endpoints: tuple[str, ...] | None = None) -> int:
+        dropped = super().invalidate(endpoints)
+        with self._lock, self._db:
+            if endpoints is None:
+                self._db.execute("DELETE FROM responses")
+                return dropped
+            stored = self._db.execute("SELECT DISTINCT endpoint FROM responses")
+            stale = [
+                (endpoint,)
+                for (endpoint,) in stored.fetchall()
+                if any(matches_endpoint(endpoint, prefix) for prefix in endpoints)
+            ]
+            self._db.executemany("DELETE FROM responses WHERE endpoint = ?", stale)
+        return dropped
+
+
+class BarcodeCache(object):
+    """Thread-safe cache of ``stock/products/by-barcode`` lookups.
+
+    Known barcodes map to the product details of their product for ``ttl``
+    seconds. Unknown barcodes keep the ``GrocyError`` (a 400) of their lookup
+    for ``negative_ttl`` seconds, so scanning them again does not cost another
+    request; a ``negative_ttl`` of 0 disables this.
+
+    The client keeps the entries in sync with its own writes: stock writes of
+    a product, by id or by barcode, drop all entries of that product and
+    product or barcode edits drop everything.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_BARCODE_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_BARCODE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        # barcode -> (expiry, details or None, error or None)
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _get(self, barcode: str) -> tuple | None:
+        entry = self._entries.get(barcode)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[barcode]
+            entry = None
+        return entry
+
+    def _set(self, barcode: str, ttl: float, details, error: GrocyError | None):
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[barcode] = (time.monotonic() + ttl, details, error)
+            self._entries.move_to_end(barcode)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, barcode: str):
+        """Return the cached details of ``barcode``, None on a miss.
+
+        Raises the cached ``GrocyError`` if the barcode is known to be unknown.
+        """
+        with self._lock:
+            entry = self._get(barcode)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
+
+    def raise_if_unknown(self, barcode: str):
+        with self._lock:
+            entry = self._get(barcode)
+        if entry is not None and entry[2] is not None:
+            raise entry[2]
+
+    def set(self, barcode: str, details):
+        if details is not None:
+            self._set(barcode, self._ttl, details, None)
+
+    def set_unknown(self, barcode: str, error: GrocyError):
+        """Remember ``barcode`` as unknown if its lookup failed with a 400.
+
+        That is what Grocy answers for unknown barcodes; other errors, like
+        401, 403 or 429, are not about the barcode and are not cached.
+        """
+        if error.status_code == 400:
+            self._set(barcode, self._negative_ttl, None, error)
+
+    def invalidate_product(self, product_id: int) -> int:
+        with self._lock:
+            stale = [
+                barcode
+                for barcode, (_, details, _) in self._entries.items()
+                if details is not None and details.product.id == product_id
+            ]
+            for barcode in stale:
+                del self._entries[barcode]
+            return len(stale)
+
+    def invalidate_for_write(self, end_url: str) -> int:
+        """Drop the entries a write to ``end_url`` makes stale."""
+        if end_url.startswith(BY_BARCODE_ENDPOINT):
+            # The by-barcode write paths drop the product of the stock log.
+            return 0
+        endpoints = invalidated_endpoints(end_url)
+        if endpoints is None or any(
+            endpoint in endpoints
+            for endpoint in ("objects/products", "objects/product_barcodes")
+        ):
+            return self.clear()
+        match = _PRODUCT_STOCK_WRITE.match(end_url)
+        if match:
+            return self.invalidate_product(int(match.group(1)))
+        if "stock" in endpoints:
+            with self._lock:
+                stale = [
+                    barcode
+                    for barcode, (_, details, _) in self._entries.items()
+                    if details is not None
+                ]
+                for barcode in stale:
+                    del self._entries[barcode]
+                return len(stale)
+        return 0
+
+    def clear(self) -> int:
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
@@ -0,0 +1,305 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+import threading
+
+from .data_models.generic import EntityType
+from .data_models.product import (
+    Group,
+    Location,
+    Product,
+    ProductBarcode,
+    QuantityUnit,
+)
+from .grocy_api_client import (
+    GrocyApiClient,
+    LocationData,
+    ProductBarcodeData,
+    ProductData,
+    QuantityUnitData,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+
+CATALOG_ENTITIES = (
+    EntityType.PRODUCTS,
+    EntityType.PRODUCT_BARCODES,
+    EntityType.QUANTITY_UNITS,
+    EntityType.LOCATIONS,
+    EntityType.PRODUCT_GROUPS,
+)
+
+
+class _CatalogIndex(object):
+    """Snapshot of the catalog, replaced as a whole on refresh."""
+
+    def __init__(self):
+        self.rows: dict[EntityType, dict[int, dict]] = {
+            entity_type: {} for entity_type in CATALOG_ENTITIES
+        }
+        self.product_data: dict[int, ProductData] = {}
+        self.products: dict[int, Product] = {}
+        self.by_barcode: dict[str, int] = {}
+        self.by_group: dict[int, list[int]] = {}
+        self.by_location: dict[int, list[int]] = {}
+        self.quantity_units: dict[int, QuantityUnit] = {}
+        self.locations: dict[int, Location] = {}
+        self.product_groups: dict[int, Group] = {}
+
+
+def _changed_ids(old: dict[int, dict], new: dict[int, dict]) -> set[int]:
+    return {
+        object_id
+        for object_id in old.keys() | new.keys()
+        if old.get(object_id) != new.get(object_id)
+    }
+
+
+def _update_models(
+    models: dict, rows: dict[int, dict], changed: set[int], factory: Callable
+) -> dict:
+    models = dict(models)
+    for object_id in changed:
+        row = rows.get(object_id)
+        if row is None:
+            models.pop(object_id, None)
+        else:
+            models[object_id] = factory(row)
+    return models
+
+
+def _group_ids(product_data: dict[int, ProductData], attribute: str):
+    index: dict[int, list[int]] = {}
+    for product_id in sorted(product_data):
+        key = getattr(product_data[product_id], attribute)
+        if key is not None:
+            index.setdefault(key, []).append(product_id)
+    return index
+
+
+def _build_index(old: _CatalogIndex, fetched: list[list[dict]]) -> _CatalogIndex:
+    """Build the next snapshot from the fetched rows, reusing unchanged models."""
+    index = _CatalogIndex()
+    changed: dict[EntityType, set[int]] = {}
+    for entity_type, rows in zip(CATALOG_ENTITIES, fetched):
+        index.rows[entity_type] = {int(row["id"]): row for row in rows or []}
+        changed[entity_type] = _changed_ids(
+            old.rows[entity_type], index.rows[entity_type]
+        )
+
+    changed_units = changed[EntityType.QUANTITY_UNITS]
+    index.quantity_units = _update_models(
+        old.quantity_units,
+        index.rows[EntityType.QUANTITY_UNITS],
+        changed_units,
+        lambda row: QuantityUnit(QuantityUnitData(**row)),
+    )
+    index.locations = _update_models(
+        old.locations,
+        index.rows[EntityType.LOCATIONS],
+        changed[EntityType.LOCATIONS],
+        lambda row: Location(LocationData(**row)),
+    )
+    index.product_groups = _update_models(
+        old.product_groups,
+        index.rows[EntityType.PRODUCT_GROUPS],
+        changed[EntityType.PRODUCT_GROUPS],
+        lambda row: Group(LocationData(**row)),
+    )
+    index.product_data = _update_models(
+        old.product_data,
+        index.rows[EntityType.PRODUCTS],
+        changed[EntityType.PRODUCTS],
+        lambda row: ProductData(**row),
+    )
+
+    # Products whose own row, barcodes or purchase unit changed are rebuilt.
+    affected = set(changed[EntityType.PRODUCTS])
+    old_barcodes = old.rows[EntityType.PRODUCT_BARCODES]
+    new_barcodes = index.rows[EntityType.PRODUCT_BARCODES]
+    for barcode_id in changed[EntityType.PRODUCT_BARCODES]:
+        for row in (old_barcodes.get(barcode_id), new_barcodes.get(barcode_id)):
+            if row is not None:
+                affected.add(int(row["product_id"]))
+    if changed_units:
+        affected.update(
+            product_id
+            for product_id, data in index.product_data.items()
+            if data.qu_id_purchase in changed_units
+        )
+
+    barcode_rows: dict[int, list[dict]] = {}
+    if affected:
+        for row in new_barcodes.values():
+            product_id = int(row["product_id"])
+            if product_id in affected:
+                barcode_rows.setdefault(product_id, []).append(row)
+
+    index.products = dict(old.products)
+    index.by_barcode = dict(old.by_barcode)
+    for product_id in affected:
+        old_product = old.products.get(product_id)
+        if old_product is not None:
+            for barcode in old_product.barcodes:
+                if index.by_barcode.get(barcode) == product_id:
+                    del index.by_barcode[barcode]
+
+        data = index.product_data.get(product_id)
+        if data is None:
+            index.products.pop(product_id, None)
+            continue
+        product = Product(data)
+        product.apply_catalog_data(
+            [
+                ProductBarcode(ProductBarcodeData(**row))
+                for row in barcode_rows.get(product_id, [])
+            ],
+            index.quantity_units.get(data.qu_id_purchase),
+        )
+        index.products[product_id] = product
+        for barcode in product.barcodes:
+            index.by_barcode[barcode] = product_id
+
+    index.by_group = _group_ids(index.product_data, "product_group_id")
+    index.by_location = _group_ids(index.product_data, "location_id")
+    _LOGGER.debug(
+        "Catalog refreshed: %d products, %d rebuilt", len(index.products), len(affected)
+    )
+    return index
+
+
+class ProductCatalog(object):
+    """In-memory catalog of products, indexed by id, barcode, group and location.
+
+    ``refresh`` bulk-loads products, product barcodes, quantity units,
+    locations and product groups, and later only refetches them when the
+    database change time of Grocy moved. Models of unchanged rows are reused,
+    so a refresh only validates what was added or modified.
+
+    Lookups never query the server and can be used from several threads while
+    a refresh is running. The returned products are shared between callers
+    and should be treated as read-only.
+    """
+
+    def __init__(self, api_client: GrocyApiClient):
+        self._api_client = api_client
+        self._index = _CatalogIndex()
+        self._loaded = False
+        self._db_changed_time: datetime | None = None
+        self._lock = threading.Lock()
+        self._async_lock = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def db_changed_time(self) -> datetime | None:
+        """Database change time the catalog was loaded at."""
+        return self._db_changed_time
+
+    def _is_current(self, changed_time: datetime | None, force: bool) -> bool:
+        return not force and self._loaded and changed_time == self._db_changed_time
+
+    def _invalidate_cache(self):
+        cache = getattr(self._api_client, "cache", None)
+        if cache is not None:
+            cache.invalidate(
+                tuple(
+                    f"objects/{entity_type.value}" for entity_type in CATALOG_ENTITIES
+                )
+            )
+
+    def _apply(self, changed_time: datetime | None, fetched: list[list[dict]]):
+        self._index = _build_index(self._index, fetched)
+        self._db_changed_time = changed_time
+        self._loaded = True
+
+    def refresh(self, force: bool = False) -> bool:
+        """Load the catalog, or reload it if the database changed since.
+
+        Costs a single ``system/db-changed-time`` request when nothing changed.
+        Returns True if the rows were fetched.
+        """
+        with self._lock:
+            changed_time = self._api_client.get_last_db_changed()
+            if self._is_current(changed_time, force):
+                return False
+
+            self._invalidate_cache()
+            with ThreadPoolExecutor(len(CATALOG_ENTITIES)) as executor:
+                fetched = list(
+                    executor.map(
+                        lambda entity_type: (
+                            self._api_client.get_generic_objects_for_type(
+                                entity_type.value
+                            )
+                        ),
+                        CATALOG_ENTITIES,
+                    )
+                )
+            self._apply(changed_time, fetched)
+            return True
+
+    async def async_refresh(self, force: bool = False) -> bool:
+        """``refresh`` for a catalog created with an ``AsyncGrocyApiClient``."""
+        import asyncio
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            changed_time = await self._api_client.get_last_db_changed()
+            if self._is_current(changed_time, force):
+                return False
+
+            self._invalidate_cache()
+            fetched = await asyncio.gather(
+                *(
+                    self._api_client.get_generic_objects_for_type(entity_type.value)
+                    for entity_type in CATALOG_ENTITIES
+                )
+            )
+            self._apply(changed_time, list(fetched))
+            return True
+
+    def __len__(self) -> int:
+        return len(self._index.products)
+
+    @property
+    def products(self) -> list[Product]:
+        return list(self._index.products.values())
+
+    def product(self, product_id: int) -> Product | None:
+        return self._index.products.get(product_id)
+
+    def product_by_barcode(self, barcode: str) -> Product | None:
+        index = self._index
+        product_id = index.by_barcode.get(barcode)
+        if product_id is None:
+            return None
+        return index.products.get(product_id)
+
+    def products_in_group(self, product_group_id: int) -> list[Product]:
+        index = self._index
+        return [
+            index.products[product_id]
+            for product_id in index.by_group.get(product_group_id, ())
+        ]
+
+    def products_at_location(self, location_id: int) -> list[Product]:
+        index = self._index
+        return [
+            index.products[product_id]
+            for product_id in index.by_location.get(location_id, ())
+        ]
+
+    def quantity_unit(self, quantity_unit_id: int) -> QuantityUnit | None:
+        return self._index.quantity_units.get(quantity_unit_id)
+
+    def location(self, location_id: int) -> Location | None:
+        return self._index.locations.get(location_id)
+
+    def product_group(self, product_group_id: int) -> Group | None:
+        return self._index.product_groups.get(product_group_id)
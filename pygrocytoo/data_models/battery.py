@@ -9,6 +9,20 @@ from pygrocytoo.grocy_api_client import (
 
 
 class Battery(DataModel):
+    __slots__ = (
+        "_next_estimated_charge_time",
+        "_id",
+        "_last_tracked_time",
+        "_charge_cycles_count",
+        "_last_charged",
+        "_name",
+        "_description",
+        "_used_in",
+        "_charge_interval_days",
+        "_created_timestamp",
+        "_userfields",
+    )
+
     def __init__(self, response):
         self._init_empty()
 
@@ -50,6 +64,10 @@ class Battery(DataModel):
         details = api_client.get_battery(self._id)
         self._init_from_battery_details_response(details)
 
+    async def async_get_details(self, api_client):
+        details = await api_client.get_battery(self._id)
+        self._init_from_battery_details_response(details)
+
     @property
     def id(self) -> int:
         return self._id
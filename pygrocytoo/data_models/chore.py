@@ -29,6 +29,26 @@ class AssignmentType(str, Enum):
 
 
 class Chore(DataModel):
+    __slots__ = (
+        "_id",
+        "_last_tracked_time",
+        "_next_estimated_execution_time",
+        "_name",
+        "_last_done_by",
+        "_description",
+        "_period_config",
+        "_period_days",
+        "_track_date_only",
+        "_rollover",
+        "_assignment_config",
+        "_next_execution_assigned_to_user_id",
+        "_userfields",
+        "_track_count",
+        "_period_type",
+        "_assignment_type",
+        "_next_execution_assigned_user",
+    )
+
     def __init__(self, response):
         if isinstance(response, CurrentChoreResponse):
             self._init_from_CurrentChoreResponse(response)
@@ -89,6 +109,10 @@ class Chore(DataModel):
         details = api_client.get_chore(self.id)
         self._init_from_ChoreDetailsResponse(details)
 
+    async def async_get_details(self, api_client):
+        details = await api_client.get_chore(self.id)
+        self._init_from_ChoreDetailsResponse(details)
+
     @property
     def id(self) -> int:
         return self._id
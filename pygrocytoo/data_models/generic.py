@@ -24,3 +24,4 @@ class EntityType(str, Enum):
     USER_OBJECTS = "userobjects"
     MEAL_PLAN = "meal_plan"
     MEAL_PLAN_SECTIONS = "meal_plan_sections"
+    STOCK_LOG = "stock_log"
@@ -3,6 +3,7 @@ from datetime import datetime
 from enum import Enum
 
 from pygrocytoo.base import DataModel
+from pygrocytoo.data_models.generic import EntityType
 from pygrocytoo.grocy_api_client import (
     GrocyApiClient,
     MealPlanResponse,
@@ -12,6 +13,15 @@ from pygrocytoo.grocy_api_client import (
 
 
 class RecipeItem(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_base_servings",
+        "_desired_servings",
+        "_picture_file_name",
+    )
+
     def __init__(self, response: RecipeDetailsResponse):
         self._id = response.id
         self._name = response.name
@@ -53,6 +63,13 @@ class RecipeItem(DataModel):
 
 
 class MealPlanSection(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_sort_number",
+        "_row_created_timestamp",
+    )
+
     def __init__(self, response: MealPlanSectionResponse):
         self._id = response.id
         self._name = response.name
@@ -83,6 +100,19 @@ class MealPlanItemType(str, Enum):
 
 
 class MealPlanItem(DataModel):
+    __slots__ = (
+        "_id",
+        "_day",
+        "_recipe",
+        "_recipe_id",
+        "_recipe_servings",
+        "_note",
+        "_section_id",
+        "_section",
+        "_type",
+        "_product_id",
+    )
+
     def __init__(self, response: MealPlanResponse):
         self._id = response.id
         self._day = response.day
@@ -91,6 +121,7 @@ class MealPlanItem(DataModel):
         self._recipe_servings = response.recipe_servings
         self._note = response.note
         self._section_id = response.section_id
+        self._section = None
         self._type = MealPlanItemType(response.type)
         self._product_id = response.product_id
 
@@ -143,3 +174,30 @@ class MealPlanItem(DataModel):
             section = api_client.get_meal_plan_section(self.section_id)
             if section:
                 self._section = MealPlanSection(section)
+
+    async def async_get_details(self, api_client):
+        if self.recipe_id:
+            recipe = await api_client.get_recipe(self.recipe_id)
+            if recipe:
+                self._recipe = RecipeItem(recipe)
+        if self.section_id:
+            section = await api_client.get_meal_plan_section(self.section_id)
+            if section:
+                self._section = MealPlanSection(section)
+
+    def request_details(self, loader):
+        if self.recipe_id:
+            loader.request(EntityType.RECIPES, self.recipe_id)
+        if self.section_id:
+            loader.request(EntityType.MEAL_PLAN_SECTIONS, self.section_id)
+
+    def apply_details(self, loader):
+        """Set the recipe and section from a ``DetailsLoader`` after ``load``."""
+        recipe = loader.get(EntityType.RECIPES, self.recipe_id, RecipeDetailsResponse)
+        if recipe:
+            self._recipe = RecipeItem(recipe)
+        section = loader.get(
+            EntityType.MEAL_PLAN_SECTIONS, self.section_id, MealPlanSectionResponse
+        )
+        if section:
+            self._section = MealPlanSection(section)
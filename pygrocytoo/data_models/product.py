@@ -3,6 +3,7 @@ from datetime import datetime
 from pygrocytoo.base import DataModel
 from pygrocytoo.grocy_api_client import (
     CurrentStockResponse,
+    CurrentVolatilStockResponse,
     GrocyApiClient,
     LocationData,
     MissingProductResponse,
@@ -16,6 +17,11 @@ from pygrocytoo.grocy_api_client import (
 
 
 class ProductBarcode(DataModel):
+    __slots__ = (
+        "_barcode",
+        "_amount",
+    )
+
     def __init__(self, data: ProductBarcodeData):
         self._barcode = data.barcode
         self._amount = float(data.amount) if data.amount else None
@@ -30,6 +36,13 @@ class ProductBarcode(DataModel):
 
 
 class QuantityUnit(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_name_plural",
+        "_description",
+    )
+
     def __init__(self, data: QuantityUnitData):
         self._id = data.id
         self._name = data.name
@@ -54,6 +67,22 @@ class QuantityUnit(DataModel):
 
 
 class Product(DataModel):
+    __slots__ = (
+        "_name",
+        "_id",
+        "_amount_missing",
+        "_is_partly_in_stock",
+        "_available_amount",
+        "_amount_aggregated",
+        "_amount_opened",
+        "_amount_opened_aggregated",
+        "_is_aggregated_amount",
+        "_best_before_date",
+        "_default_quantity_unit_purchase",
+        "_barcodes",
+        "_product_group_id",
+    )
+
     def __init__(self, data):
         self._init_empty()
         if isinstance(data, CurrentStockResponse):
@@ -123,7 +152,21 @@ class Product(DataModel):
         self._id = response.product_id
 
     def get_details(self, api_client: GrocyApiClient):
-        details = api_client.get_product(self.id)
+        self._apply_details(api_client.get_product(self.id))
+
+    async def async_get_details(self, api_client):
+        self._apply_details(await api_client.get_product(self.id))
+
+    def apply_catalog_data(
+        self,
+        barcodes: list[ProductBarcode],
+        default_quantity_unit_purchase: QuantityUnit | None,
+    ):
+        """Set the barcodes and purchase unit resolved by a ``ProductCatalog``."""
+        self._barcodes = barcodes
+        self._default_quantity_unit_purchase = default_quantity_unit_purchase
+
+    def _apply_details(self, details: ProductDetailsResponse | None):
         if details:
             self._name = details.product.name
             self._barcodes = [ProductBarcode(barcode) for barcode in details.barcodes]
@@ -187,7 +230,59 @@ class Product(DataModel):
         return self._default_quantity_unit_purchase
 
 
+class VolatileStock(DataModel):
+    __slots__ = (
+        "_due_products",
+        "_overdue_products",
+        "_expired_products",
+        "_missing_products",
+    )
+
+    def __init__(self, response: CurrentVolatilStockResponse):
+        self._due_products = [Product(resp) for resp in response.due_products or []]
+        self._overdue_products = [
+            Product(resp) for resp in response.overdue_products or []
+        ]
+        self._expired_products = [
+            Product(resp) for resp in response.expired_products or []
+        ]
+        self._missing_products = [
+            Product(resp) for resp in response.missing_products or []
+        ]
+
+    @property
+    def due_products(self) -> list[Product]:
+        return self._due_products
+
+    @property
+    def overdue_products(self) -> list[Product]:
+        return self._overdue_products
+
+    @property
+    def expired_products(self) -> list[Product]:
+        return self._expired_products
+
+    @property
+    def missing_products(self) -> list[Product]:
+        return self._missing_products
+
+    @property
+    def all_products(self) -> list[Product]:
+        return [
+            *self._due_products,
+            *self._overdue_products,
+            *self._expired_products,
+            *self._missing_products,
+        ]
+
+
 class Group(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+    )
+
     def __init__(self, raw_product_group: LocationData):
         self._id = raw_product_group.id
         self._name = raw_product_group.name
@@ -206,7 +301,40 @@ class Group(DataModel):
         return self._description
 
 
+class Location(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+    )
+
+    def __init__(self, data: LocationData):
+        self._id = data.id
+        self._name = data.name
+        self._description = data.description
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+
 class ShoppingListProduct(DataModel):
+    __slots__ = (
+        "_id",
+        "_product_id",
+        "_note",
+        "_amount",
+        "_product",
+    )
+
     def __init__(self, raw_shopping_list: ShoppingListItem):
         self._id = raw_shopping_list.id
         self._product_id = raw_shopping_list.product_id
@@ -218,6 +346,10 @@ class ShoppingListProduct(DataModel):
         if self._product_id:
             self._product = Product(api_client.get_product(self._product_id))
 
+    async def async_get_details(self, api_client):
+        if self._product_id:
+            self._product = Product(await api_client.get_product(self._product_id))
+
     @property
     def id(self) -> int:
         return self._id
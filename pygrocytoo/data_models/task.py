@@ -6,6 +6,13 @@ from pygrocytoo.grocy_api_client import TaskCategoryDto, TaskResponse
 
 
 class TaskCategory(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_row_created_timestamp",
+    )
+
     def __init__(self, data: TaskCategoryDto):
         self._id = data.id
         self._name = data.name
@@ -30,6 +37,20 @@ class TaskCategory(DataModel):
 
 
 class Task(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_due_date",
+        "_done",
+        "_done_timestamp",
+        "_category_id",
+        "_category",
+        "_assigned_to_user_id",
+        "_assigned_to_user",
+        "_userfields",
+    )
+
     def __init__(self, response: TaskResponse):
         self._id = response.id
         self._name = response.name
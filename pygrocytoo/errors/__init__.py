@@ -1 +1,2 @@
+from .grocy_details_error import GrocyDetailsError  # noqa: F401
 from .grocy_error import GrocyError  # noqa: F401
@@ -0,0 +1,27 @@
+from .grocy_error import GrocyError
+
+
+class GrocyDetailsError(GrocyError):
+    """Raised when fetching details failed for some items of a list.
+
+    The remaining items are still hydrated and available through ``results``.
+    """
+
+    def __init__(self, results: list, errors: list[tuple[int, GrocyError]]):
+        self._results = results
+        self._errors = errors
+        self._status_code = errors[0][1].status_code
+        self._message = f"{len(errors)} of {len(results)} detail lookups failed"
+        Exception.__init__(self, self._message)
+
+    @property
+    def results(self) -> list:
+        return self._results
+
+    @property
+    def errors(self) -> list[tuple[int, GrocyError]]:
+        return self._errors
+
+    @property
+    def failed_items(self) -> list:
+        return [self._results[index] for index, _ in self._errors]
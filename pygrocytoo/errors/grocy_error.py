@@ -1,8 +1,11 @@
-from requests import Response
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests import Response
 
 
 class GrocyError(Exception):
-    def __init__(self, response: Response):
+    def __init__(self, response: "Response"):
         self._status_code = response.status_code
 
         if len(response.text) > 0:
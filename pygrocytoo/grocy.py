@@ -1,18 +1,22 @@
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import deprecation
 
 from .base import DataModel  # noqa: F401
+from .cache import BarcodeCache, ResponseCache
+from .catalog import ProductCatalog
 from .data_models.battery import Battery
 from .data_models.chore import Chore
 from .data_models.generic import EntityType
 from .data_models.meal_items import MealPlanItem, MealPlanSection, RecipeItem
-from .data_models.product import Group, Product, ShoppingListProduct
+from .data_models.product import Group, Product, ShoppingListProduct, VolatileStock
 from .data_models.system import SystemConfig, SystemInfo, SystemTime
 from .data_models.task import Task
 from .data_models.user import User  # noqa: F401
-from .errors import GrocyError  # noqa: F401
+from .errors import GrocyDetailsError, GrocyError
 from .grocy_api_client import ChoreDetailsResponse  # noqa: F401
 from .grocy_api_client import CurrentChoreResponse  # noqa: F401
 from .grocy_api_client import CurrentStockResponse  # noqa: F401
@@ -24,7 +28,19 @@ from .grocy_api_client import RecipeDetailsResponse  # noqa: F401
 from .grocy_api_client import ShoppingListItem  # noqa: F401
 from .grocy_api_client import TaskResponse  # noqa: F401
 from .grocy_api_client import UserDto  # noqa: F401
-from .grocy_api_client import DEFAULT_PORT_NUMBER, GrocyApiClient, TransactionType
+from .grocy_api_client import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PORT_NUMBER,
+    GrocyApiClient,
+    ObjectsById,
+    TransactionType,
+)
+from .loader import DetailsLoader
+from .stock_table import StockTable
+from .transport import Transport
+
+DEFAULT_MAX_WORKERS = 1
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
@@ -39,56 +55,158 @@ class Grocy(object):
         path: str | None = None,
         verify_ssl=True,
         debug=False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        barcode_cache: BarcodeCache | None = None,
+        transport: Transport | None = None,
     ):
         self._api_client = GrocyApiClient(
-            base_url, api_key, port, path, verify_ssl, debug
+            base_url,
+            api_key,
+            port,
+            path,
+            verify_ssl,
+            debug,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            barcode_cache=barcode_cache,
+            transport=transport,
         )
 
+        self._max_workers = max_workers
+        self._product_catalog: ProductCatalog | None = None
+
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
 
+    def close(self):
+        self._api_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_details(self, items: list):
+        """Fetch the objects referenced by ``items`` in one request per type."""
+        loader = DetailsLoader()
+        loader.request_all(items)
+        loader.load(self._api_client)
+        for item in items:
+            item.apply_details(loader)
+
+    def _get_details(self, items: list, max_workers: int | None = None):
+        """Fetch the details of all items, in parallel when max_workers > 1.
+
+        A failing lookup does not stop the others; all failures are raised
+        together as a GrocyDetailsError once every item was processed.
+        """
+        if max_workers is None:
+            max_workers = self._max_workers
+
+        errors = []
+
+        def get_item_details(index, item):
+            try:
+                item.get_details(self._api_client)
+            except GrocyError as error:
+                errors.append((index, error))
+
+        if max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(min(max_workers, len(items))) as executor:
+                list(executor.map(get_item_details, range(len(items)), items))
+        else:
+            for index, item in enumerate(items):
+                get_item_details(index, item)
+
+        if errors:
+            errors.sort(key=lambda error: error[0])
+            raise GrocyDetailsError(items, errors)
+
     def stock(self) -> list[Product]:
         raw_stock = self._api_client.get_stock()
         return [Product(resp) for resp in raw_stock]
 
+    def stock_table(self, use_numpy: bool | None = None) -> StockTable:
+        """The current stock as a columnar ``StockTable`` for reports."""
+        return StockTable.from_json(self._api_client.get_stock_content(), use_numpy)
+
+    def iter_stock(self) -> Iterator[Product]:
+        """Like ``stock`` but parses the response while it is downloaded."""
+        return (Product(resp) for resp in self._api_client.iter_stock())
+
     @deprecation.deprecated(details="Use due_products instead")
     def expiring_products(self, get_details: bool = False) -> list[Product]:
         return self.due_products(get_details)
 
-    def due_products(self, get_details: bool = False) -> list[Product]:
-        raw_due_products = self._api_client.get_volatile_stock().due_products
+    def volatile_stock(
+        self,
+        get_details: bool = False,
+        *,
+        due_soon_days: int | None = None,
+        max_workers: int | None = None,
+    ) -> VolatileStock:
+        """Due, overdue, expired and missing products from a single request."""
+        volatile_stock = VolatileStock(
+            self._api_client.get_volatile_stock(due_soon_days)
+        )
+
+        if get_details:
+            self._get_details(volatile_stock.all_products, max_workers)
+        return volatile_stock
+
+    def due_products(
+        self,
+        get_details: bool = False,
+        *,
+        due_soon_days: int | None = None,
+        max_workers: int | None = None,
+    ) -> list[Product]:
+        raw_due_products = self._api_client.get_volatile_stock(
+            due_soon_days
+        ).due_products
         due_products = [Product(resp) for resp in raw_due_products]
 
         if get_details:
-            for item in due_products:
-                item.get_details(self._api_client)
+            self._get_details(due_products, max_workers)
         return due_products
 
-    def overdue_products(self, get_details: bool = False) -> list[Product]:
+    def overdue_products(
+        self, get_details: bool = False, *, max_workers: int | None = None
+    ) -> list[Product]:
         raw_overdue_products = self._api_client.get_volatile_stock().overdue_products
         overdue_products = [Product(resp) for resp in raw_overdue_products]
 
         if get_details:
-            for item in overdue_products:
-                item.get_details(self._api_client)
+            self._get_details(overdue_products, max_workers)
         return overdue_products
 
-    def expired_products(self, get_details: bool = False) -> list[Product]:
+    def expired_products(
+        self, get_details: bool = False, *, max_workers: int | None = None
+    ) -> list[Product]:
         raw_expired_products = self._api_client.get_volatile_stock().expired_products
         expired_products = [Product(resp) for resp in raw_expired_products]
 
         if get_details:
-            for item in expired_products:
-                item.get_details(self._api_client)
+            self._get_details(expired_products, max_workers)
         return expired_products
 
-    def missing_products(self, get_details: bool = False) -> list[Product]:
+    def missing_products(
+        self, get_details: bool = False, *, max_workers: int | None = None
+    ) -> list[Product]:
         raw_missing_products = self._api_client.get_volatile_stock().missing_products
         missing_products = [Product(resp) for resp in raw_missing_products]
 
         if get_details:
-            for item in missing_products:
-                item.get_details(self._api_client)
+            self._get_details(missing_products, max_workers)
         return missing_products
 
     def product(self, product_id: int) -> Product:
@@ -104,21 +222,30 @@ class Grocy(object):
         return None
 
     def all_products(self) -> list[Product]:
-        raw_products = self.get_generic_objects_for_type(EntityType.PRODUCTS)
-        from pygrocytoo.grocy_api_client import ProductData
+        return [Product(product) for product in self._api_client.get_products()]
 
-        product_datas = [ProductData(**product) for product in raw_products]
-        return [Product(product) for product in product_datas]
+    def iter_all_products(self) -> Iterator[Product]:
+        return (Product(product) for product in self._api_client.iter_products())
+
+    def product_catalog(self) -> ProductCatalog:
+        """The shared ``ProductCatalog``, loaded or refreshed if the db changed."""
+        if self._product_catalog is None:
+            self._product_catalog = ProductCatalog(self._api_client)
+        self._product_catalog.refresh()
+        return self._product_catalog
 
     def chores(
-        self, get_details: bool = False, query_filters: list[str] | None = None
+        self,
+        get_details: bool = False,
+        query_filters: list[str] | None = None,
+        *,
+        max_workers: int | None = None,
     ) -> list[Chore]:
         raw_chores = self._api_client.get_chores(query_filters)
         chores = [Chore(chore) for chore in raw_chores]
 
         if get_details:
-            for chore in chores:
-                chore.get_details(self._api_client)
+            self._get_details(chores, max_workers)
         return chores
 
     def execute_chore(
@@ -199,6 +326,14 @@ class Grocy(object):
             product.get_details(self._api_client)
         return product
 
+    def _barcode_product_details(self, product: Product, barcode: str) -> Product:
+        """Details after a by-barcode write, refilling the barcode cache if set."""
+        if self._api_client.barcode_cache is None:
+            product.get_details(self._api_client)
+            return product
+        product._apply_details(self._api_client.get_product_by_barcode(barcode))
+        return product
+
     def add_product_by_barcode(
         self,
         barcode: str,
@@ -214,7 +349,7 @@ class Grocy(object):
         )
 
         if get_details:
-            product.get_details(self._api_client)
+            product = self._barcode_product_details(product, barcode)
         return product
 
     def consume_product_by_barcode(
@@ -229,7 +364,7 @@ class Grocy(object):
         )
 
         if get_details:
-            product.get_details(self._api_client)
+            product = self._barcode_product_details(product, barcode)
         return product
 
     def inventory_product_by_barcode(
@@ -248,18 +383,26 @@ class Grocy(object):
         )
 
         if get_details:
-            product.get_details(self._api_client)
+            product = self._barcode_product_details(product, barcode)
         return product
 
     def shopping_list(
-        self, get_details: bool = False, query_filters: list[str] | None = None
+        self,
+        get_details: bool = False,
+        query_filters: list[str] | None = None,
+        *,
+        max_workers: int | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[ShoppingListProduct]:
-        raw_shoppinglist = self._api_client.get_shopping_list(query_filters)
+        raw_shoppinglist = self._api_client.get_shopping_list(
+            query_filters, order, limit, offset
+        )
         shopping_list = [ShoppingListProduct(resp) for resp in raw_shoppinglist]
 
         if get_details:
-            for item in shopping_list:
-                item.get_details(self._api_client)
+            self._get_details(shopping_list, max_workers)
         return shopping_list
 
     def add_missing_product_to_shopping_list(self, shopping_list_id: int = 1):
@@ -286,8 +429,17 @@ class Grocy(object):
             product_id, shopping_list_id, amount
         )
 
-    def product_groups(self, query_filters: list[str] | None = None) -> list[Group]:
-        raw_groups = self._api_client.get_product_groups(query_filters)
+    def product_groups(
+        self,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[Group]:
+        raw_groups = self._api_client.get_product_groups(
+            query_filters, order, limit, offset
+        )
         return [Group(resp) for resp in raw_groups]
 
     def add_product_pic(self, product_id: int, pic_path: str):
@@ -333,14 +485,25 @@ class Grocy(object):
         return self._api_client.complete_task(task_id, done_time)
 
     def meal_plan(
-        self, get_details: bool = False, query_filters: list[str] | None = None
+        self,
+        get_details: bool = False,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[MealPlanItem]:
-        raw_meal_plan = self._api_client.get_meal_plan(query_filters)
+        """The meal plan, with recipes and sections when ``get_details`` is set.
+
+        Details are fetched with one bulk request per entity type.
+        """
+        raw_meal_plan = self._api_client.get_meal_plan(
+            query_filters, order, limit, offset
+        )
         meal_plan = [MealPlanItem(data) for data in raw_meal_plan]
 
         if get_details:
-            for item in meal_plan:
-                item.get_details(self._api_client)
+            self._load_details(meal_plan)
         return meal_plan
 
     def recipe(self, recipe_id: int) -> RecipeItem:
@@ -350,14 +513,17 @@ class Grocy(object):
         return None
 
     def batteries(
-        self, query_filters: list[str] | None = None, get_details: bool = False
+        self,
+        query_filters: list[str] | None = None,
+        get_details: bool = False,
+        *,
+        max_workers: int | None = None,
     ) -> list[Battery]:
         raw_batteries = self._api_client.get_batteries(query_filters)
         batteries = [Battery(bat) for bat in raw_batteries]
 
         if get_details:
-            for item in batteries:
-                item.get_details(self._api_client)
+            self._get_details(batteries, max_workers)
         return batteries
 
     def battery(self, battery_id: int) -> Battery:
@@ -375,6 +541,11 @@ class Grocy(object):
     def get_generic(self, entity_type: EntityType, object_id: int):
         return self._api_client.get_generic(entity_type.value, object_id)
 
+    def get_generic_many(
+        self, entity_type: EntityType, ids: Iterable[int]
+    ) -> ObjectsById:
+        return self._api_client.get_generic_many(entity_type.value, ids)
+
     def update_generic(self, entity_type: EntityType, object_id: int, updated_data):
         return self._api_client.update_generic(
             entity_type.value, object_id, updated_data
@@ -384,16 +555,56 @@ class Grocy(object):
         return self._api_client.delete_generic(entity_type.value, object_id)
 
     def get_generic_objects_for_type(
-        self, entity_type: EntityType, query_filters: list[str] | None = None
+        self,
+        entity_type: EntityType,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ):
         return self._api_client.get_generic_objects_for_type(
-            entity_type.value, query_filters
+            entity_type.value, query_filters, order, limit, offset
+        )
+
+    def iter_generic_object_pages(
+        self,
+        entity_type: EntityType,
+        page_size: int,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+    ) -> Iterator[list[dict]]:
+        """Yield pages of objects, requesting each page only when needed."""
+        return self._api_client.iter_generic_object_pages(
+            entity_type.value, page_size, query_filters, order
+        )
+
+    def iter_generic_objects(
+        self,
+        entity_type: EntityType,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield the objects of ``entity_type`` while the response downloads."""
+        return self._api_client.iter_generic_objects(
+            entity_type.value, query_filters, order, limit, offset
         )
 
     def meal_plan_sections(
-        self, query_filters: list[str] | None = None
+        self,
+        query_filters: list[str] | None = None,
+        *,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[MealPlanSection]:
-        raw_sections = self._api_client.get_meal_plan_sections(query_filters)
+        raw_sections = self._api_client.get_meal_plan_sections(
+            query_filters, order, limit, offset
+        )
         return [MealPlanSection(section) for section in raw_sections]
 
     def meal_plan_section(self, meal_plan_section_id: int) -> MealPlanSection:
@@ -1,19 +1,32 @@
 import base64  # noqa: D100
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 import json
 import logging
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import quote_plus, urljoin
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-import requests
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from .cache import DB_CHANGED_TIME_ENDPOINT, BarcodeCache, ResponseCache
 from .data_models.generic import EntityType
 from .errors import GrocyError
+from .parsing import JsonArrayParser, parse_list, parse_model
+from .singleflight import SingleFlight
+from .transport import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    HttpTransport,
+    Transport,
+)
 from .utils import grocy_datetime_str, localize_datetime, parse_date
 
 DEFAULT_PORT_NUMBER = 9192
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+# Longest URL-encoded ``query[]`` value sent by ``get_generic_many``.
+MAX_ID_FILTER_LENGTH = 2000
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
@@ -30,7 +43,13 @@ def _none_if_empty_str(value: Any):
     return value
 
 
-class ShoppingListItem(BaseModel):
+class _DeferredModel(BaseModel):
+    """Base of the API models, their validators are built on first use."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class ShoppingListItem(_DeferredModel):
     id: int
     product_id: int | None = None
     note: str | None = None
@@ -40,7 +59,7 @@ class ShoppingListItem(BaseModel):
     done: int
 
 
-class MealPlanResponse(BaseModel):
+class MealPlanResponse(_DeferredModel):
     id: int
     day: datetime
     type: str
@@ -55,7 +74,7 @@ class MealPlanResponse(BaseModel):
     section_id: int | None = None
 
 
-class RecipeDetailsResponse(BaseModel):
+class RecipeDetailsResponse(_DeferredModel):
     id: int | None = None
     name: str
     description: str | None = None
@@ -66,7 +85,7 @@ class RecipeDetailsResponse(BaseModel):
     userfields: dict | None = None
 
 
-class QuantityUnitData(BaseModel):
+class QuantityUnitData(_DeferredModel):
     id: int
     name: str
     name_plural: str | None = None
@@ -74,14 +93,14 @@ class QuantityUnitData(BaseModel):
     row_created_timestamp: datetime
 
 
-class LocationData(BaseModel):
+class LocationData(_DeferredModel):
     id: int
     name: str
     description: str | None = None
     row_created_timestamp: datetime
 
 
-class ProductData(BaseModel):
+class ProductData(_DeferredModel):
     id: int
     name: str
     description: str | None = None
@@ -99,7 +118,7 @@ class ProductData(BaseModel):
     product_group_id_validator = _field_not_empty_validator("product_group_id")
 
 
-class ChoreData(BaseModel):
+class ChoreData(_DeferredModel):
     id: int
     name: str
     description: str | None = None
@@ -118,7 +137,7 @@ class ChoreData(BaseModel):
     )
 
 
-class UserDto(BaseModel):
+class UserDto(_DeferredModel):
     id: int
     username: str
     first_name: str | None = None
@@ -126,13 +145,13 @@ class UserDto(BaseModel):
     display_name: str | None = None
 
 
-class CurrentChoreResponse(BaseModel):
+class CurrentChoreResponse(_DeferredModel):
     chore_id: int
     last_tracked_time: datetime | None = None
     next_estimated_execution_time: datetime | None = None
 
 
-class CurrentStockResponse(BaseModel):
+class CurrentStockResponse(_DeferredModel):
     product_id: int
     amount: float
     best_before_date: datetime
@@ -143,26 +162,26 @@ class CurrentStockResponse(BaseModel):
     product: ProductData
 
 
-class MissingProductResponse(BaseModel):
+class MissingProductResponse(_DeferredModel):
     id: int
     name: str
     amount_missing: float
     is_partly_in_stock: bool
 
 
-class CurrentVolatilStockResponse(BaseModel):
+class CurrentVolatilStockResponse(_DeferredModel):
     due_products: list[CurrentStockResponse] | None = None
     overdue_products: list[CurrentStockResponse] | None = None
     expired_products: list[CurrentStockResponse] | None = None
     missing_products: list[MissingProductResponse] | None = None
 
 
-class ProductBarcodeData(BaseModel):
+class ProductBarcodeData(_DeferredModel):
     barcode: str
     amount: float | None = None
 
 
-class ProductDetailsResponse(BaseModel):
+class ProductDetailsResponse(_DeferredModel):
     last_purchased: datetime | None = None
     last_used: datetime | None = None
     stock_amount: float
@@ -176,7 +195,7 @@ class ProductDetailsResponse(BaseModel):
     location: LocationData | None = None
 
 
-class ChoreDetailsResponse(BaseModel):
+class ChoreDetailsResponse(_DeferredModel):
     chore: ChoreData
     last_tracked: datetime | None = None
     next_estimated_execution_time: datetime | None = None
@@ -192,14 +211,14 @@ class TransactionType(Enum):
     PRODUCT_OPENED = "product-opened"
 
 
-class TaskCategoryDto(BaseModel):
+class TaskCategoryDto(_DeferredModel):
     id: int
     name: str
     description: str | None = None
     row_created_timestamp: datetime
 
 
-class TaskResponse(BaseModel):
+class TaskResponse(_DeferredModel):
     id: int
     name: str
     description: str | None = None
@@ -217,13 +236,13 @@ class TaskResponse(BaseModel):
     assigned_to_user_id_validator = _field_not_empty_validator("assigned_to_user_id")
 
 
-class CurrentBatteryResponse(BaseModel):
+class CurrentBatteryResponse(_DeferredModel):
     id: int
     last_tracked_time: datetime | None = None
     next_estimated_charge_time: datetime | None = None
 
 
-class BatteryData(BaseModel):
+class BatteryData(_DeferredModel):
     id: int
     name: str
     description: str | None = None
@@ -233,7 +252,7 @@ class BatteryData(BaseModel):
     userfields: dict | None = None
 
 
-class BatteryDetailsResponse(BaseModel):
+class BatteryDetailsResponse(_DeferredModel):
     battery: BatteryData
     charge_cycles_count: int
     last_charged: datetime | None = None
@@ -241,7 +260,7 @@ class BatteryDetailsResponse(BaseModel):
     next_estimated_charge_time: datetime | None = None
 
 
-class MealPlanSectionResponse(BaseModel):
+class MealPlanSectionResponse(_DeferredModel):
     id: int | None = None
     name: str | None = None
     sort_number: int | None = None
@@ -250,7 +269,7 @@ class MealPlanSectionResponse(BaseModel):
     sort_number_validator = _field_not_empty_validator("sort_number")
 
 
-class StockLogResponse(BaseModel):
+class StockLogResponse(_DeferredModel):
     id: int
     product_id: int
     amount: float
@@ -263,12 +282,12 @@ class StockLogResponse(BaseModel):
     transaction_type: TransactionType
 
 
-class GrocyVersionDto(BaseModel):
+class GrocyVersionDto(_DeferredModel):
     version: str = Field(alias="Version")
     release_date: datetime = Field(alias="ReleaseDate")
 
 
-class SystemInfoDto(BaseModel):
+class SystemInfoDto(_DeferredModel):
     grocy_version_info: GrocyVersionDto = Field(alias="grocy_version")
     php_version: str
     sqlite_version: str
@@ -276,7 +295,7 @@ class SystemInfoDto(BaseModel):
     client: str
 
 
-class SystemTimeDto(BaseModel):
+class SystemTimeDto(_DeferredModel):
     timezone: str
     time_local: datetime
     time_local_sqlite3: datetime
@@ -284,7 +303,7 @@ class SystemTimeDto(BaseModel):
     timestamp: int
 
 
-class SystemConfigDto(BaseModel, extra="allow"):
+class SystemConfigDto(_DeferredModel, extra="allow"):
     username: str = Field(alias="USER_USERNAME")
     base_path: str = Field(alias="BASE_PATH")
     base_url: str = Field(alias="BASE_URL")
@@ -309,6 +328,93 @@ class SystemConfigDto(BaseModel, extra="allow"):
         return data
 
 
+def _build_base_url(base_url, port: int, path: str | None) -> str:
+    if path:
+        return f"{base_url}:{port}/{path}/api/"
+    return f"{base_url}:{port}/api/"
+
+
+def _build_headers(api_key) -> dict[str, str]:
+    if api_key == "demo_mode":
+        return {"accept": "application/json"}
+    return {"accept": "application/json", "GROCY-API-KEY": api_key}
+
+
+def _build_params(
+    query_filters: list[str] | None, params: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
+    if query_filters:
+        params = {**(params or {}), "query[]": query_filters}
+    return params or None
+
+
+def _page_params(
+    order: str | None, limit: int | None, offset: int | None
+) -> dict[str, Any] | None:
+    """Query parameters for sorting and paging an ``objects/*`` endpoint."""
+    params = {"order": order, "limit": limit, "offset": offset}
+    return {name: value for name, value in params.items() if value is not None} or None
+
+
+class ObjectsById(dict):
+    """Generic objects keyed by id, plus the requested ids that were missing."""
+
+    def __init__(self, objects: dict[int, dict], missing: Iterable[int] = ()):
+        super().__init__(objects)
+        self._missing = tuple(missing)
+
+    @property
+    def missing(self) -> tuple[int, ...]:
+        return self._missing
+
+
+def _id_filter(ids: list[int]) -> str:
+    return "id§^(" + "|".join(str(object_id) for object_id in ids) + ")$"
+
+
+_ID_FILTER_OVERHEAD = len(quote_plus(_id_filter([])))
+_ID_SEPARATOR_LENGTH = len(quote_plus("|"))
+
+
+def _id_filters(ids: list[int], max_length: int = MAX_ID_FILTER_LENGTH) -> list[str]:
+    """Split ``ids`` into regex filters that each stay below ``max_length``."""
+    filters = []
+    chunk: list[int] = []
+    length = _ID_FILTER_OVERHEAD
+    for object_id in ids:
+        id_length = len(str(object_id)) + _ID_SEPARATOR_LENGTH
+        if chunk and length + id_length > max_length:
+            filters.append(_id_filter(chunk))
+            chunk = []
+            length = _ID_FILTER_OVERHEAD
+        chunk.append(object_id)
+        length += id_length
+    if chunk:
+        filters.append(_id_filter(chunk))
+    return filters
+
+
+def _objects_by_id(ids: list[int], pages: Iterable[list | None]) -> ObjectsById:
+    found = {int(obj["id"]): obj for page in pages for obj in page or []}
+    missing = [object_id for object_id in ids if object_id not in found]
+    if missing:
+        _LOGGER.debug("%d of %d requested ids not found", len(missing), len(ids))
+    return ObjectsById(found, missing)
+
+
+def _request_key(end_url: str, params: dict[str, Any] | None) -> tuple:
+    """Hashable key of a GET request, used for caching and coalescing."""
+    if not params:
+        return (end_url, ())
+    frozen = tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in params.items()
+        )
+    )
+    return (end_url, frozen)
+
+
 def _enable_debug_mode():
     _LOGGER.setLevel(logging.DEBUG)
 
@@ -322,31 +428,127 @@ class GrocyApiClient(object):
         path: str | None = None,
         verify_ssl=True,
         debug=False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        barcode_cache: BarcodeCache | None = None,
+        transport: Transport | None = None,
     ):
         if debug:
             _enable_debug_mode()
 
-        if path:
-            self._base_url = f"{base_url}:{port}/{path}/api/"
-        else:
-            self._base_url = f"{base_url}:{port}/api/"
+        self._base_url = _build_base_url(base_url, port, path)
         _LOGGER.debug(f"generated base url: {self._base_url}")
 
         self._api_key = api_key
         self._verify_ssl = verify_ssl
-        if self._api_key == "demo_mode":
-            self._headers = {"accept": "application/json"}
+        self._headers = _build_headers(api_key)
+
+        if transport is None:
+            transport = HttpTransport(
+                pool_connections, pool_maxsize, pool_block, verify_ssl
+            )
+        self._transport = transport
+        self._pool_maxsize = pool_maxsize
+        self._cache = cache
+        self._barcode_cache = barcode_cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+
+    def close(self):
+        """Close all pooled connections held by this client."""
+        self._transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def barcode_cache(self) -> BarcodeCache | None:
+        return self._barcode_cache
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of GET requests answered by an identical in-flight request."""
+        if self._single_flight is None:
+            return 0
+        return self._single_flight.coalesced
+
+    def _invalidate_cache(self, end_url: str):
+        if self._single_flight is not None:
+            # GETs issued from now on must not get a response from before.
+            self._single_flight.forget()
+        if self._cache is not None:
+            self._cache.invalidate_for_write(end_url)
+        if self._barcode_cache is not None:
+            self._barcode_cache.invalidate_for_write(end_url)
+
+    def _check_barcode(self, barcode: str):
+        """Raise the cached error of a barcode known to be unknown."""
+        if self._barcode_cache is not None:
+            self._barcode_cache.raise_if_unknown(barcode)
+
+    def _forget_barcode_product(self, stock_log: StockLogResponse | None):
+        """Drop the cached barcodes of the product a by-barcode write changed."""
+        if self._barcode_cache is None:
+            return
+        if stock_log is None:
+            self._barcode_cache.clear()
         else:
-            self._headers = {"accept": "application/json", "GROCY-API-KEY": api_key}
+            self._barcode_cache.invalidate_product(stock_log.product_id)
+
+    def _validate_cache(self):
+        """Probe the db change time if due and flush the cache if it moved."""
+        if not self._cache.claim_probe():
+            return
+        self._cache.verify_server(self._fetch)
+        content = self._fetch(DB_CHANGED_TIME_ENDPOINT)
+        changed_time = json.loads(content).get("changed_time")
+        if self._cache.update_db_changed_time(changed_time):
+            _LOGGER.debug("Database changed at %s, cache flushed", changed_time)
+
+    def _get_content(self, end_url: str, params: dict[str, Any] | None = None) -> bytes:
+        """Return the raw body of a GET request, served from the cache if set."""
+        key = _request_key(end_url, params)
+        if self._cache is not None:
+            self._validate_cache()
+            content = self._cache.get(key)
+            if content is not None:
+                _LOGGER.debug("-->\tGET /%s (cached)", end_url)
+                return content
+
+        if self._single_flight is None:
+            return self._fetch_into_cache(key, end_url, params)
+        return self._single_flight.do(
+            key, lambda: self._fetch_into_cache(key, end_url, params)
+        )
 
-    def _do_get_request(self, end_url: str, query_filters: list[str] | None = None):
+    def _fetch_into_cache(
+        self, key: tuple, end_url: str, params: dict[str, Any] | None
+    ) -> bytes:
+        if self._cache is None:
+            return self._fetch(end_url, params)
+        # A write finishing while the request is in flight invalidates the
+        # cache; the response may predate it and must not be stored then.
+        generation = self._cache.generation
+        content = self._fetch(end_url, params)
+        self._cache.set(key, content, generation)
+        return content
+
+    def _fetch(self, end_url: str, params: dict[str, Any] | None = None) -> bytes:
         req_url = urljoin(self._base_url, end_url)
-        params = None
-        if query_filters:
-            params = {"query[]": query_filters}
-        resp = requests.get(
-            req_url, verify=self._verify_ssl, headers=self._headers, params=params
-        )
+        resp = self._transport.request("GET", req_url, self._headers, params)
 
         _LOGGER.debug("-->\tGET /%s", end_url)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
@@ -354,21 +556,82 @@ class GrocyApiClient(object):
 
         if resp.status_code >= 400:
             raise GrocyError(resp)
+        return resp.content
 
-        if len(resp.content) > 0:
-            return resp.json()
+    def _do_get_request(
+        self,
+        end_url: str,
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ):
+        content = self._get_content(end_url, _build_params(query_filters, params))
+        if len(content) > 0:
+            return json.loads(content)
         return None
 
+    def _do_get_list_request(
+        self,
+        end_url: str,
+        model: type[BaseModel],
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list:
+        content = self._get_content(end_url, _build_params(query_filters, params))
+        return parse_list(model, content)
+
+    def _do_get_model_request(
+        self,
+        end_url: str,
+        model: type[BaseModel],
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ):
+        content = self._get_content(end_url, _build_params(query_filters, params))
+        return parse_model(model, content)
+
+    def _iter_get_request(
+        self,
+        end_url: str,
+        query_filters: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator:
+        """Yield the items of a JSON array response while it is downloaded.
+
+        Streamed responses bypass the response cache and request coalescing.
+        """
+        req_url = urljoin(self._base_url, end_url)
+        with self._transport.request(
+            "GET",
+            req_url,
+            self._headers,
+            _build_params(query_filters, params),
+            stream=True,
+        ) as resp:
+            _LOGGER.debug("-->\tGET /%s (streamed)", end_url)
+            _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+
+            if resp.status_code >= 400:
+                raise GrocyError(resp)
+
+            parser = JsonArrayParser()
+            for chunk in resp.iter_content(DEFAULT_STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+
     def _do_post_request(self, end_url: str, data: dict):
         req_url = urljoin(self._base_url, end_url)
-        resp = requests.post(
-            req_url, verify=self._verify_ssl, headers=self._headers, json=data
-        )
+        headers = self._headers
+        body = None
+        if data is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+            body = json.dumps(data)
+        resp = self._transport.request("POST", req_url, headers, body=body)
 
         _LOGGER.debug("-->\tPOST /%s", end_url)
         _LOGGER.debug("\t\t%s", data)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
         _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
 
         if resp.status_code >= 400:
             raise GrocyError(resp)
@@ -385,14 +648,13 @@ class GrocyApiClient(object):
             data = json.dumps(data)
         else:
             up_header["Content-Type"] = "application/octet-stream"
-        resp = requests.put(
-            req_url, verify=self._verify_ssl, headers=up_header, data=data
-        )
+        resp = self._transport.request("PUT", req_url, up_header, body=data)
 
         _LOGGER.debug("-->\tPUT /%s", end_url)
         _LOGGER.debug("\t\t%s", data)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
         _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
 
         if resp.status_code >= 400:
             raise GrocyError(resp)
@@ -403,11 +665,12 @@ class GrocyApiClient(object):
 
     def _do_delete_request(self, end_url: str):
         req_url = urljoin(self._base_url, end_url)
-        resp = requests.delete(req_url, verify=self._verify_ssl, headers=self._headers)
+        resp = self._transport.request("DELETE", req_url, self._headers)
 
         _LOGGER.debug("-->\tDELETE /%s", end_url)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
         _LOGGER.debug("\t\t%s", resp.content)
+        self._invalidate_cache(end_url)
 
         if resp.status_code >= 400:
             raise GrocyError(resp)
@@ -417,43 +680,54 @@ class GrocyApiClient(object):
         return None
 
     def get_stock(self) -> list[CurrentStockResponse]:
-        parsed_json = self._do_get_request("stock")
-        if parsed_json:
-            return [CurrentStockResponse(**response) for response in parsed_json]
-        return []
+        return self._do_get_list_request("stock", CurrentStockResponse)
 
-    def get_volatile_stock(self) -> CurrentVolatilStockResponse:
-        parsed_json = self._do_get_request("stock/volatile")
-        return CurrentVolatilStockResponse(**parsed_json)
+    def get_stock_content(self) -> bytes:
+        """The raw JSON body of ``GET /stock``, served from the cache if set."""
+        return self._get_content("stock")
+
+    def iter_stock(self) -> Iterator[CurrentStockResponse]:
+        for data in self._iter_get_request("stock"):
+            yield CurrentStockResponse.model_validate(data)
+
+    def get_volatile_stock(
+        self, due_soon_days: int | None = None
+    ) -> CurrentVolatilStockResponse:
+        params = None
+        if due_soon_days is not None:
+            params = {"due_soon_days": due_soon_days}
+        volatile_stock = self._do_get_model_request(
+            "stock/volatile", CurrentVolatilStockResponse, params=params
+        )
+        return volatile_stock or CurrentVolatilStockResponse()
 
     def get_product(self, product_id) -> ProductDetailsResponse:
         url = f"stock/products/{product_id}"
-        parsed_json = self._do_get_request(url)
-        if parsed_json:
-            return ProductDetailsResponse(**parsed_json)
-        return None
+        return self._do_get_model_request(url, ProductDetailsResponse)
 
     def get_product_by_barcode(self, barcode) -> ProductDetailsResponse:
         url = f"stock/products/by-barcode/{barcode}"
-        parsed_json = self._do_get_request(url)
-        if parsed_json:
-            return ProductDetailsResponse(**parsed_json)
-        return None
+        if self._barcode_cache is None:
+            return self._do_get_model_request(url, ProductDetailsResponse)
+
+        details = self._barcode_cache.get(barcode)
+        if details is None:
+            try:
+                details = self._do_get_model_request(url, ProductDetailsResponse)
+            except GrocyError as error:
+                self._barcode_cache.set_unknown(barcode, error)
+                raise
+            self._barcode_cache.set(barcode, details)
+        return details
 
     def get_chores(
         self, query_filters: list[str] | None = None
     ) -> list[CurrentChoreResponse]:
-        parsed_json = self._do_get_request("chores", query_filters)
-        if parsed_json:
-            return [CurrentChoreResponse(**chore) for chore in parsed_json]
-        return []
+        return self._do_get_list_request("chores", CurrentChoreResponse, query_filters)
 
     def get_chore(self, chore_id: int) -> ChoreDetailsResponse:
         url = f"chores/{chore_id}"
-        parsed_json = self._do_get_request(url)
-        if parsed_json:
-            return ChoreDetailsResponse(**parsed_json)
-        return None
+        return self._do_get_model_request(url, ChoreDetailsResponse)
 
     def execute_chore(
         self,
@@ -585,14 +859,15 @@ class GrocyApiClient(object):
                 "%Y-%m-%d"
             )
 
+        self._check_barcode(barcode)
         parsed_json = self._do_post_request(
             f"stock/products/by-barcode/{barcode}/add", data
         )
-
+        stock_log = None
         if parsed_json:
-            stock_log = [StockLogResponse(**response) for response in parsed_json]
-            return stock_log[0]
-        return None
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
 
     def consume_product_by_barcode(
         self, barcode: str, amount: float = 1, spoiled: bool = False
@@ -603,14 +878,15 @@ class GrocyApiClient(object):
             "transaction_type": TransactionType.CONSUME.value,
         }
 
+        self._check_barcode(barcode)
         parsed_json = self._do_post_request(
             f"stock/products/by-barcode/{barcode}/consume", data
         )
-
+        stock_log = None
         if parsed_json:
-            stock_log = [StockLogResponse(**response) for response in parsed_json]
-            return stock_log[0]
-        return None
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
 
     def inventory_product_by_barcode(
         self,
@@ -635,22 +911,29 @@ class GrocyApiClient(object):
         if price is not None:
             data["price"] = price
 
+        self._check_barcode(barcode)
         parsed_json = self._do_post_request(
             f"stock/products/by-barcode/{barcode}/inventory", data
         )
-
+        stock_log = None
         if parsed_json:
-            stock_log = [StockLogResponse(**response) for response in parsed_json]
-            return stock_log[0]
-        return None
+            stock_log = StockLogResponse(**parsed_json[0])
+        self._forget_barcode_product(stock_log)
+        return stock_log
 
     def get_shopping_list(
-        self, query_filters: list[str] = None
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[ShoppingListItem]:
-        parsed_json = self._do_get_request("objects/shopping_list", query_filters)
-        if parsed_json:
-            return [ShoppingListItem(**response) for response in parsed_json]
-        return []
+        return self._do_get_list_request(
+            "objects/shopping_list",
+            ShoppingListItem,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
 
     def add_missing_product_to_shopping_list(self, shopping_list_id: int = None):
         data = None
@@ -691,12 +974,18 @@ class GrocyApiClient(object):
         self._do_post_request("stock/shoppinglist/remove-product", data)
 
     def get_product_groups(
-        self, query_filters: list[str] | None = None
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[LocationData]:
-        parsed_json = self._do_get_request("objects/product_groups", query_filters)
-        if parsed_json:
-            return [LocationData(**response) for response in parsed_json]
-        return []
+        return self._do_get_list_request(
+            "objects/product_groups",
+            LocationData,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
 
     def upload_product_picture(self, product_id: int, pic_path: str):
         b64fn = base64.b64encode(f"{product_id}.jpg".encode("ascii"))
@@ -722,31 +1011,22 @@ class GrocyApiClient(object):
         return parse_date(resp.get("changed_time"))
 
     def get_system_info(self) -> SystemInfoDto:
-        parsed_json = self._do_get_request("system/info")
-        if parsed_json:
-            return SystemInfoDto(**parsed_json)
+        return self._do_get_model_request("system/info", SystemInfoDto)
 
     def get_system_time(self) -> SystemTimeDto:
-        parsed_json = self._do_get_request("system/time")
-        if parsed_json:
-            return SystemTimeDto(**parsed_json)
+        return self._do_get_model_request("system/time", SystemTimeDto)
 
     def get_system_config(self) -> SystemConfigDto:
-        parsed_json = self._do_get_request("system/config")
-        _LOGGER.debug("System config: %s", parsed_json)
-        if parsed_json:
-            return SystemConfigDto(**parsed_json)
+        system_config = self._do_get_model_request("system/config", SystemConfigDto)
+        _LOGGER.debug("System config: %s", system_config)
+        return system_config
 
     def get_tasks(self, query_filters: list[str] | None = None) -> list[TaskResponse]:
-        parsed_json = self._do_get_request("tasks", query_filters)
-        if parsed_json:
-            return [TaskResponse(**data) for data in parsed_json]
-        return []
+        return self._do_get_list_request("tasks", TaskResponse, query_filters)
 
     def get_task(self, task_id: int) -> TaskResponse:
         url = f"objects/tasks/{task_id}"
-        parsed_json = self._do_get_request(url)
-        return TaskResponse(**parsed_json)
+        return self._do_get_model_request(url, TaskResponse)
 
     def complete_task(self, task_id: int, done_time: datetime | None = None):
         url = f"tasks/{task_id}/complete"
@@ -760,32 +1040,35 @@ class GrocyApiClient(object):
         self._do_post_request(url, data)
 
     def get_meal_plan(
-        self, query_filters: list[str] | None = None
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[MealPlanResponse]:
-        parsed_json = self._do_get_request("objects/meal_plan", query_filters)
-        if parsed_json:
-            return [MealPlanResponse(**data) for data in parsed_json]
-        return []
+        return self._do_get_list_request(
+            "objects/meal_plan",
+            MealPlanResponse,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
 
     def get_recipe(self, object_id: int) -> RecipeDetailsResponse:
-        parsed_json = self._do_get_request(f"objects/recipes/{object_id}")
-        if parsed_json:
-            return RecipeDetailsResponse(**parsed_json)
-        return None
+        return self._do_get_model_request(
+            f"objects/recipes/{object_id}", RecipeDetailsResponse
+        )
 
     def get_batteries(
         self, query_filters: list[str] | None = None
     ) -> list[CurrentBatteryResponse]:
-        parsed_json = self._do_get_request("batteries", query_filters)
-        if parsed_json:
-            return [CurrentBatteryResponse(**data) for data in parsed_json]
-        return []
+        return self._do_get_list_request(
+            "batteries", CurrentBatteryResponse, query_filters
+        )
 
     def get_battery(self, battery_id: int) -> BatteryDetailsResponse:
-        parsed_json = self._do_get_request(f"batteries/{battery_id}")
-        if parsed_json:
-            return BatteryDetailsResponse(**parsed_json)
-        return None
+        return self._do_get_model_request(
+            f"batteries/{battery_id}", BatteryDetailsResponse
+        )
 
     def charge_battery(self, battery_id: int, tracked_time: datetime | None = None):
         if tracked_time is None:
@@ -802,6 +1085,32 @@ class GrocyApiClient(object):
     def get_generic(self, entity_type: str, object_id: int):
         return self._do_get_request(f"objects/{entity_type}/{object_id}")
 
+    def get_generic_many(self, entity_type: str, ids: Iterable[int]) -> ObjectsById:
+        """Fetch the objects of ``entity_type`` with the given ids.
+
+        The ids are sent as regex ``query[]`` filters, split so URLs stay
+        short, and the chunks are requested concurrently. Ids that do not exist
+        are listed in ``missing`` of the result instead of raising.
+        """
+        wanted = sorted({int(object_id) for object_id in ids})
+        filters = _id_filters(wanted)
+        end_url = f"objects/{entity_type}"
+
+        if len(filters) <= 1:
+            pages = [
+                self._do_get_request(end_url, [id_filter]) for id_filter in filters
+            ]
+        else:
+            max_workers = min(len(filters), self._pool_maxsize)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = list(
+                    executor.map(
+                        lambda id_filter: self._do_get_request(end_url, [id_filter]),
+                        filters,
+                    )
+                )
+        return _objects_by_id(wanted, pages)
+
     def update_generic(self, entity_type: str, object_id: int, data):
         return self._do_put_request(f"objects/{entity_type}/{object_id}", data)
 
@@ -809,19 +1118,85 @@ class GrocyApiClient(object):
         return self._do_delete_request(f"objects/{entity_type}/{object_id}")
 
     def get_generic_objects_for_type(
-        self, entity_type: str, query_filters: list[str] | None = None
+        self,
+        entity_type: str,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ):
-        return self._do_get_request(f"objects/{entity_type}", query_filters)
+        return self._do_get_request(
+            f"objects/{entity_type}", query_filters, _page_params(order, limit, offset)
+        )
 
-    def get_meal_plan_sections(
+    def iter_generic_object_pages(
+        self,
+        entity_type: str,
+        page_size: int,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+    ) -> Iterator[list[dict]]:
+        """Yield the objects of ``entity_type`` in pages of ``page_size``.
+
+        A page is only requested once the previous one has been consumed. Pass
+        ``order`` so that pages are taken from a stable sort order.
+        """
+        offset = 0
+        while True:
+            page = self.get_generic_objects_for_type(
+                entity_type, query_filters, order, page_size, offset
+            )
+            if page:
+                yield page
+            if not page or len(page) < page_size:
+                return
+            offset += page_size
+
+    def iter_generic_objects(
+        self,
+        entity_type: str,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Iterator[dict]:
+        return self._iter_get_request(
+            f"objects/{entity_type}", query_filters, _page_params(order, limit, offset)
+        )
+
+    def iter_products(
         self, query_filters: list[str] | None = None
+    ) -> Iterator[ProductData]:
+        for data in self.iter_generic_objects(EntityType.PRODUCTS.value, query_filters):
+            yield ProductData.model_validate(data)
+
+    def get_products(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ProductData]:
+        return self._do_get_list_request(
+            f"objects/{EntityType.PRODUCTS.value}",
+            ProductData,
+            query_filters,
+            _page_params(order, limit, offset),
+        )
+
+    def get_meal_plan_sections(
+        self,
+        query_filters: list[str] | None = None,
+        order: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> list[MealPlanSectionResponse]:
-        parsed_json = self.get_generic_objects_for_type(
-            EntityType.MEAL_PLAN_SECTIONS, query_filters
+        return self._do_get_list_request(
+            f"objects/{EntityType.MEAL_PLAN_SECTIONS.value}",
+            MealPlanSectionResponse,
+            query_filters,
+            _page_params(order, limit, offset),
         )
-        if parsed_json:
-            return [MealPlanSectionResponse(**resp) for resp in parsed_json]
-        return []
 
     def get_meal_plan_section(self, meal_plan_section_id) -> MealPlanSectionResponse:
         parsed_json = self._do_get_request(
@@ -832,10 +1207,7 @@ class GrocyApiClient(object):
         return None
 
     def get_users(self) -> list[UserDto]:
-        parsed_json = self._do_get_request("users")
-        if parsed_json:
-            return [UserDto(**user) for user in parsed_json]
-        return []
+        return self._do_get_list_request("users", UserDto)
 
     def get_user(self, user_id: int) -> UserDto:
         query_params = []
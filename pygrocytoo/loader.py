@@ -0,0 +1,81 @@
+from collections.abc import Iterable
+
+from pydantic import BaseModel
+
+from .data_models.generic import EntityType
+from .grocy_api_client import GrocyApiClient, ObjectsById
+
+
+class DetailsLoader(object):
+    """Batch the generic object lookups of many models into bulk requests.
+
+    Models first ``request`` the ids they need, ``load`` then fetches every
+    entity type with a single ``get_generic_many`` call (deduplicating shared
+    ids) and ``get`` hands each model its row afterwards.
+    """
+
+    def __init__(self):
+        self._requested: dict[EntityType, set[int]] = {}
+        self._loaded: dict[EntityType, ObjectsById] = {}
+        self._models: dict[tuple, BaseModel] = {}
+
+    def request(self, entity_type: EntityType, object_id: int):
+        if object_id is not None:
+            self._requested.setdefault(entity_type, set()).add(int(object_id))
+
+    def request_all(self, items: Iterable):
+        for item in items:
+            item.request_details(self)
+
+    def _pending(self) -> dict[EntityType, set[int]]:
+        pending = {}
+        for entity_type, ids in self._requested.items():
+            loaded = self._loaded.get(entity_type)
+            if loaded is not None:
+                ids = ids.difference(loaded, loaded.missing)
+            if ids:
+                pending[entity_type] = ids
+        return pending
+
+    def _store(self, entity_type: EntityType, objects: ObjectsById):
+        loaded = self._loaded.get(entity_type)
+        if loaded is not None:
+            objects = ObjectsById(
+                {**loaded, **objects}, [*loaded.missing, *objects.missing]
+            )
+        self._loaded[entity_type] = objects
+
+    def load(self, api_client: GrocyApiClient):
+        """Fetch all requested ids that are not loaded yet."""
+        for entity_type, ids in self._pending().items():
+            self._store(
+                entity_type, api_client.get_generic_many(entity_type.value, ids)
+            )
+
+    async def async_load(self, api_client):
+        import asyncio
+
+        pending = self._pending()
+        results = await asyncio.gather(
+            *(
+                api_client.get_generic_many(entity_type.value, ids)
+                for entity_type, ids in pending.items()
+            )
+        )
+        for entity_type, objects in zip(pending, results):
+            self._store(entity_type, objects)
+
+    def get(self, entity_type: EntityType, object_id: int, model: type[BaseModel]):
+        """Return the loaded row of ``object_id`` as ``model``, None if missing.
+
+        Rows shared by several models are only validated once.
+        """
+        if object_id is None:
+            return None
+        key = (entity_type, int(object_id), model)
+        if key not in self._models:
+            row = self._loaded.get(entity_type, {}).get(int(object_id))
+            if row is None:
+                return None
+            self._models[key] = model(**row)
+        return self._models[key]
@@ -0,0 +1,134 @@
+import codecs
+import functools
+import json
+
+from pydantic import BaseModel, TypeAdapter
+
+_EMPTY_BODIES = (b"", b"null", b"{}", b"[]")
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+@functools.cache
+def _adapter(annotation) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _is_empty(content: bytes) -> bool:
+    return len(content) <= 4 and content.strip() in _EMPTY_BODIES
+
+
+def parse_model(model: type[BaseModel], content: bytes):
+    """Validate a raw JSON object into ``model``, None for an empty body.
+
+    The bytes are handed to pydantic-core as is, which is cheaper than
+    ``json.loads`` followed by ``model(**data)``.
+    """
+    if _is_empty(content):
+        return None
+    return _adapter(model).validate_json(content)
+
+
+def parse_list(model: type[BaseModel], content: bytes) -> list:
+    """Validate a raw JSON array into ``model`` instances in a single pass."""
+    if _is_empty(content):
+        return []
+    return _adapter(list[model]).validate_json(content)
+
+
+class JsonArrayParser(object):
+    """Incrementally parse the items of a JSON array fed in chunks.
+
+    ``feed`` returns the items completed by each chunk, so only the undecoded
+    tail of the body is held in memory. A ``null`` or empty body yields no
+    items.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._expect_comma = False
+        self._after_comma = False
+
+    def feed(self, chunk: bytes) -> list:
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        """Parse what is left and check that the array was complete."""
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._started and not self._finished:
+            raise ValueError("Truncated JSON array")
+        if self._buffer.strip(_WHITESPACE):
+            raise ValueError("Unexpected data after JSON array")
+        return items
+
+    def _parse(self, final: bool) -> list:
+        items = []
+        buffer = self._buffer
+        pos = _skip_whitespace(buffer, 0)
+
+        if not self._started and pos < len(buffer):
+            if buffer.startswith("null", pos):
+                self._started = self._finished = True
+                pos += 4
+            elif "null".startswith(buffer[pos:]) and not final:
+                return items
+            elif buffer[pos] == "[":
+                self._started = True
+                pos += 1
+            else:
+                raise ValueError("Response is not a JSON array")
+
+        while self._started and not self._finished:
+            pos = _skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                if self._after_comma:
+                    raise ValueError("Trailing ',' in JSON array")
+                self._finished = True
+                pos += 1
+                break
+            if self._expect_comma:
+                if buffer[pos] != ",":
+                    raise ValueError(f"Expected ',' in JSON array, got {buffer[pos]!r}")
+                self._expect_comma = False
+                self._after_comma = True
+                pos += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # A number is only complete once a delimiter follows it.
+            if not final and _is_number(item) and not _has_delimiter(buffer, end):
+                break
+            items.append(item)
+            self._expect_comma = True
+            self._after_comma = False
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _has_delimiter(text: str, pos: int) -> bool:
+    return pos < len(text) and text[pos] in _DELIMITERS
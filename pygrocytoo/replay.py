@@ -0,0 +1,150 @@
+import base64
+import gzip
+import json
+import threading
+import time
+from typing import Any
+
+from .transport import Transport, TransportResponse, _request_target
+
+RECORDING_VERSION = 1
+
+
+def _encode_content(content: bytes) -> str | dict:
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_content(content: str | dict) -> bytes:
+    if isinstance(content, dict):
+        return base64.b64decode(content["base64"])
+    return content.encode("utf-8")
+
+
+class RecordingTransport(Transport):
+    """Records the traffic of another transport for ``ReplayTransport``.
+
+    Every request is passed on to ``transport`` and its method, target, status,
+    response body, start offset and duration are kept in order. ``save``
+    writes them as gzip compressed JSON with identical bodies stored once;
+    request headers, and with them the API key, are not recorded. Streamed
+    responses are read completely while recording.
+    """
+
+    def __init__(self, transport: Transport, path: str | None = None):
+        self._transport = transport
+        self._path = path
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._exchanges: list[dict] = []
+        self._bodies: dict[bytes, int] = {}
+
+    @property
+    def exchanges(self) -> list[dict]:
+        """The recorded requests, ``body`` indexes the saved bodies."""
+        return list(self._exchanges)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        start = time.perf_counter()
+        response = self._transport.request(method, url, headers, params, body)
+        content = response.content
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            body_index = self._bodies.setdefault(content, len(self._bodies))
+            self._exchanges.append(
+                {
+                    "method": method,
+                    "target": _request_target(url, params),
+                    "status": response.status_code,
+                    "body": body_index,
+                    "offset": round(start - self._started, 6),
+                    "elapsed": round(elapsed, 6),
+                }
+            )
+        return TransportResponse(response.status_code, dict(response.headers), content)
+
+    def save(self, path: str | None = None):
+        """Write the recording to ``path``, by default the one given at init."""
+        with self._lock:
+            recording = {
+                "version": RECORDING_VERSION,
+                "bodies": [_encode_content(content) for content in self._bodies],
+                "exchanges": list(self._exchanges),
+            }
+        with gzip.open(path or self._path, "wt", encoding="utf-8") as file:
+            json.dump(recording, file, separators=(",", ":"))
+
+    def close(self):
+        """Save the recording if a path was given and close the transport."""
+        if self._path is not None:
+            self.save()
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests from a recording made by ``RecordingTransport``.
+
+    Requests are matched on method and target. Repeated requests get the
+    recorded responses in their original order and start over once all were
+    served, so one recording can be replayed any number of times. Each
+    response is delayed by its recorded duration times ``latency_scale``;
+    0 replays without any delay.
+    """
+
+    def __init__(self, path: str, latency_scale: float = 1.0):
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            recording = json.load(file)
+        if recording.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version in {path}")
+
+        bodies = [_decode_content(content) for content in recording["bodies"]]
+        self._exchanges: dict[tuple[str, str], list[tuple[int, bytes, float]]] = {}
+        for exchange in recording["exchanges"]:
+            key = (exchange["method"], exchange["target"])
+            self._exchanges.setdefault(key, []).append(
+                (exchange["status"], bodies[exchange["body"]], exchange["elapsed"])
+            )
+        self.latency_scale = latency_scale
+        self.served = 0
+        self._cursors = dict.fromkeys(self._exchanges, 0)
+        self._lock = threading.Lock()
+
+    def rewind(self):
+        """Serve every request's responses from the first one again."""
+        with self._lock:
+            self._cursors = dict.fromkeys(self._exchanges, 0)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        key = (method, _request_target(url, params))
+        responses = self._exchanges.get(key)
+        if responses is None:
+            raise LookupError(f"No recorded response for {method} {key[1]}")
+        with self._lock:
+            index = self._cursors[key]
+            self._cursors[key] = (index + 1) % len(responses)
+            self.served += 1
+        status_code, content, elapsed = responses[index]
+        if self.latency_scale:
+            time.sleep(elapsed * self.latency_scale)
+        return TransportResponse(
+            status_code, {"Content-Length": str(len(content))}, content
+        )
@@ -0,0 +1,118 @@
+from collections.abc import Awaitable, Callable, Hashable
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class _AsyncCall(object):
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """Coalesce concurrent calls sharing a key into a single execution.
+
+    While a call for a key is running, other threads calling ``do`` with the
+    same key wait for it and receive its result (or exception) instead of
+    running ``fn`` themselves. ``forget`` makes later calls start a new
+    execution, e.g. after a write made the running ones outdated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's execution."""
+        return self._coalesced
+
+    def forget(self):
+        """Let later calls run ``fn`` again instead of joining running calls."""
+        with self._lock:
+            self._calls.clear()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight(object):
+    """Asyncio version of ``SingleFlight`` for coroutines of one event loop.
+
+    ``fn`` runs in its own task, so cancelling one caller does not cancel the
+    others; the task itself is only cancelled once every caller waiting for it
+    was. ``asyncio`` is only imported once a call is made, so synchronous
+    users of this module do not pay for it.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _AsyncCall] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's execution."""
+        return self._coalesced
+
+    def forget(self):
+        """Let later calls run ``fn`` again instead of joining running calls."""
+        self._calls.clear()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]):
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is not None:
+            self._coalesced += 1
+        else:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._remove(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._remove(key, call)
+                call.task.cancel()
+
+    def _remove(self, key: Hashable, call: _AsyncCall):
+        if self._calls.get(key) is call:
+            del self._calls[key]
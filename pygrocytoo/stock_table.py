@@ -0,0 +1,200 @@
+import datetime
+import functools
+import json
+import operator
+from array import array
+from itertools import compress
+from typing import Any, Iterable
+
+# Column name and ``array`` typecode; NumPy columns use the matching dtype.
+COLUMNS = {
+    "product_id": "q",
+    "amount": "d",
+    "amount_opened": "d",
+    "amount_aggregated": "d",
+    "best_before_days": "q",
+    "product_group_id": "q",
+}
+# ``product_group_id`` of products without a group.
+NO_GROUP = -1
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_DTYPES = {"q": "int64", "d": "float64"}
+_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+
+@functools.cache
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def epoch_days(date: datetime.date) -> int:
+    """Days since 1970-01-01, the unit of the ``best_before_days`` column."""
+    return date.toordinal() - _EPOCH_ORDINAL
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_epoch_days(value: str) -> int:
+    return epoch_days(datetime.date.fromisoformat(value[:10]))
+
+
+def _group_id(value) -> int:
+    if value in (None, ""):
+        return NO_GROUP
+    return int(value)
+
+
+class StockTable(object):
+    """Columnar view of the current stock for reports over many products.
+
+    Every column in ``COLUMNS`` is a typed contiguous array, a NumPy array
+    when NumPy is installed and an ``array.array`` otherwise. ``where``,
+    ``filter``, ``sort_by`` and ``sum_by`` return new tables or plain dicts
+    and, with NumPy, run as array operations instead of Python loops.
+    """
+
+    def __init__(self, columns: dict[str, Any], use_numpy: bool | None = None):
+        numpy = _numpy() if use_numpy in (None, True) else None
+        if use_numpy and numpy is None:
+            raise ImportError("numpy is required for use_numpy=True")
+        self._np = numpy
+        self._columns = {
+            name: self._to_array(columns[name], typecode)
+            for name, typecode in COLUMNS.items()
+        }
+
+    @classmethod
+    def from_json(cls, content: bytes, use_numpy: bool | None = None):
+        """Build the table from the raw body of ``GET /stock``."""
+        rows = json.loads(content) if content else None
+        return cls.from_rows(rows or [], use_numpy)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict], use_numpy: bool | None = None):
+        """Build the table from decoded ``GET /stock`` entries."""
+        columns = {name: [] for name in COLUMNS}
+        product_id = columns["product_id"].append
+        amount = columns["amount"].append
+        amount_opened = columns["amount_opened"].append
+        amount_aggregated = columns["amount_aggregated"].append
+        best_before_days = columns["best_before_days"].append
+        product_group_id = columns["product_group_id"].append
+        for row in rows:
+            product_id(int(row["product_id"]))
+            amount(float(row["amount"]))
+            amount_opened(float(row["amount_opened"]))
+            amount_aggregated(float(row["amount_aggregated"]))
+            best_before_days(_parse_epoch_days(row["best_before_date"]))
+            product_group_id(
+                _group_id((row.get("product") or {}).get("product_group_id"))
+            )
+        return cls(columns, use_numpy)
+
+    def _to_array(self, values, typecode: str):
+        if self._np is not None:
+            return self._np.asarray(values, dtype=_DTYPES[typecode])
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+        return array(typecode, values)
+
+    def _with_columns(self, columns: dict[str, Any]) -> "StockTable":
+        table = StockTable.__new__(StockTable)
+        table._np = self._np
+        table._columns = columns
+        return table
+
+    def __len__(self) -> int:
+        return len(self._columns["product_id"])
+
+    def __getitem__(self, name: str):
+        return self._columns[name]
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def uses_numpy(self) -> bool:
+        return self._np is not None
+
+    def rows(self) -> list[dict]:
+        """The table as one dict per product, mainly for display and tests."""
+        names = list(self._columns)
+        values = zip(*(self._columns[name].tolist() for name in names))
+        return [dict(zip(names, row)) for row in values]
+
+    def mask(self, column: str, op: str, value):
+        """Boolean mask of the rows where ``column <op> value`` holds.
+
+        Masks can be combined with ``&`` and ``|`` when NumPy is used.
+        """
+        compare = _OPERATORS[op]
+        values = self._columns[column]
+        if self._np is not None:
+            return compare(values, value)
+        return [compare(item, value) for item in values]
+
+    def filter(self, mask) -> "StockTable":
+        """The rows where ``mask`` is true."""
+        if self._np is not None:
+            mask = self._np.asarray(mask, dtype=bool)
+            return self._with_columns(
+                {name: values[mask] for name, values in self._columns.items()}
+            )
+        return self._with_columns(
+            {
+                name: array(values.typecode, compress(values, mask))
+                for name, values in self._columns.items()
+            }
+        )
+
+    def where(self, column: str, op: str, value) -> "StockTable":
+        """The rows where ``column <op> value`` holds, e.g. ``amount > 0``."""
+        return self.filter(self.mask(column, op, value))
+
+    def expiring_within(
+        self, days: int, today: datetime.date | None = None
+    ) -> "StockTable":
+        """Products due at most ``days`` days from ``today``, overdue included."""
+        today = today or datetime.date.today()
+        return self.where("best_before_days", "<=", epoch_days(today) + days)
+
+    def sort_by(self, column: str, descending: bool = False) -> "StockTable":
+        """The rows ordered by ``column``; ties keep their current order."""
+        values = self._columns[column]
+        if self._np is not None:
+            order = self._np.argsort(-values if descending else values, kind="stable")
+            return self._with_columns(
+                {name: data[order] for name, data in self._columns.items()}
+            )
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+        return self._with_columns(
+            {
+                name: array(data.typecode, map(data.__getitem__, order))
+                for name, data in self._columns.items()
+            }
+        )
+
+    def sum_by(self, column: str, by: str = "product_group_id") -> dict:
+        """Total of ``column`` per distinct value of ``by``, sorted by key."""
+        values = self._columns[column]
+        keys = self._columns[by]
+        if self._np is not None:
+            unique, inverse = self._np.unique(keys, return_inverse=True)
+            totals = self._np.bincount(inverse, weights=values, minlength=len(unique))
+            return dict(zip(unique.tolist(), totals.tolist()))
+        totals = {}
+        for key, value in zip(keys, values):
+            totals[key] = totals.get(key, 0) + value
+        return {key: float(totals[key]) for key in sorted(totals)}
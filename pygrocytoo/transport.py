@@ -0,0 +1,316 @@
+from abc import ABC, abstractmethod
+import functools
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+from urllib.parse import urlencode, urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# ``handler(method, target, headers, body) -> (status_code, body)``
+InProcessHandler = Callable[[str, str, dict[str, str], bytes | None], tuple[int, bytes]]
+
+
+def _request_target(url: str, params: dict[str, Any] | None) -> str:
+    """Path and query string of ``url`` with ``params`` encoded like requests."""
+    split = urlsplit(url)
+    query = split.query
+    if params:
+        params = {name: value for name, value in params.items() if value is not None}
+        encoded = urlencode(params, doseq=True)
+        query = f"{query}&{encoded}" if query else encoded
+    return f"{split.path}?{query}" if query else split.path
+
+
+def _encode_body(body: bytes | str | None) -> bytes | None:
+    return body.encode() if isinstance(body, str) else body
+
+
+def _create_session(
+    pool_connections: int, pool_maxsize: int, pool_block: bool
+) -> "requests.Session":
+    """Create a keep-alive session with a bounded connection pool per host.
+
+    ``pool_connections`` is the number of hosts to keep pools for and
+    ``pool_maxsize`` the number of connections kept open to each host.
+    """
+    # Imported here so importing the module, e.g. for the models, stays cheap.
+    import requests
+
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class TransportResponse(object):
+    """Status, headers and body of one response returned by a transport.
+
+    It offers the part of ``requests.Response`` the client relies on, so the
+    HTTP transport can return ``requests`` responses unchanged. A streamed
+    response reads its body on demand through ``iter_content`` and must be
+    closed, e.g. by using it as a context manager.
+    """
+
+    __slots__ = ("status_code", "headers", "_content", "_read", "_release")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+        read: Callable[[int | None], bytes] | None = None,
+        release: Callable[[bool], None] | None = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._content = content
+        self._read = read
+        self._release = release
+
+    @property
+    def content(self) -> bytes:
+        if self._read is not None:
+            self._content = self._read(None)
+            self._read = None
+            self.close()
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        if self._read is None:
+            content = self._content
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]  # noqa: E203
+            return
+        while chunk := self._read(chunk_size):
+            yield chunk
+        self._read = None
+
+    def close(self):
+        """Give the connection back, or drop it if the body was not read."""
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self._read is None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of a ``GrocyApiClient``.
+
+    ``request`` gets the full URL, the headers, the query parameters (lists
+    are sent as repeated parameters, None values are skipped) and the encoded
+    body, and returns a response with ``status_code``, ``headers``,
+    ``content``, ``text``, ``json()`` and, for ``stream=True``,
+    ``iter_content`` and ``close``.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ):
+        """Send one request and return its response."""
+
+    def close(self):
+        """Release the connections held by the transport."""
+
+
+class HttpTransport(Transport):
+    """HTTP(S) through a pooled ``requests`` session, the default transport."""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        verify_ssl=True,
+    ):
+        self.session = _create_session(pool_connections, pool_maxsize, pool_block)
+        self._verify_ssl = verify_ssl
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ) -> "requests.Response":
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=body,
+            verify=self._verify_ssl,
+            stream=stream,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+@functools.cache
+def _unix_connection_class() -> type:
+    # Defined on first use so importing the module does not load http.client.
+    import http.client
+    import socket
+
+    class UnixConnection(http.client.HTTPConnection):
+        def __init__(self, socket_path: str, timeout: float | None):
+            super().__init__("localhost", timeout=timeout)
+            self._socket_path = socket_path
+
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(self._socket_path)
+
+    return UnixConnection
+
+
+class UnixSocketTransport(Transport):
+    """Plain HTTP over a Unix domain socket, for a Grocy on the same host.
+
+    Skips TCP and TLS entirely; the host and port of the URL are ignored.
+    Up to ``pool_maxsize`` idle keep-alive connections are kept for reuse.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | None = None,
+    ):
+        self._socket_path = socket_path
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._connection_class = _unix_connection_class()
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        return self._connection_class(self._socket_path, self._timeout)
+
+    def _release(self, connection, reusable: bool):
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self._pool_maxsize:
+                    self._idle.append(connection)
+                    return
+        connection.close()
+
+    def _send(self, method: str, target: str, headers: dict, body: bytes | None):
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is not None:
+            # The server may have closed the idle connection, then the request
+            # is retried on a new one. Once it was sent only GETs are retried,
+            # a write may already have been applied.
+            sent = False
+            try:
+                connection.request(method, target, body, headers)
+                sent = True
+                return connection, connection.getresponse()
+            except ConnectionError:
+                connection.close()
+                if sent and method != "GET":
+                    raise
+        connection = self._connect()
+        try:
+            connection.request(method, target, body, headers)
+            return connection, connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        connection, response = self._send(
+            method, _request_target(url, params), headers, _encode_body(body)
+        )
+
+        def release(complete: bool):
+            self._release(connection, complete and not response.will_close)
+
+        headers = dict(response.getheaders())
+        if stream:
+            return TransportResponse(
+                response.status, headers, read=response.read, release=release
+            )
+        try:
+            content = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        release(True)
+        return TransportResponse(response.status, headers, content)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class InProcessTransport(Transport):
+    """Hands every request to a Python callable, without any network I/O.
+
+    ``handler(method, target, headers, body)`` gets the request target (path
+    and query string, e.g. ``/api/stock?limit=5``) and the body bytes or None,
+    and returns the status code and the response body. Meant for tests and
+    benchmarks that should not depend on sockets or timing.
+    """
+
+    def __init__(self, handler: InProcessHandler):
+        self._handler = handler
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        body: bytes | str | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        status_code, content = self._handler(
+            method, _request_target(url, params), headers, _encode_body(body)
+        )
+        return TransportResponse(
+            status_code, {"Content-Length": str(len(content))}, content
+        )
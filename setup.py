@@ -18,6 +18,10 @@ setuptools.setup(
         "deprecation~=2.1.0",
         "pydantic~=2.11",
     ],
+    extras_require={
+        "async": ["httpx"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
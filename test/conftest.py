@@ -1,12 +1,33 @@
 import pytest
 
 from pygrocytoo.grocy import Grocy
+from pygrocytoo.grocy_api_client import GrocyApiClient
 from test.test_const import CONST_BASE_URL, CONST_PORT, CONST_SSL
 
 
 @pytest.fixture
-def grocy():
-    return Grocy(CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT)
+def grocy_factory():
+    def factory(**kwargs) -> Grocy:
+        return Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT, **kwargs
+        )
+
+    return factory
+
+
+@pytest.fixture
+def grocy_api_client_factory():
+    def factory(**kwargs) -> GrocyApiClient:
+        return GrocyApiClient(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT, **kwargs
+        )
+
+    return factory
+
+
+@pytest.fixture
+def grocy(grocy_factory):
+    return grocy_factory()
 
 
 # noinspection PyProtectedMember
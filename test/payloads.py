@@ -0,0 +1,84 @@
+"""Minimal Grocy API payloads shared by the mocked tests."""
+
+PRODUCT_DATA = {
+    "id": 1,
+    "name": "Cookies",
+    "qu_id_stock": 3,
+    "qu_id_purchase": 3,
+    "row_created_timestamp": "2022-07-10 21:10:53",
+    "default_best_before_days": 0,
+    "product_group_id": "",
+}
+QUANTITY_UNIT_DATA = {
+    "id": 3,
+    "name": "Pack",
+    "row_created_timestamp": "2022-07-10 21:10:53",
+}
+
+
+def stock_entry(product_id: int) -> dict:
+    return {
+        "product_id": product_id,
+        "amount": 2,
+        "best_before_date": "2022-07-20",
+        "amount_opened": 0,
+        "amount_aggregated": 2,
+        "amount_opened_aggregated": 0,
+        "is_aggregated_amount": 0,
+        "product": {**PRODUCT_DATA, "id": product_id},
+    }
+
+
+def product_details(product_id: int) -> dict:
+    return {
+        "stock_amount": 2,
+        "stock_amount_opened": 0,
+        "product": {**PRODUCT_DATA, "id": product_id, "name": f"P{product_id}"},
+        "quantity_unit_stock": QUANTITY_UNIT_DATA,
+        "default_quantity_unit_purchase": QUANTITY_UNIT_DATA,
+        "product_barcodes": [{"barcode": f"0{product_id}"}],
+    }
+
+
+def chore_details(chore_id: int) -> dict:
+    return {
+        "chore": {
+            "id": chore_id,
+            "name": f"Chore {chore_id}",
+            "period_type": "manually",
+            "track_date_only": 0,
+            "rollover": 0,
+        },
+        "track_count": 3,
+    }
+
+
+def meal_plan_entry(entry_id: int, recipe_id: int, section_id: int) -> dict:
+    return {
+        "id": entry_id,
+        "day": "2022-04-18",
+        "type": "recipe",
+        "recipe_id": recipe_id,
+        "recipe_servings": 1,
+        "section_id": section_id,
+        "row_created_timestamp": "2022-04-22 08:37:58",
+    }
+
+
+def recipe(recipe_id: int) -> dict:
+    return {
+        "id": recipe_id,
+        "name": f"Recipe {recipe_id}",
+        "base_servings": 1,
+        "desired_servings": 1,
+        "row_created_timestamp": "2022-04-22 08:37:58",
+    }
+
+
+def meal_plan_section(section_id: int) -> dict:
+    return {
+        "id": section_id,
+        "name": f"Section {section_id}",
+        "sort_number": section_id,
+        "row_created_timestamp": "2022-04-22 08:37:58",
+    }
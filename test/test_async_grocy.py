@@ -0,0 +1,180 @@
+import asyncio
+import inspect
+import json
+
+import httpx
+import pytest
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.data_models.chore import Chore
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.data_models.product import Product
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy import Grocy
+from test.payloads import chore_details, product_details, stock_entry
+from test.test_const import CONST_BASE_URL, CONST_PORT
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _positional(method) -> list[str]:
+    parameters = inspect.signature(method).parameters.values()
+    return [
+        param.name for param in parameters if param.kind is param.POSITIONAL_OR_KEYWORD
+    ]
+
+
+def test_positional_parameters_match_grocy():
+    for name, method in inspect.getmembers(AsyncGrocy, inspect.isfunction):
+        if not name.startswith("_") and hasattr(Grocy, name):
+            assert _positional(method) == _positional(getattr(Grocy, name)), name
+
+
+class TestAsyncGrocy:
+    def _grocy(self, handler, **kwargs) -> AsyncGrocy:
+        return AsyncGrocy(
+            CONST_BASE_URL,
+            "demo_mode",
+            port=CONST_PORT,
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    def test_stock(self):
+        def handler(request: httpx.Request):
+            assert request.url.path == "/api/stock"
+            return httpx.Response(200, json=[stock_entry(1), stock_entry(2)])
+
+        async def run():
+            async with self._grocy(handler) as grocy:
+                return await grocy.stock()
+
+        stock = _run(run())
+
+        assert [product.id for product in stock] == [1, 2]
+        assert all(isinstance(product, Product) for product in stock)
+        assert stock[0].product_group_id is None
+
+    def test_due_products_with_details_bounded_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request):
+            nonlocal in_flight, max_in_flight
+            if request.url.path == "/api/stock/volatile":
+                due = [stock_entry(product_id) for product_id in range(1, 7)]
+                return httpx.Response(200, json={"due_products": due})
+
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            product_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json=product_details(product_id))
+
+        async def run():
+            async with self._grocy(handler, max_concurrency=2) as grocy:
+                return await grocy.due_products(get_details=True)
+
+        due_products = _run(run())
+
+        assert [product.name for product in due_products] == [
+            f"P{product_id}" for product_id in range(1, 7)
+        ]
+        assert due_products[2].barcodes == ["03"]
+        assert max_in_flight == 2
+
+    def test_volatile_stock_single_request(self):
+        requests = []
+
+        def handler(request: httpx.Request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "due_products": [stock_entry(1)],
+                    "expired_products": [stock_entry(2)],
+                },
+            )
+
+        async def run():
+            async with self._grocy(handler) as grocy:
+                return await grocy.volatile_stock(due_soon_days=5)
+
+        volatile = _run(run())
+
+        assert len(requests) == 1
+        assert requests[0].url.params["due_soon_days"] == "5"
+        assert [product.id for product in volatile.expired_products] == [2]
+        assert volatile.overdue_products == []
+
+    def test_chores_with_details(self):
+        def handler(request: httpx.Request):
+            if request.url.path == "/api/chores":
+                assert request.url.params.get_list("query[]") == ["id<3"]
+                return httpx.Response(200, json=[{"chore_id": 1}, {"chore_id": 2}])
+            chore_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json=chore_details(chore_id))
+
+        async def run():
+            async with self._grocy(handler) as grocy:
+                return await grocy.chores(get_details=True, query_filters=["id<3"])
+
+        chores = _run(run())
+
+        assert all(isinstance(chore, Chore) for chore in chores)
+        assert [chore.name for chore in chores] == ["Chore 1", "Chore 2"]
+        assert chores[1].track_count == 3
+
+    def test_error_raises_grocy_error(self):
+        def handler(request: httpx.Request):
+            return httpx.Response(400, json={"error_message": "Not found"})
+
+        async def run():
+            async with self._grocy(handler) as grocy:
+                await grocy.product(42)
+
+        with pytest.raises(GrocyError) as exc_info:
+            _run(run())
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.message == "Not found"
+
+    def test_generic_crud(self):
+        requests = []
+
+        def handler(request: httpx.Request):
+            requests.append((request.method, request.url.path))
+            if request.method == "POST":
+                assert json.loads(request.content) == {"name": "Task"}
+                return httpx.Response(200, json={"created_object_id": 5})
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": 5, "name": "Task"})
+            return httpx.Response(204)
+
+        async def run():
+            async with self._grocy(handler) as grocy:
+                created = await grocy.add_generic(EntityType.TASKS, {"name": "Task"})
+                fetched = await grocy.get_generic(EntityType.TASKS, 5)
+                await grocy.update_generic(EntityType.TASKS, 5, {"name": "Done"})
+                await grocy.delete_generic(EntityType.TASKS, 5)
+                return created, fetched
+
+        created, fetched = _run(run())
+
+        assert created == {"created_object_id": 5}
+        assert fetched["name"] == "Task"
+        assert requests == [
+            ("POST", "/api/objects/tasks"),
+            ("GET", "/api/objects/tasks/5"),
+            ("PUT", "/api/objects/tasks/5"),
+            ("DELETE", "/api/objects/tasks/5"),
+        ]
+
+    def test_close_closes_http_client(self):
+        grocy = self._grocy(lambda request: httpx.Response(204))
+
+        _run(grocy.close())
+
+        assert grocy._api_client._client.is_closed
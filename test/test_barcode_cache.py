@@ -0,0 +1,231 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.cache import BarcodeCache
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.errors import GrocyError
+from test.payloads import product_details
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT
+
+BY_BARCODE_URL = f"{BASE_URL}/stock/products/by-barcode"
+STOCK_LOG = [
+    {
+        "id": 1,
+        "product_id": 1,
+        "amount": 1,
+        "best_before_date": "2022-07-20",
+        "purchased_date": "2022-07-10",
+        "used_date": "2022-07-10",
+        "spoiled": 0,
+        "stock_id": "abc",
+        "transaction_type": "consume",
+        "price": None,
+        "undone": 0,
+        "undone_timestamp": None,
+        "opened_date": None,
+        "row_created_timestamp": "2022-07-10 21:10:53",
+        "location_id": 1,
+        "recipe_id": None,
+        "correlation_id": None,
+        "transaction_id": "abc",
+        "stock_row_id": None,
+        "shopping_location_id": None,
+        "user_id": 1,
+    }
+]
+
+
+def _add_unknown_barcode(barcode: str):
+    responses.add(
+        responses.GET,
+        f"{BY_BARCODE_URL}/{barcode}",
+        status=400,
+        json={"error_message": f"No product with barcode {barcode} found"},
+    )
+
+
+def _paths() -> list[str]:
+    return [call.request.path_url for call in responses.calls]
+
+
+class TestBarcodeCache:
+    @responses.activate
+    def test_repeat_lookups_are_cached(self, grocy_factory):
+        responses.add(responses.GET, f"{BY_BARCODE_URL}/01", json=product_details(1))
+        grocy = grocy_factory(barcode_cache=BarcodeCache())
+
+        first = grocy.product_by_barcode("01")
+        second = grocy.product_by_barcode("01")
+
+        assert len(responses.calls) == 1
+        assert first.name == second.name == "P1"
+        assert second.barcodes == ["01"]
+
+    @responses.activate
+    def test_unknown_barcodes_are_remembered(self, grocy_factory):
+        _add_unknown_barcode("404")
+        barcode_cache = BarcodeCache(negative_ttl=30)
+        grocy = grocy_factory(barcode_cache=barcode_cache)
+
+        with patch("pygrocytoo.cache.time.monotonic", return_value=100):
+            for _ in range(3):
+                with pytest.raises(GrocyError) as exc_info:
+                    grocy.product_by_barcode("404")
+                assert exc_info.value.status_code == 400
+            with pytest.raises(GrocyError):
+                grocy.consume_product_by_barcode("404")
+        assert len(responses.calls) == 1
+
+        with patch("pygrocytoo.cache.time.monotonic", return_value=130):
+            with pytest.raises(GrocyError):
+                grocy.product_by_barcode("404")
+        assert len(responses.calls) == 2
+
+    @pytest.mark.parametrize("status", [401, 403, 429, 500])
+    @responses.activate
+    def test_other_errors_are_not_remembered(self, status, grocy_factory):
+        responses.add(
+            responses.GET,
+            f"{BY_BARCODE_URL}/01",
+            status=status,
+            json={"error_message": "Not now"},
+        )
+        grocy = grocy_factory(barcode_cache=BarcodeCache())
+
+        for _ in range(2):
+            with pytest.raises(GrocyError):
+                grocy.product_by_barcode("01")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_by_barcode_writes_drop_every_barcode_of_the_product(self, grocy_factory):
+        for barcode, product_id in (("01", 1), ("02", 1), ("03", 2)):
+            responses.add(
+                responses.GET,
+                f"{BY_BARCODE_URL}/{barcode}",
+                json=product_details(product_id),
+            )
+        for action in ("consume", "add", "inventory"):
+            responses.add(
+                responses.POST, f"{BY_BARCODE_URL}/01/{action}", json=STOCK_LOG
+            )
+        barcode_cache = BarcodeCache()
+        grocy = grocy_factory(barcode_cache=barcode_cache)
+        grocy.product_by_barcode("02")
+        grocy.product_by_barcode("03")
+
+        grocy.consume_product_by_barcode("01", amount=0.5, get_details=False)
+        grocy.product_by_barcode("02")
+        grocy.product_by_barcode("03")
+        grocy.add_product_by_barcode("01", amount=3, price=1.5, get_details=False)
+        grocy.inventory_product_by_barcode("01", new_amount=7, get_details=False)
+        grocy.product_by_barcode("02")
+
+        assert _paths() == [
+            "/api/stock/products/by-barcode/02",
+            "/api/stock/products/by-barcode/03",
+            "/api/stock/products/by-barcode/01/consume",
+            "/api/stock/products/by-barcode/02",
+            "/api/stock/products/by-barcode/01/add",
+            "/api/stock/products/by-barcode/01/inventory",
+            "/api/stock/products/by-barcode/02",
+        ]
+        assert barcode_cache.hits == 1
+
+    @responses.activate
+    def test_by_barcode_writes_set_the_same_fields_with_and_without_cache(
+        self, grocy_factory
+    ):
+        responses.add(responses.GET, f"{BY_BARCODE_URL}/01", json=product_details(1))
+        responses.add(
+            responses.GET, f"{BASE_URL}/stock/products/1", json=product_details(1)
+        )
+        responses.add(responses.POST, f"{BY_BARCODE_URL}/01/consume", json=STOCK_LOG)
+        cached = grocy_factory(barcode_cache=BarcodeCache())
+        cached.product_by_barcode("01")
+
+        with_cache = cached.consume_product_by_barcode("01", amount=1).as_dict()
+        without_cache = grocy_factory().consume_product_by_barcode("01", amount=1)
+
+        assert with_cache == without_cache.as_dict()
+
+    @responses.activate
+    def test_barcode_edits_clear_the_cache(self, grocy_factory):
+        _add_unknown_barcode("404")
+        responses.add(responses.POST, f"{BASE_URL}/objects/product_barcodes", json={})
+        grocy = grocy_factory(barcode_cache=BarcodeCache())
+        with pytest.raises(GrocyError):
+            grocy.product_by_barcode("404")
+
+        grocy.add_generic(
+            EntityType.PRODUCT_BARCODES, {"product_id": 1, "barcode": "404"}
+        )
+        responses.replace(
+            responses.GET, f"{BY_BARCODE_URL}/404", json=product_details(1)
+        )
+
+        assert grocy.product_by_barcode("404").id == 1
+
+    @responses.activate
+    def test_stock_writes_by_id_drop_the_product(self, grocy_factory):
+        for product_id in (1, 2):
+            responses.add(
+                responses.GET,
+                f"{BY_BARCODE_URL}/0{product_id}",
+                json=product_details(product_id),
+            )
+        responses.add(
+            responses.POST, f"{BASE_URL}/stock/products/1/consume", json=STOCK_LOG
+        )
+        barcode_cache = BarcodeCache()
+        grocy = grocy_factory(barcode_cache=barcode_cache)
+        grocy.product_by_barcode("01")
+        grocy.product_by_barcode("02")
+
+        grocy.consume_product(1, amount=1)
+        grocy.product_by_barcode("01")
+        grocy.product_by_barcode("02")
+
+        assert _paths() == [
+            "/api/stock/products/by-barcode/01",
+            "/api/stock/products/by-barcode/02",
+            "/api/stock/products/1/consume",
+            "/api/stock/products/by-barcode/01",
+        ]
+        assert barcode_cache.hits == 1
+
+    def test_async_lookups_are_cached(self):
+        paths = []
+
+        def handler(request: httpx.Request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/404"):
+                return httpx.Response(400, json={"error_message": "Not found"})
+            return httpx.Response(200, content=json.dumps(product_details(1)))
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+                barcode_cache=BarcodeCache(),
+            ) as grocy:
+                for _ in range(2):
+                    await grocy.product_by_barcode("01")
+                    with pytest.raises(GrocyError):
+                        await grocy.product_by_barcode("404")
+
+        asyncio.run(run())
+
+        assert paths == [
+            "/api/stock/products/by-barcode/01",
+            "/api/stock/products/by-barcode/404",
+        ]
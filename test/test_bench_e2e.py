@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from benchmarks.bench_e2e import _percentile, _regressions
+
+
+def _row(scenario, p95):
+    return {
+        "preset": "small",
+        "scenario": scenario,
+        "concurrency": 1,
+        "latency_ms": {"p95": p95},
+    }
+
+
+def test_percentile():
+    timings = [float(value) for value in range(1, 101)]
+
+    assert _percentile(timings, 50) == pytest.approx(50.5)
+    assert _percentile(timings, 99) == pytest.approx(99.01)
+    assert _percentile([3.0], 95) == 3.0
+
+
+def test_regressions(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"results": [_row("stock", 10.0), _row("chores", 10.0)]})
+    )
+    results = [_row("stock", 11.0), _row("chores", 13.0), _row("new", 99.0)]
+
+    regressions = _regressions(results, str(baseline), tolerance=0.2)
+
+    assert [(row["scenario"], ratio) for row, ratio in regressions] == [
+        ("chores", pytest.approx(1.3))
+    ]
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from benchmarks.bench_parse_path import CASES, load_body, measure, scaled_bodies
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_cassette_bodies_parse(name):
+    cassette, path, model, wrapper, is_list = CASES[name]
+    body = load_body(cassette, path)
+
+    assert isinstance(json.loads(body), list if is_list else dict)
+
+
+def test_scaled_bodies():
+    body = b'[{"id": 1}, {"id": 2}]'
+
+    assert json.loads(scaled_bodies(body, 5, True)[0]) == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 1},
+        {"id": 2},
+        {"id": 1},
+    ]
+    assert scaled_bodies(b'{"id": 1}', 3, False) == [b'{"id": 1}'] * 3
+
+
+def test_measure_reports_every_stage():
+    results = measure("SystemConfigDto", objects=3, repeat=1)
+
+    assert list(results) == ["decode", "validate", "validate_json", "wrap"]
+    assert all(result["us"] > 0 for result in results.values())
+
+
+def test_unknown_path():
+    cassette = CASES["UserDto"][0]
+
+    with pytest.raises(LookupError):
+        load_body(cassette, "chores")
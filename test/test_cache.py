@@ -0,0 +1,395 @@
+import json
+import math
+import threading
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from pygrocytoo.cache import (
+    DATE_DEPENDENT_TTL,
+    PersistentResponseCache,
+    ResponseCache,
+    invalidated_endpoints,
+)
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy_api_client import GrocyApiClient
+from pygrocytoo.transport import InProcessTransport
+from test.payloads import stock_entry
+from test.test_const import BASE_URL
+
+
+class TestResponseCache:
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache()
+
+        assert cache.get(("stock", ())) is None
+        cache.set(("stock", ()), b"[]")
+
+        assert cache.get(("stock", ())) == b"[]"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set(("chores", ()), b"1")
+        cache.set(("tasks", ()), b"2")
+        cache.get(("chores", ()))
+        cache.set(("batteries", ()), b"3")
+
+        assert len(cache) == 2
+        assert cache.get(("tasks", ())) is None
+        assert cache.get(("chores", ())) == b"1"
+
+    def test_per_endpoint_ttl(self):
+        cache = ResponseCache(default_ttl=10, ttls={"stock": 1, "stock/volatile": 5})
+
+        assert cache.ttl_for("stock") == 1
+        assert cache.ttl_for("stock/volatile") == 5
+        assert cache.ttl_for("stock/products/1") == 1
+        assert cache.ttl_for("stocks") == 10
+        assert cache.ttl_for("system/time") == 0
+
+    def test_entries_expire(self):
+        cache = ResponseCache(default_ttl=10)
+        with patch("pygrocytoo.cache.time.monotonic", return_value=100):
+            cache.set(("chores", ()), b"[]")
+        with patch("pygrocytoo.cache.time.monotonic", return_value=109):
+            assert cache.get(("chores", ())) == b"[]"
+        with patch("pygrocytoo.cache.time.monotonic", return_value=110):
+            assert cache.get(("chores", ())) is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_is_not_cached(self):
+        cache = ResponseCache()
+        cache.set(("system/time", ()), b"{}")
+
+        assert len(cache) == 0
+
+    def test_coherent_cache_keeps_explicit_and_date_ttls(self):
+        cache = ResponseCache(
+            default_ttl=1, ttls={"objects/meal_plan": 60}, db_changed_probe_interval=5
+        )
+        with patch("pygrocytoo.cache.time.monotonic", return_value=100):
+            for end_url in ("stock", "stock/volatile", "chores", "objects/meal_plan"):
+                cache.set((end_url, ()), b"[]")
+
+        with patch("pygrocytoo.cache.time.monotonic", return_value=1e6):
+            assert cache.get(("stock", ())) == b"[]"
+            assert cache.get(("stock/volatile", ())) is None
+            assert cache.get(("chores", ())) is None
+            assert cache.get(("objects/meal_plan", ())) is None
+        assert cache.ttl_for("stock") == math.inf
+        assert cache.ttl_for("tasks/1") == DATE_DEPENDENT_TTL
+
+    def test_invalidate_prefixes(self):
+        cache = ResponseCache()
+        for end_url in ("stock", "stock/volatile", "stocks", "chores"):
+            cache.set((end_url, ()), b"[]")
+
+        assert cache.invalidate(("stock",)) == 2
+        assert cache.get(("stocks", ())) == b"[]"
+        assert cache.get(("chores", ())) == b"[]"
+
+    def test_invalidated_endpoints(self):
+        consume = invalidated_endpoints("stock/products/1/consume")
+        assert "stock" in consume and "objects/stock_log" in consume
+        assert invalidated_endpoints("stock/shoppinglist/clear") == (
+            "objects/shopping_list",
+        )
+        assert invalidated_endpoints("objects/products/1") == (
+            "objects/products",
+            "stock",
+        )
+        assert invalidated_endpoints("userfields/chores/1") == (
+            "objects/chores",
+            "chores",
+            "userfields/chores",
+        )
+        assert "stock" in invalidated_endpoints("chores/1/execute")
+        assert invalidated_endpoints("unknown/endpoint") is None
+
+
+class TestClientCache:
+    @responses.activate
+    def test_get_served_from_cache(self, grocy_api_client_factory):
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        client = grocy_api_client_factory(cache=ResponseCache())
+
+        first = client.get_stock()
+        second = client.get_stock()
+
+        assert len(responses.calls) == 1
+        assert first == second
+        assert client.cache.hits == 1
+
+    @responses.activate
+    def test_query_filters_are_part_of_the_key(self, grocy_api_client_factory):
+        responses.add(responses.GET, f"{BASE_URL}/chores", json=[{"chore_id": 1}])
+        client = grocy_api_client_factory(cache=ResponseCache())
+
+        client.get_chores(["id=1"])
+        client.get_chores(["id=2"])
+        client.get_chores(["id=1"])
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_write_invalidates_affected_entries(self, grocy_api_client_factory):
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        responses.add(responses.GET, f"{BASE_URL}/chores", json=[])
+        responses.add(responses.POST, f"{BASE_URL}/stock/products/1/consume")
+        client = grocy_api_client_factory(cache=ResponseCache())
+        client.get_stock()
+        client.get_chores()
+
+        client.consume_product(1)
+        client.get_stock()
+        client.get_chores()
+
+        get_calls = [call for call in responses.calls if call.request.method == "GET"]
+        assert [call.request.url for call in get_calls] == [
+            f"{BASE_URL}/stock",
+            f"{BASE_URL}/chores",
+            f"{BASE_URL}/stock",
+        ]
+
+    @responses.activate
+    def test_errors_are_not_cached(self, grocy_api_client_factory):
+        responses.add(
+            responses.GET, f"{BASE_URL}/stock", status=400, json={"error_message": ""}
+        )
+        cache = ResponseCache()
+        client = grocy_api_client_factory(cache=cache)
+
+        for _ in range(2):
+            with pytest.raises(GrocyError):
+                client.get_stock()
+
+        assert len(responses.calls) == 2
+        assert len(cache) == 0
+
+    def test_response_fetched_before_a_write_is_not_stored(self):
+        amount = [2]
+        in_flight = threading.Event()
+        release = threading.Event()
+
+        def handler(method, target, headers, body):
+            if method == "POST":
+                amount[0] -= 1
+                return 200, b"[]"
+            content = json.dumps([{**stock_entry(1), "amount": amount[0]}])
+            if not release.is_set():
+                in_flight.set()
+                release.wait(5)
+            return 200, content.encode()
+
+        client = GrocyApiClient(
+            "http://grocy.de",
+            "demo_mode",
+            cache=ResponseCache(),
+            transport=InProcessTransport(handler),
+        )
+        reader = threading.Thread(target=client.get_stock)
+        reader.start()
+        assert in_flight.wait(5)
+        client.consume_product(1)
+        release.set()
+        reader.join(5)
+
+        assert client.get_stock()[0].amount == 1
+        assert (
+            client.cache.set(("stock", ()), b"[]", client.cache.generation - 1) is False
+        )
+
+    @responses.activate
+    def test_coherent_cache_probes_once_per_interval(self, grocy_api_client_factory):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/system/db-changed-time",
+            json={"changed_time": "2022-07-10 21:10:53"},
+        )
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        client = grocy_api_client_factory(
+            cache=ResponseCache(db_changed_probe_interval=60)
+        )
+
+        with patch("pygrocytoo.cache.time.monotonic", return_value=1000):
+            client.get_stock()
+            client.get_stock()
+        with patch("pygrocytoo.cache.time.monotonic", return_value=1061):
+            client.get_stock()
+
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/db-changed-time",
+            "/api/stock",
+            "/api/system/db-changed-time",
+        ]
+        assert client.cache.db_changed_time == "2022-07-10 21:10:53"
+
+    @responses.activate
+    def test_coherent_cache_flushes_when_db_changes(self, grocy_api_client_factory):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/system/db-changed-time",
+            json={"changed_time": "2022-07-10 21:10:53"},
+        )
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        client = grocy_api_client_factory(
+            cache=ResponseCache(default_ttl=1, db_changed_probe_interval=0)
+        )
+        with patch("pygrocytoo.cache.time.monotonic", return_value=1000):
+            client.get_stock()
+        with patch("pygrocytoo.cache.time.monotonic", return_value=5000):
+            client.get_stock()
+        assert len(responses.calls) == 3
+
+        responses.replace(
+            responses.GET,
+            f"{BASE_URL}/system/db-changed-time",
+            json={"changed_time": "2022-07-11 08:00:00"},
+        )
+        with patch("pygrocytoo.cache.time.monotonic", return_value=6000):
+            client.get_stock()
+
+        assert [call.request.path_url for call in responses.calls[3:]] == [
+            "/api/system/db-changed-time",
+            "/api/stock",
+        ]
+
+
+def _system_info(version: str) -> dict:
+    return {
+        "grocy_version": {"Version": version, "ReleaseDate": "2022-07-10"},
+        "php_version": "8.1",
+        "sqlite_version": "3.38",
+        "os": "Linux",
+        "client": "pygrocytoo",
+    }
+
+
+class TestPersistentResponseCache:
+    @pytest.fixture
+    def persistent_client(self, grocy_api_client_factory, tmp_path):
+        """Build clients sharing one cache file, like restarted processes."""
+
+        def factory() -> GrocyApiClient:
+            cache = PersistentResponseCache(str(tmp_path / "cache.db"))
+            return grocy_api_client_factory(cache=cache)
+
+        return factory
+
+    def _add_probes(self, changed_time: str = "2022-07-10 21:10:53"):
+        responses.upsert(
+            responses.GET,
+            f"{BASE_URL}/system/db-changed-time",
+            json={"changed_time": changed_time},
+        )
+        responses.upsert(
+            responses.GET, f"{BASE_URL}/system/info", json=_system_info("4.0")
+        )
+
+    @responses.activate
+    def test_restarted_process_serves_from_disk(self, persistent_client):
+        self._add_probes()
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        first = persistent_client()
+        first.get_stock()
+        first.get_system_info()
+        first.cache.close()
+        responses.calls.reset()
+
+        second = persistent_client()
+        stock = second.get_stock()
+        info = second.get_system_info()
+        second.get_stock()
+
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/info",
+            "/api/system/db-changed-time",
+        ]
+        assert stock[0].product_id == 1
+        assert info.grocy_version_info.version == "4.0"
+        assert second.cache.disk_hits == 2
+        assert second.cache.hits == 3
+        assert second.cache.server_version == "4.0"
+
+    @responses.activate
+    def test_changed_db_discards_disk_entries(self, persistent_client):
+        self._add_probes()
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        persistent_client().get_stock()
+
+        self._add_probes("2022-07-11 08:00:00")
+        responses.calls.reset()
+        client = persistent_client()
+        client.get_stock()
+
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/info",
+            "/api/system/db-changed-time",
+            "/api/stock",
+        ]
+        assert client.cache.disk_hits == 0
+
+    @responses.activate
+    def test_writes_invalidate_disk_entries(self, persistent_client):
+        self._add_probes()
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        responses.add(responses.GET, f"{BASE_URL}/objects/meal_plan", json=[])
+        responses.add(responses.POST, f"{BASE_URL}/stock/products/1/consume", json=[])
+        client = persistent_client()
+        client.get_stock()
+        client.get_meal_plan()
+        client.consume_product(1, 1)
+
+        responses.calls.reset()
+        restarted = persistent_client()
+        restarted.get_meal_plan()
+        restarted.get_stock()
+
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/info",
+            "/api/system/db-changed-time",
+            "/api/stock",
+        ]
+
+    @responses.activate
+    def test_date_dependent_entries_stay_in_memory(self, persistent_client):
+        self._add_probes()
+        responses.add(responses.GET, f"{BASE_URL}/chores", json=[])
+        persistent_client().get_chores()
+
+        responses.calls.reset()
+        restarted = persistent_client()
+        restarted.get_chores()
+
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/info",
+            "/api/system/db-changed-time",
+            "/api/chores",
+        ]
+
+    @responses.activate
+    def test_new_server_version_discards_entries(self, persistent_client):
+        self._add_probes()
+        responses.add(responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1)])
+        first = persistent_client()
+        first.get_stock()
+        first.cache.close()
+
+        responses.replace(
+            responses.GET, f"{BASE_URL}/system/info", json=_system_info("4.1")
+        )
+        responses.calls.reset()
+        restarted = persistent_client()
+        restarted.get_stock()
+        restarted.get_stock()
+
+        assert restarted.cache.server_version == "4.1"
+        assert restarted.cache.disk_hits == 0
+        assert [call.request.path_url for call in responses.calls] == [
+            "/api/system/info",
+            "/api/system/db-changed-time",
+            "/api/stock",
+        ]
@@ -0,0 +1,165 @@
+import asyncio
+import copy
+
+import httpx
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.cache import ResponseCache
+from pygrocytoo.catalog import ProductCatalog
+from test.payloads import PRODUCT_DATA, QUANTITY_UNIT_DATA
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT
+
+TIMESTAMP = "2022-07-10 21:10:53"
+ROWS = {
+    "products": [
+        {**PRODUCT_DATA, "id": 1, "product_group_id": "1", "location_id": "2"},
+        {**PRODUCT_DATA, "id": 2, "name": "Milk", "product_group_id": "1"},
+        {**PRODUCT_DATA, "id": 3, "name": "Soap", "location_id": "2"},
+    ],
+    "product_barcodes": [
+        {"id": 1, "product_id": 1, "barcode": "4001", "amount": None},
+        {"id": 2, "product_id": 1, "barcode": "4002", "amount": 6},
+        {"id": 3, "product_id": 2, "barcode": "4003", "amount": None},
+    ],
+    "quantity_units": [QUANTITY_UNIT_DATA],
+    "locations": [
+        {"id": 2, "name": "Fridge", "row_created_timestamp": TIMESTAMP},
+    ],
+    "product_groups": [
+        {"id": 1, "name": "Food", "row_created_timestamp": TIMESTAMP},
+    ],
+}
+
+
+def _add_rows(rows: dict, changed_time: str = TIMESTAMP):
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/system/db-changed-time",
+        json={"changed_time": changed_time},
+    )
+    for entity, entity_rows in rows.items():
+        responses.add(responses.GET, f"{BASE_URL}/objects/{entity}", json=entity_rows)
+
+
+def _paths() -> list[str]:
+    return [call.request.path_url for call in responses.calls]
+
+
+class TestProductCatalog:
+    @responses.activate
+    def test_lookups(self, grocy_factory):
+        _add_rows(ROWS)
+        grocy = grocy_factory()
+
+        catalog = grocy.product_catalog()
+
+        assert len(responses.calls) == 6
+        assert len(catalog) == 3
+        product = catalog.product(1)
+        assert product.name == "Cookies"
+        assert product.barcodes == ["4001", "4002"]
+        assert product.product_barcodes[1].amount == 6
+        assert product.default_quantity_unit_purchase.name == "Pack"
+        assert catalog.product_by_barcode("4003").name == "Milk"
+        assert catalog.product_by_barcode("9999") is None
+        assert catalog.product(4) is None
+        assert [p.id for p in catalog.products_in_group(1)] == [1, 2]
+        assert [p.id for p in catalog.products_at_location(2)] == [1, 3]
+        assert catalog.products_in_group(5) == []
+        assert catalog.product_group(1).name == "Food"
+        assert catalog.location(2).name == "Fridge"
+        assert catalog.quantity_unit(3).name == "Pack"
+
+    @responses.activate
+    def test_refresh_skipped_while_db_unchanged(self, grocy_factory):
+        _add_rows(ROWS)
+        grocy = grocy_factory()
+
+        first = grocy.product_catalog()
+        second = grocy.product_catalog()
+
+        assert first is second
+        assert _paths()[6:] == ["/api/system/db-changed-time"]
+
+    @responses.activate
+    def test_refresh_is_incremental(self, grocy_api_client_factory):
+        _add_rows(ROWS)
+        catalog = ProductCatalog(grocy_api_client_factory())
+        catalog.refresh()
+        cookies = catalog.product(1)
+
+        rows = copy.deepcopy(ROWS)
+        rows["products"][1]["name"] = "Oat milk"
+        del rows["products"][2]
+        rows["product_barcodes"][1]["product_id"] = 2
+        rows["products"].append({**PRODUCT_DATA, "id": 4, "name": "Tea"})
+        responses.reset()
+        _add_rows(rows, changed_time="2022-07-11 08:00:00")
+
+        assert catalog.refresh() is True
+
+        assert catalog.product(1).barcodes == ["4001"]
+        assert catalog.product(1) is not cookies
+        assert catalog.product(2).name == "Oat milk"
+        assert catalog.product(2).barcodes == ["4002", "4003"]
+        assert catalog.product_by_barcode("4002") is catalog.product(2)
+        assert catalog.product(3) is None
+        assert catalog.product(4).name == "Tea"
+        assert [p.id for p in catalog.products_at_location(2)] == [1]
+
+    @responses.activate
+    def test_unchanged_products_are_reused(self, grocy_api_client_factory):
+        _add_rows(ROWS)
+        catalog = ProductCatalog(grocy_api_client_factory())
+        catalog.refresh()
+        cookies = catalog.product(1)
+
+        rows = copy.deepcopy(ROWS)
+        rows["products"][2]["name"] = "Hand soap"
+        responses.reset()
+        _add_rows(rows, changed_time="2022-07-11 08:00:00")
+        catalog.refresh()
+
+        assert catalog.product(1) is cookies
+        assert catalog.product(3).name == "Hand soap"
+
+    @responses.activate
+    def test_refresh_bypasses_stale_cache_entries(self, grocy_api_client_factory):
+        _add_rows(ROWS)
+        client = grocy_api_client_factory(cache=ResponseCache(default_ttl=600))
+        catalog = ProductCatalog(client)
+        catalog.refresh()
+
+        rows = copy.deepcopy(ROWS)
+        rows["products"][0]["name"] = "Biscuits"
+        responses.reset()
+        _add_rows(rows, changed_time="2022-07-11 08:00:00")
+        catalog.refresh()
+
+        assert catalog.product(1).name == "Biscuits"
+
+    def test_async_catalog(self):
+        paths = []
+
+        def handler(request: httpx.Request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("db-changed-time"):
+                return httpx.Response(200, json={"changed_time": TIMESTAMP})
+            entity = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json=ROWS[entity])
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as grocy:
+                await grocy.product_catalog()
+                return await grocy.product_catalog()
+
+        catalog = asyncio.run(run())
+
+        assert catalog.product_by_barcode("4002").id == 1
+        assert len(paths) == 7
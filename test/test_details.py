@@ -0,0 +1,100 @@
+import json
+import re
+import threading
+import time
+
+import pytest
+import responses
+
+from pygrocytoo.errors import GrocyDetailsError, GrocyError
+from test.payloads import product_details, stock_entry
+from test.test_const import BASE_URL
+
+PRODUCT_URL = re.compile(rf"{BASE_URL}/stock/products/\d+")
+
+
+def _add_due_products(product_ids: list[int]):
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/stock/volatile",
+        json={"due_products": [stock_entry(product_id) for product_id in product_ids]},
+    )
+
+
+class TestDetails:
+    def _product_callback(self, threads: set, failing_ids=()):
+        def callback(request):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            product_id = int(request.url.rsplit("/", 1)[-1])
+            if product_id in failing_ids:
+                return 400, {}, json.dumps({"error_message": "No product"})
+            return 200, {}, json.dumps(product_details(product_id))
+
+        return callback
+
+    @responses.activate
+    def test_sequential_by_default(self, grocy_factory):
+        threads = set()
+        _add_due_products([1, 2, 3])
+        responses.add_callback(
+            responses.GET, PRODUCT_URL, callback=self._product_callback(threads)
+        )
+
+        products = grocy_factory().due_products(get_details=True)
+
+        assert [product.name for product in products] == ["P1", "P2", "P3"]
+        assert threads == {threading.get_ident()}
+
+    @responses.activate
+    def test_parallel_preserves_order(self, grocy_factory):
+        threads = set()
+        product_ids = list(range(1, 9))
+        _add_due_products(product_ids)
+        responses.add_callback(
+            responses.GET, PRODUCT_URL, callback=self._product_callback(threads)
+        )
+
+        products = grocy_factory(max_workers=4).due_products(get_details=True)
+
+        assert [product.name for product in products] == [
+            f"P{product_id}" for product_id in product_ids
+        ]
+        assert 1 < len(threads) <= 4
+
+    @responses.activate
+    def test_per_call_max_workers_override(self, grocy_factory):
+        threads = set()
+        _add_due_products([1, 2, 3, 4])
+        responses.add_callback(
+            responses.GET, PRODUCT_URL, callback=self._product_callback(threads)
+        )
+
+        grocy_factory().due_products(get_details=True, max_workers=4)
+
+        assert len(threads) > 1
+
+    @responses.activate
+    def test_partial_failures_are_aggregated(self, grocy_factory):
+        threads = set()
+        _add_due_products([1, 2, 3, 4])
+        responses.add_callback(
+            responses.GET,
+            PRODUCT_URL,
+            callback=self._product_callback(threads, failing_ids=(2, 4)),
+        )
+
+        with pytest.raises(GrocyDetailsError) as exc_info:
+            grocy_factory(max_workers=4).due_products(get_details=True)
+
+        error = exc_info.value
+        assert isinstance(error, GrocyError)
+        assert error.status_code == 400
+        assert [index for index, _ in error.errors] == [1, 3]
+        assert [item.id for item in error.failed_items] == [2, 4]
+        assert [item.name for item in error.results] == [
+            "P1",
+            "Cookies",
+            "P3",
+            "Cookies",
+        ]
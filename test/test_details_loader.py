@@ -0,0 +1,135 @@
+import asyncio
+import json
+import re
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.grocy_api_client import RecipeDetailsResponse
+from pygrocytoo.loader import DetailsLoader
+from test.payloads import meal_plan_entry, meal_plan_section, recipe
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT, CONST_SSL
+
+# 40 entries sharing 12 recipes and 3 sections, recipe 99 does not exist.
+MEAL_PLAN = [
+    meal_plan_entry(entry_id, entry_id % 12 + 1, entry_id % 3 + 1)
+    for entry_id in range(1, 40)
+] + [meal_plan_entry(40, 99, 1)]
+ROWS = {
+    "recipes": {recipe_id: recipe(recipe_id) for recipe_id in range(1, 13)},
+    "meal_plan_sections": {
+        section_id: meal_plan_section(section_id) for section_id in range(1, 4)
+    },
+}
+
+
+def _requested_ids(url: str) -> list[int]:
+    (id_filter,) = parse_qs(urlsplit(url).query)["query[]"]
+    return [int(object_id) for object_id in re.findall(r"\d+", id_filter)]
+
+
+def _rows(entity: str, url: str) -> list[dict]:
+    rows = ROWS[entity]
+    return [rows[object_id] for object_id in _requested_ids(url) if object_id in rows]
+
+
+class TestDetailsLoader:
+    @responses.activate
+    def test_meal_plan_details_are_batched(self):
+        responses.add(responses.GET, f"{BASE_URL}/objects/meal_plan", json=MEAL_PLAN)
+        for entity in ROWS:
+            responses.add_callback(
+                responses.GET,
+                re.compile(rf"{BASE_URL}/objects/{entity}\?.*"),
+                callback=lambda request, entity=entity: (
+                    200,
+                    {},
+                    json.dumps(_rows(entity, request.url)),
+                ),
+            )
+        grocy = Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT
+        )
+
+        meal_plan = grocy.meal_plan(get_details=True)
+
+        assert len(responses.calls) == 3
+        assert _requested_ids(responses.calls[1].request.url) == [*range(1, 13), 99]
+        assert _requested_ids(responses.calls[2].request.url) == [1, 2, 3]
+        assert [item.recipe.name for item in meal_plan[:3]] == [
+            "Recipe 2",
+            "Recipe 3",
+            "Recipe 4",
+        ]
+        assert [item.section.name for item in meal_plan[:3]] == [
+            "Section 2",
+            "Section 3",
+            "Section 1",
+        ]
+        assert meal_plan[-1].recipe is None
+        assert meal_plan[-1].section.id == 1
+
+    def test_async_meal_plan_details_are_batched(self):
+        paths = []
+
+        def handler(request: httpx.Request):
+            paths.append(request.url.path)
+            entity = request.url.path.rsplit("/", 1)[-1]
+            if entity == "meal_plan":
+                return httpx.Response(200, json=MEAL_PLAN)
+            return httpx.Response(200, json=_rows(entity, str(request.url)))
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as grocy:
+                return await grocy.meal_plan(get_details=True)
+
+        meal_plan = asyncio.run(run())
+
+        assert sorted(paths) == [
+            "/api/objects/meal_plan",
+            "/api/objects/meal_plan_sections",
+            "/api/objects/recipes",
+        ]
+        assert meal_plan[0].recipe.id == 2
+        assert meal_plan[0].section.id == 2
+
+    @responses.activate
+    def test_load_only_fetches_new_ids(self):
+        responses.add_callback(
+            responses.GET,
+            re.compile(rf"{BASE_URL}/objects/recipes\?.*"),
+            callback=lambda request: (
+                200,
+                {},
+                json.dumps(_rows("recipes", request.url)),
+            ),
+        )
+        grocy = Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT
+        )
+        loader = DetailsLoader()
+
+        loader.request(EntityType.RECIPES, 1)
+        loader.request(EntityType.RECIPES, 99)
+        loader.load(grocy._api_client)
+        loader.request(EntityType.RECIPES, 2)
+        loader.load(grocy._api_client)
+        loader.load(grocy._api_client)
+
+        assert [_requested_ids(call.request.url) for call in responses.calls] == [
+            [1, 99],
+            [2],
+        ]
+        first = loader.get(EntityType.RECIPES, 1, RecipeDetailsResponse)
+        assert first.name == "Recipe 1"
+        assert loader.get(EntityType.RECIPES, 1, RecipeDetailsResponse) is first
+        assert loader.get(EntityType.RECIPES, 99, RecipeDetailsResponse) is None
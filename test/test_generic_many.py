@@ -0,0 +1,117 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from urllib.parse import quote_plus
+
+import httpx
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.grocy_api_client import _id_filters
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT
+
+EXISTING_IDS = set(range(1, 1001))
+
+
+def _matching_objects(id_filter: str) -> list[dict]:
+    field, pattern = id_filter.split("§", 1)
+    assert field == "id"
+    return [
+        {"id": str(object_id), "name": f"Product {object_id}"}
+        for object_id in sorted(EXISTING_IDS)
+        if re.match(pattern, str(object_id))
+    ]
+
+
+class TestIdFilters:
+    def test_single_chunk(self):
+        assert _id_filters([1, 2, 30]) == ["id§^(1|2|30)$"]
+
+    def test_chunks_stay_below_max_length(self):
+        ids = list(range(1, 2001))
+
+        filters = _id_filters(ids, max_length=300)
+
+        assert len(filters) > 1
+        assert all(len(quote_plus(id_filter)) <= 300 for id_filter in filters)
+        chunked_ids = [
+            int(object_id)
+            for id_filter in filters
+            for object_id in re.fullmatch(r"id§\^\((.*)\)\$", id_filter)
+            .group(1)
+            .split("|")
+        ]
+        assert chunked_ids == ids
+
+    def test_no_ids(self):
+        assert _id_filters([]) == []
+
+
+class TestGetGenericMany:
+    @responses.activate
+    def test_returns_objects_by_id_and_missing_ids(self, grocy):
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/objects/products",
+            callback=lambda request: (
+                200,
+                {},
+                json.dumps(_matching_objects(request.params["query[]"])),
+            ),
+        )
+
+        objects = grocy.get_generic_many(EntityType.PRODUCTS, [3, 1, 3, 5000])
+
+        assert len(responses.calls) == 1
+        assert sorted(objects) == [1, 3]
+        assert objects[3]["name"] == "Product 3"
+        assert objects.missing == (5000,)
+
+    @responses.activate
+    def test_chunks_are_fetched_concurrently(self, grocy):
+        threads = set()
+
+        def callback(request):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return 200, {}, json.dumps(_matching_objects(request.params["query[]"]))
+
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/objects/products", callback=callback
+        )
+
+        objects = grocy.get_generic_many(EntityType.PRODUCTS, range(1, 2001))
+
+        assert len(responses.calls) > 1
+        assert len(threads) > 1
+        assert len(objects) == 1000
+        assert objects.missing == tuple(range(1001, 2001))
+
+    @responses.activate
+    def test_no_ids_makes_no_request(self, grocy):
+        objects = grocy.get_generic_many(EntityType.PRODUCTS, [])
+
+        assert objects == {}
+        assert objects.missing == ()
+
+    def test_async(self):
+        def handler(request: httpx.Request):
+            id_filter = request.url.params["query[]"]
+            return httpx.Response(200, json=_matching_objects(id_filter))
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as grocy:
+                return await grocy.get_generic_many(EntityType.PRODUCTS, [2, 4000])
+
+        objects = asyncio.run(run())
+
+        assert list(objects) == [2]
+        assert objects.missing == (4000,)
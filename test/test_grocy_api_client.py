@@ -1,3 +1,8 @@
+from unittest.mock import patch
+
+import responses
+
+from pygrocytoo.grocy import Grocy
 from pygrocytoo.grocy_api_client import GrocyApiClient
 
 
@@ -21,3 +26,44 @@ class TestGrocyApiClient:
             api_key="", base_url="http://grocy.de", path="my/custom/path"
         )
         assert client._base_url == "http://grocy.de:9192/my/custom/path/api/"
+
+    def test_pool_configuration(self):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", pool_connections=2, pool_maxsize=8
+        )
+        adapter = client.transport.session.get_adapter("http://grocy.de")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 8
+        assert client.transport.session.get_adapter("https://grocy.de") is adapter
+
+    @responses.activate
+    def test_requests_reuse_session(self):
+        responses.add(
+            responses.GET,
+            "http://grocy.de:9192/api/system/db-changed-time",
+            json={"changed_time": "2022-07-10 21:10:53"},
+        )
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+        session = client.transport.session
+        with patch.object(session, "request", wraps=session.request) as request:
+            client.get_last_db_changed()
+            client.get_last_db_changed()
+        assert request.call_count == 2
+
+    def test_close(self):
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+        with patch.object(client.transport.session, "close") as session_close:
+            client.close()
+        session_close.assert_called_once()
+
+    def test_context_manager_closes_session(self):
+        with GrocyApiClient(api_key="", base_url="http://grocy.de") as client:
+            session_close = patch.object(client.transport.session, "close").start()
+        session_close.assert_called_once()
+        patch.stopall()
+
+    def test_grocy_context_manager_closes_client(self):
+        with Grocy("http://grocy.de", "") as grocy:
+            client_close = patch.object(grocy._api_client, "close").start()
+        client_close.assert_called_once()
+        patch.stopall()
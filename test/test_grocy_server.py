@@ -0,0 +1,123 @@
+import datetime
+
+import pytest
+
+from benchmarks.dataset import BARCODE_BASE, PRESETS, generate_dataset
+from benchmarks.grocy_server import GrocyStandIn, apply_query
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy import Grocy
+
+TODAY = datetime.date(2022, 7, 10)
+
+
+@pytest.fixture(scope="module")
+def standin():
+    with GrocyStandIn(generate_dataset("small", seed=1, today=TODAY), today=TODAY) as s:
+        yield s
+
+
+@pytest.fixture
+def grocy(standin):
+    with Grocy(standin.url, "api_key", port=standin.port, verify_ssl=False) as grocy:
+        yield grocy
+
+
+class TestDataset:
+    def test_seeded_and_sized(self):
+        first = generate_dataset("small", seed=3, today=TODAY, products=50)
+
+        assert first == generate_dataset("small", seed=3, today=TODAY, products=50)
+        assert first != generate_dataset("small", seed=4, today=TODAY, products=50)
+        assert len(first["products"]) == 50
+        assert len(first["stock_log"]) == PRESETS["small"]["stock_log"]
+
+    def test_unknown_preset(self):
+        with pytest.raises(ValueError):
+            generate_dataset("huge")
+
+
+class TestApplyQuery:
+    ROWS = [
+        {"id": 1, "name": "Milk", "amount": "2"},
+        {"id": 2, "name": "Oat milk", "amount": "10"},
+        {"id": 3, "name": "Tea", "amount": None},
+    ]
+
+    @pytest.mark.parametrize(
+        "query, ids",
+        [
+            ("id=2", [2]),
+            ("id!=2", [1, 3]),
+            ("name~milk", [1, 2]),
+            ("name!~milk", [3]),
+            ("amount>3", [2]),
+            ("amount<=2", [1]),
+            ("id§^(1|3)$", [1, 3]),
+        ],
+    )
+    def test_filters(self, query, ids):
+        rows = apply_query(self.ROWS, {"query[]": [query]})
+
+        assert [row["id"] for row in rows] == ids
+
+    def test_order_limit_offset(self):
+        params = {"order": ["amount:desc"], "limit": ["2"], "offset": ["1"]}
+
+        assert [row["id"] for row in apply_query(self.ROWS, params)] == [1, 3]
+
+
+class TestGrocyStandIn:
+    def test_reads(self, grocy):
+        assert len(grocy.stock()) > 0
+        assert len(grocy.stock_table(use_numpy=False)) == len(grocy.stock())
+        volatile = grocy.volatile_stock(due_soon_days=5)
+        assert volatile.due_products and volatile.missing_products
+        assert len(grocy.chores(get_details=True)) == PRESETS["small"]["chores"]
+        assert len(grocy.batteries(get_details=True)) == PRESETS["small"]["batteries"]
+        assert all(not task.done for task in grocy.tasks())
+        assert len(grocy.meal_plan(get_details=True)) == PRESETS["small"]["meal_plan"]
+        assert len(grocy.users()) == 5
+        assert grocy.get_system_info().grocy_version == "4.2.0"
+        assert grocy.get_system_time().timezone == "UTC"
+        assert grocy.get_system_config().currency == "EUR"
+        assert len(grocy.product_catalog()) == PRESETS["small"]["products"]
+
+    def test_objects_paging_and_filters(self, grocy):
+        page = grocy.get_generic_objects_for_type(
+            EntityType.PRODUCTS, ["id<50"], order="id:desc", limit=10, offset=5
+        )
+        assert [row["id"] for row in page] == list(range(44, 34, -1))
+
+        objects = grocy.get_generic_many(EntityType.PRODUCTS, [1, 2, 10_000])
+        assert sorted(objects) == [1, 2]
+        assert objects.missing == (10_000,)
+
+    def test_writes(self, standin, grocy):
+        changed = grocy.get_last_db_changed()
+        product = grocy.stock()[0]
+
+        grocy.add_product(product.id, 3, 1.5)
+        grocy.consume_product(product.id, 1)
+        with pytest.raises(GrocyError) as exc_info:
+            grocy.consume_product(product.id, 1_000)
+
+        assert exc_info.value.status_code == 400
+        assert (
+            grocy.product(product.id).available_amount == product.available_amount + 2
+        )
+        assert grocy.get_last_db_changed() > changed
+
+    def test_barcodes(self, grocy):
+        assert grocy.product_by_barcode(str(BARCODE_BASE + 1)).id > 0
+        with pytest.raises(GrocyError):
+            grocy.product_by_barcode("0")
+
+    def test_latency(self, standin, grocy):
+        standin.latency = 0.05
+        try:
+            requests_before = standin.request_count
+            grocy.get_system_info()
+        finally:
+            standin.latency = 0.0
+        assert standin.request_count == requests_before + 1
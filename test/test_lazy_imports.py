@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pygrocytoo
+from pygrocytoo.grocy import Grocy
+
+
+def _loaded_after(statement: str) -> list[str]:
+    code = f"import json, sys\n{statement}\n" "print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestLazyImports:
+    def test_package_import_is_light(self):
+        loaded = _loaded_after("import pygrocytoo")
+
+        for heavy in ("asyncio", "httpx", "pydantic", "requests"):
+            assert heavy not in loaded
+
+    def test_sync_client_does_not_load_async_or_http_stack(self):
+        loaded = _loaded_after("import pygrocytoo.grocy")
+
+        for heavy in ("asyncio", "httpx", "requests"):
+            assert heavy not in loaded
+
+    def test_models_are_built_on_first_use(self):
+        code = (
+            "from pygrocytoo.grocy_api_client import ProductData\n"
+            "print(ProductData.__pydantic_complete__)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+
+        assert output.strip() == "False"
+
+    def test_lazy_exports(self):
+        assert pygrocytoo.Grocy is Grocy
+        assert "ProductCatalog" in dir(pygrocytoo)
+        with pytest.raises(AttributeError):
+            pygrocytoo.Missing
@@ -1,6 +1,12 @@
 import datetime
+import json
+import os
+import re
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
+import responses
+import yaml
 
 from pygrocytoo.data_models.meal_items import (
     MealPlanItemType,
@@ -8,6 +14,51 @@ from pygrocytoo.data_models.meal_items import (
     RecipeItem,
 )
 from pygrocytoo.errors import GrocyError
+from test.test_const import BASE_URL
+
+CASSETTES = os.path.join(os.path.dirname(__file__), "cassettes", "test_meal_plan")
+
+
+def _replay_cassette(name: str):
+    """Serve a cassette recorded before meal plan details were batched.
+
+    The recording fetched each recipe and section on its own. The meal plan
+    requests are replayed as recorded and the rows of the single-object
+    requests answer the batched ``id§^(...)$`` queries.
+    """
+    with open(os.path.join(CASSETTES, f"{name}.yaml"), encoding="utf-8") as file:
+        interactions = yaml.safe_load(file)["interactions"]
+
+    rows = {"recipes": {}, "meal_plan_sections": {}}
+    for interaction in interactions:
+        url = urlsplit(interaction["request"]["uri"])
+        body = json.loads(interaction["response"]["body"]["string"])
+        entity_type, _, object_id = url.path.removeprefix("/api/objects/").partition(
+            "/"
+        )
+        if entity_type == "recipes":
+            rows[entity_type][int(object_id)] = body
+        elif entity_type == "meal_plan_sections":
+            rows[entity_type].update((int(row["id"]), row) for row in body)
+        else:
+            responses.add(
+                responses.GET,
+                f"{BASE_URL}/objects/{entity_type}",
+                json=body,
+                match=[responses.matchers.query_string_matcher(url.query)],
+            )
+
+    def callback(request):
+        entity_type = urlsplit(request.url).path.rsplit("/", 1)[-1]
+        (id_filter,) = parse_qs(urlsplit(request.url).query)["query[]"]
+        ids = [int(object_id) for object_id in re.findall(r"\d+", id_filter)]
+        found = [rows[entity_type][i] for i in ids if i in rows[entity_type]]
+        return 200, {}, json.dumps(found)
+
+    for entity_type in rows:
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/objects/{entity_type}", callback=callback
+        )
 
 
 class TestMealPlan:
@@ -23,8 +74,9 @@ class TestMealPlan:
         assert item.note is None
         assert item.recipe is None
 
-    @pytest.mark.vcr
+    @responses.activate
     def test_get_meal_plan_with_details_valid(self, grocy):
+        _replay_cassette("TestMealPlan.test_get_meal_plan_with_details_valid")
         meal_plan = grocy.meal_plan(get_details=True)
 
         assert len(meal_plan) == 12
@@ -46,8 +98,9 @@ class TestMealPlan:
         section_item = next(item for item in meal_plan if item.section_id == 1)
         assert isinstance(section_item.section, MealPlanSection)
 
-    @pytest.mark.vcr
+    @responses.activate
     def test_get_meal_plan_with_note_and_details(self, grocy):
+        _replay_cassette("TestMealPlan.test_get_meal_plan_with_note_and_details")
         meal_plan = grocy.meal_plan(get_details=True)
 
         note_entry = next(
@@ -55,8 +108,9 @@ class TestMealPlan:
         )
         assert note_entry.note == "This is a note"
 
-    @pytest.mark.vcr
+    @responses.activate
     def test_get_meal_plan_with_product(self, grocy):
+        _replay_cassette("TestMealPlan.test_get_meal_plan_with_product")
         meal_plan = grocy.meal_plan(get_details=True)
 
         product_entry = next(
@@ -64,8 +118,9 @@ class TestMealPlan:
         )
         assert product_entry.product_id == 3
 
-    @pytest.mark.vcr
+    @responses.activate
     def test_get_meal_plan_filters_valid(self, grocy):
+        _replay_cassette("TestMealPlan.test_get_meal_plan_filters_valid")
         query_filter = ["day>=2022-06-15", "product_amount>0"]
         meal_plans = grocy.meal_plan(get_details=True, query_filters=query_filter)
 
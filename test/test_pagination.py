@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import httpx
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.data_models.generic import EntityType
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT
+
+STOCK_LOG = [{"id": row_id} for row_id in range(1, 8)]
+
+
+def _paged_callback(request):
+    limit = int(request.params.get("limit", len(STOCK_LOG)))
+    offset = int(request.params.get("offset", 0))
+    return 200, {}, json.dumps(STOCK_LOG[offset:][:limit])
+
+
+class TestPagination:
+    @responses.activate
+    def test_generic_objects_parameters(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/objects/stock_log", json=[])
+
+        grocy.get_generic_objects_for_type(
+            EntityType.STOCK_LOG, ["amount>0"], order="id:desc", limit=50
+        )
+
+        assert responses.calls[0].request.params == {
+            "query[]": "amount>0",
+            "order": "id:desc",
+            "limit": "50",
+        }
+
+    @responses.activate
+    def test_object_getters_parameters(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/objects/shopping_list", json=[])
+        responses.add(responses.GET, f"{BASE_URL}/objects/product_groups", json=[])
+
+        grocy.shopping_list(limit=20, offset=40)
+        grocy.product_groups(order="name")
+
+        assert [call.request.params for call in responses.calls] == [
+            {"limit": "20", "offset": "40"},
+            {"order": "name"},
+        ]
+
+    @responses.activate
+    def test_pages_are_fetched_lazily(self, grocy):
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/objects/stock_log", callback=_paged_callback
+        )
+
+        pages = grocy.iter_generic_object_pages(EntityType.STOCK_LOG, 3, order="id")
+        assert len(responses.calls) == 0
+
+        first_page = next(pages)
+        assert first_page == STOCK_LOG[:3]
+        assert len(responses.calls) == 1
+
+        assert list(pages) == [STOCK_LOG[3:6], STOCK_LOG[6:]]
+        assert [call.request.params.get("offset") for call in responses.calls] == [
+            "0",
+            "3",
+            "6",
+        ]
+
+    @responses.activate
+    def test_full_last_page_ends_with_empty_page(self, grocy):
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/objects/stock_log", callback=_paged_callback
+        )
+
+        pages = list(grocy.iter_generic_object_pages(EntityType.STOCK_LOG, 7))
+
+        assert pages == [STOCK_LOG]
+        assert len(responses.calls) == 2
+
+    def test_async_pages(self):
+        def handler(request: httpx.Request):
+            limit = int(request.url.params["limit"])
+            offset = int(request.url.params["offset"])
+            return httpx.Response(200, json=STOCK_LOG[offset:][:limit])
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as grocy:
+                pages = grocy.iter_generic_object_pages(EntityType.STOCK_LOG, 4)
+                return [page async for page in pages]
+
+        assert asyncio.run(run()) == [STOCK_LOG[:4], STOCK_LOG[4:]]
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+import responses
+
+from pygrocytoo.data_models.product import Product
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.grocy_api_client import (
+    CurrentStockResponse,
+    ProductData,
+    ProductDetailsResponse,
+    SystemConfigDto,
+)
+from pygrocytoo.parsing import _adapter, parse_list, parse_model
+from test.payloads import PRODUCT_DATA, product_details, stock_entry
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT, CONST_SSL
+
+
+class TestModelValidation:
+    def test_matches_kwargs_construction(self):
+        details = product_details(1)
+
+        validated = parse_model(ProductDetailsResponse, json.dumps(details).encode())
+
+        assert validated == ProductDetailsResponse(**details)
+        assert validated.barcodes[0].barcode == "01"
+
+    @pytest.mark.parametrize("content", [b"", b"null", b"{}"])
+    def test_empty_responses(self, content):
+        assert parse_model(ProductDetailsResponse, content) is None
+
+    def test_model_validators_run(self):
+        config = {
+            "USER_USERNAME": "admin",
+            "BASE_PATH": "",
+            "BASE_URL": "/",
+            "MODE": "demo",
+            "DEFAULT_LOCALE": "en",
+            "LOCALE": "en",
+            "CURRENCY": "EUR",
+            "FEATURE_FLAG_STOCK": True,
+        }
+
+        validated = parse_model(SystemConfigDto, json.dumps(config).encode())
+
+        assert validated.feature_flags == {"FEATURE_FLAG_STOCK": True}
+
+
+class TestListValidation:
+    def test_matches_per_item_construction(self):
+        entries = [stock_entry(product_id) for product_id in range(1, 4)]
+
+        validated = parse_list(CurrentStockResponse, json.dumps(entries).encode())
+
+        assert validated == [CurrentStockResponse(**entry) for entry in entries]
+        assert validated[0].product.product_group_id is None
+
+    @pytest.mark.parametrize("content", [b"", b"null", b"[]"])
+    def test_empty_responses(self, content):
+        assert parse_list(ProductData, content) == []
+
+    def test_adapter_is_cached(self):
+        assert _adapter(list[ProductData]) is _adapter(list[ProductData])
+
+    @responses.activate
+    def test_all_products(self):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/objects/products",
+            json=[PRODUCT_DATA, {**PRODUCT_DATA, "id": 2, "name": "Milk"}],
+        )
+        grocy = Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT
+        )
+
+        products = grocy.all_products()
+
+        assert all(isinstance(product, Product) for product in products)
+        assert [product.name for product in products] == ["Cookies", "Milk"]
+        assert products[0].product_group_id is None
@@ -0,0 +1,118 @@
+import datetime
+import gzip
+import json
+
+import pytest
+
+from benchmarks.dataset import generate_dataset
+from benchmarks.grocy_server import GrocyStandIn
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.replay import RecordingTransport, ReplayTransport
+from pygrocytoo.transport import InProcessTransport
+
+TODAY = datetime.date(2022, 7, 10)
+
+
+@pytest.fixture
+def standin():
+    standin = GrocyStandIn(generate_dataset("small", seed=5, today=TODAY), today=TODAY)
+    yield standin
+    standin.stop()
+
+
+def _grocy(transport) -> Grocy:
+    return Grocy("http://grocy.de", "api_key", transport=transport)
+
+
+def test_replay_serves_the_recorded_responses(standin, tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    recorder = RecordingTransport(standin.transport(), path)
+    with _grocy(recorder) as grocy:
+        stock = [product.as_dict() for product in grocy.stock()]
+        chores = [chore.as_dict() for chore in grocy.chores(get_details=True)]
+        with pytest.raises(GrocyError):
+            grocy.product_by_barcode("0")
+
+    replayer = ReplayTransport(path, latency_scale=0)
+    grocy = _grocy(replayer)
+
+    for _ in range(3):
+        assert [product.as_dict() for product in grocy.stock()] == stock
+        assert [chore.as_dict() for chore in grocy.chores(get_details=True)] == chores
+        with pytest.raises(GrocyError) as exc_info:
+            grocy.product_by_barcode("0")
+        assert exc_info.value.status_code == 400
+    assert replayer.served == 3 * len(recorder.exchanges)
+
+
+def test_repeated_requests_are_served_in_order(standin, tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    recorder = RecordingTransport(standin.transport())
+    grocy = _grocy(recorder)
+    product = grocy.stock()[0]
+    before = grocy.product(product.id).available_amount
+    grocy.add_product(product.id, 2, 1.0)
+    after = grocy.product(product.id).available_amount
+    recorder.save(path)
+
+    replayer = ReplayTransport(path, latency_scale=0)
+    grocy = _grocy(replayer)
+
+    assert grocy.product(product.id).available_amount == before
+    assert grocy.product(product.id).available_amount == after
+    assert grocy.product(product.id).available_amount == before
+    replayer.rewind()
+    assert grocy.product(product.id).available_amount == before
+
+
+def test_bodies_are_stored_once_and_compressed(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    recorder = RecordingTransport(
+        InProcessTransport(lambda method, target, headers, body: (200, b"\xff\x00"))
+    )
+    for _ in range(3):
+        recorder.request("GET", "http://h/api/files/productpictures/a", {})
+    recorder.save(path)
+
+    with gzip.open(path, "rt") as file:
+        recording = json.load(file)
+
+    assert len(recording["exchanges"]) == 3
+    assert recording["bodies"] == [{"base64": "/wA="}]
+    response = ReplayTransport(path, 0).request(
+        "GET", "http://h/api/files/productpictures/a", {}
+    )
+    assert response.content == b"\xff\x00"
+
+
+def test_latency_is_scaled(standin, tmp_path, monkeypatch):
+    path = str(tmp_path / "run.json.gz")
+    with _grocy(RecordingTransport(standin.transport(), path)) as grocy:
+        grocy.get_system_info()
+    with gzip.open(path, "rt") as file:
+        elapsed = json.load(file)["exchanges"][0]["elapsed"]
+    sleeps = []
+    monkeypatch.setattr("pygrocytoo.replay.time.sleep", sleeps.append)
+
+    _grocy(ReplayTransport(path, latency_scale=2.0)).get_system_info()
+
+    assert sleeps == [elapsed * 2.0]
+
+
+def test_unrecorded_request(standin, tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    with _grocy(RecordingTransport(standin.transport(), path)) as grocy:
+        grocy.get_system_info()
+
+    with pytest.raises(LookupError):
+        _grocy(ReplayTransport(path, 0)).get_system_time()
+
+
+def test_unknown_version(tmp_path):
+    path = str(tmp_path / "run.json.gz")
+    with gzip.open(path, "wt") as file:
+        json.dump({"version": 99, "bodies": [], "exchanges": []}, file)
+
+    with pytest.raises(ValueError):
+        ReplayTransport(path)
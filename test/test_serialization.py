@@ -0,0 +1,105 @@
+import io
+import json
+from datetime import datetime
+
+from pygrocytoo.base import DataModel, dump_json
+from pygrocytoo.data_models.chore import Chore
+from pygrocytoo.data_models.product import Product, ProductBarcode
+from pygrocytoo.grocy_api_client import (
+    ChoreDetailsResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    ProductBarcodeData,
+    TransactionType,
+)
+from test.payloads import stock_entry
+
+
+def _product(product_id: int) -> Product:
+    product = Product(CurrentStockResponse(**stock_entry(product_id)))
+    product.apply_catalog_data(
+        [ProductBarcode(ProductBarcodeData(barcode=f"{product_id:04}"))], None
+    )
+    return product
+
+
+class _Entry(Product):
+    __slots__ = ("_transaction_type",)
+
+    def __init__(self, data, transaction_type: TransactionType):
+        super().__init__(data)
+        self._transaction_type = transaction_type
+
+    @property
+    def transaction_type(self) -> TransactionType:
+        return self._transaction_type
+
+    @property
+    def name(self) -> str:
+        return "Entry"
+
+
+class TestSerialization:
+    def test_nested_models_and_dates(self):
+        product = _product(1)
+
+        data = product.as_dict()
+        assert data["product_barcodes"] == [{"barcode": "0001", "amount": None}]
+        assert isinstance(data["best_before_date"], datetime)
+
+        parsed = json.loads(product.to_json())
+        assert parsed["best_before_date"] == "2022-07-20T00:00:00"
+        assert parsed["barcodes"] == ["0001"]
+
+    def test_enums_are_written_as_values(self):
+        chore = Chore(
+            ChoreDetailsResponse(
+                chore={
+                    "id": 1,
+                    "name": "Vacuum",
+                    "period_type": "weekly",
+                    "track_date_only": 0,
+                    "rollover": 0,
+                },
+            )
+        )
+
+        assert json.loads(chore.to_json())["period_type"] == "weekly"
+
+    def test_inherited_properties(self):
+        entry = _Entry(CurrentStockResponse(**stock_entry(1)), TransactionType.CONSUME)
+
+        data = json.loads(entry.to_json())
+
+        assert data["transaction_type"] == "consume"
+        assert data["name"] == "Entry"
+        assert data["available_amount"] == 2
+        assert list(data).index("name") < list(data).index("transaction_type")
+
+    def test_unset_attributes_are_none(self):
+        chore = Chore(CurrentChoreResponse(chore_id=1))
+
+        data = chore.as_dict()
+
+        assert data["id"] == 1
+        assert data["description"] is None
+
+    def test_dump_json(self):
+        products = [_product(product_id) for product_id in range(1, 2502)]
+        fp = io.StringIO()
+
+        dump_json(products, fp)
+
+        parsed = json.loads(fp.getvalue())
+        assert len(parsed) == 2501
+        assert parsed[-1] == json.loads(products[-1].to_json())
+
+    def test_dump_json_empty(self):
+        fp = io.StringIO()
+
+        dump_json(iter([]), fp)
+
+        assert fp.getvalue() == "[]"
+
+    def test_plain_data_model(self):
+        assert DataModel().as_dict() == {}
@@ -0,0 +1,294 @@
+import asyncio
+import contextlib
+import json
+import threading
+import time
+
+import httpx
+import responses
+
+from pygrocytoo.async_grocy_api_client import AsyncGrocyApiClient
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy_api_client import GrocyApiClient
+from pygrocytoo.singleflight import AsyncSingleFlight, SingleFlight
+from pygrocytoo.transport import InProcessTransport
+from test.payloads import stock_entry
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT, CONST_SSL
+
+VOLATILE_STOCK = {"due_products": [], "missing_products": []}
+
+
+def _wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _run_threads(target, count: int) -> list:
+    results = [None] * count
+
+    def run(index):
+        results[index] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        executions = []
+
+        def fetch():
+            executions.append(1)
+            _wait_for(lambda: single_flight.coalesced == 3)
+            return b"[]"
+
+        results = _run_threads(lambda: single_flight.do("stock", fetch), 4)
+
+        assert results == [b"[]"] * 4
+        assert len(executions) == 1
+        assert single_flight.coalesced == 3
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+        errors = []
+
+        def fetch():
+            _wait_for(lambda: single_flight.coalesced == 1)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                single_flight.do("stock", fetch)
+            except ValueError as error:
+                errors.append(error)
+
+        _run_threads(call, 2)
+
+        assert len(errors) == 2
+
+    def test_sequential_calls_are_not_coalesced(self):
+        single_flight = SingleFlight()
+
+        single_flight.do("stock", lambda: 1)
+        single_flight.do("stock", lambda: 2)
+
+        assert single_flight.coalesced == 0
+
+    def test_async_concurrent_calls_share_one_execution(self):
+        single_flight = AsyncSingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return b"[]"
+
+        async def run():
+            return await asyncio.gather(
+                *(single_flight.do("stock", fetch) for _ in range(4))
+            )
+
+        assert asyncio.run(run()) == [b"[]"] * 4
+        assert len(executions) == 1
+        assert single_flight.coalesced == 3
+
+    def test_async_errors_are_shared(self):
+        single_flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                *(single_flight.do("stock", fetch) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_forgotten_calls_are_not_joined(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return 1
+
+        leader = threading.Thread(target=single_flight.do, args=("stock", slow))
+        leader.start()
+        started.wait(5)
+        single_flight.forget()
+        result = single_flight.do("stock", lambda: 2)
+        release.set()
+        leader.join(5)
+
+        assert result == 2
+        assert single_flight.coalesced == 0
+        assert single_flight.do("stock", lambda: 3) == 3
+
+    def test_async_cancelled_leader_does_not_cancel_followers(self):
+        single_flight = AsyncSingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.05)
+            return b"[]"
+
+        async def run():
+            leader = asyncio.ensure_future(single_flight.do("stock", fetch))
+            follower = asyncio.ensure_future(single_flight.do("stock", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(leader, follower, return_exceptions=True)
+
+        leader, follower = asyncio.run(run())
+
+        assert isinstance(leader, asyncio.CancelledError)
+        assert follower == b"[]"
+        assert len(executions) == 1
+
+    def test_async_call_is_cancelled_with_its_last_caller(self):
+        single_flight = AsyncSingleFlight()
+        cancelled = []
+
+        async def fetch():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        async def run():
+            for _ in range(2):
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(single_flight.do("stock", fetch), 0.01)
+            await asyncio.sleep(0)
+            return await single_flight.do("stock", lambda: asyncio.sleep(0, b"[]"))
+
+        assert asyncio.run(run()) == b"[]"
+        assert cancelled == [1, 1]
+
+
+class TestClientCoalescing:
+    @responses.activate
+    def test_identical_gets_are_coalesced(self):
+        client = GrocyApiClient(
+            CONST_BASE_URL, "demo_mode", port=CONST_PORT, verify_ssl=CONST_SSL
+        )
+
+        def callback(request):
+            _wait_for(lambda: client.coalesced_requests == 3)
+            return 200, {}, '{"due_products": []}'
+
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/stock/volatile", callback=callback
+        )
+
+        results = _run_threads(client.get_volatile_stock, 4)
+
+        assert len(responses.calls) == 1
+        assert client.coalesced_requests == 3
+        assert all(result.due_products == [] for result in results)
+
+    @responses.activate
+    def test_coalescing_can_be_disabled(self):
+        responses.add(responses.GET, f"{BASE_URL}/stock/volatile", json=VOLATILE_STOCK)
+        client = GrocyApiClient(
+            CONST_BASE_URL,
+            "demo_mode",
+            port=CONST_PORT,
+            verify_ssl=CONST_SSL,
+            coalesce_requests=False,
+        )
+
+        _run_threads(client.get_volatile_stock, 2)
+
+        assert len(responses.calls) == 2
+        assert client.coalesced_requests == 0
+
+    def test_async_identical_gets_are_coalesced(self):
+        calls = []
+
+        async def handler(request: httpx.Request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=VOLATILE_STOCK)
+
+        async def run():
+            async with AsyncGrocyApiClient(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                results = await asyncio.gather(
+                    *(client.get_volatile_stock() for _ in range(4))
+                )
+                return client, results
+
+        client, results = asyncio.run(run())
+
+        assert calls == ["/api/stock/volatile"]
+        assert client.coalesced_requests == 3
+        assert len(results) == 4
+
+    def test_async_errors_reach_every_caller(self):
+        async def handler(request: httpx.Request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(400, json={"error_message": "Nope"})
+
+        async def run():
+            async with AsyncGrocyApiClient(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get_stock() for _ in range(2)), return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 2
+        assert all(isinstance(result, GrocyError) for result in results)
+
+    def test_gets_after_a_write_do_not_join_earlier_calls(self):
+        amount = [2]
+        in_flight = threading.Event()
+        release = threading.Event()
+
+        def handler(method, target, headers, body):
+            if method == "POST":
+                amount[0] -= 1
+                return 200, b"[]"
+            content = json.dumps([{**stock_entry(1), "amount": amount[0]}])
+            if not in_flight.is_set():
+                in_flight.set()
+                release.wait(5)
+            return 200, content.encode()
+
+        client = GrocyApiClient(
+            "http://grocy.de", "demo_mode", transport=InProcessTransport(handler)
+        )
+        reader = threading.Thread(target=client.get_stock)
+        reader.start()
+        in_flight.wait(5)
+        client.consume_product(1)
+        stock = client.get_stock()
+        release.set()
+        reader.join(5)
+
+        assert stock[0].amount == 1
+        assert client.coalesced_requests == 0
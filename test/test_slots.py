@@ -0,0 +1,49 @@
+import pytest
+
+from pygrocytoo.base import DataModel
+from pygrocytoo.data_models.chore import Chore
+from pygrocytoo.data_models.product import ShoppingListProduct
+from pygrocytoo.grocy_api_client import CurrentChoreResponse, ShoppingListItem
+
+
+def _subclasses(cls: type) -> list[type]:
+    return [
+        klass
+        for subclass in cls.__subclasses__()
+        for klass in (subclass, *_subclasses(subclass))
+    ]
+
+
+class TestSlots:
+    @pytest.mark.parametrize("model", _subclasses(DataModel))
+    def test_models_have_no_instance_dict(self, model):
+        assert "__dict__" not in dir(model)
+        assert not hasattr(model.__new__(model), "__dict__")
+
+    def test_models_still_serialize(self):
+        item = ShoppingListProduct(
+            ShoppingListItem(
+                id=1,
+                product_id=2,
+                amount=1,
+                row_created_timestamp="2022-04-22 08:37:58",
+                shopping_list_id=1,
+                done=0,
+            )
+        )
+
+        assert item.as_dict()["product_id"] == 2
+        assert '"product_id": 2' in item.to_json()
+
+    def test_unset_attributes_raise(self):
+        chore = Chore(
+            CurrentChoreResponse(
+                chore_id=1, last_tracked_time=None, next_estimated_execution_time=None
+            )
+        )
+
+        assert chore.id == 1
+        with pytest.raises(AttributeError):
+            chore.description
+        with pytest.raises(AttributeError):
+            chore.new_attribute = 1
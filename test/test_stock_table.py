@@ -0,0 +1,115 @@
+import datetime
+import json
+
+import pytest
+import responses
+
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.stock_table import NO_GROUP, StockTable, epoch_days
+from test.payloads import PRODUCT_DATA
+from test.test_const import CONST_BASE_URL, CONST_PORT, CONST_SSL
+
+TODAY = datetime.date(2022, 7, 10)
+
+
+def _entry(product_id, amount, opened, best_before, group_id) -> dict:
+    return {
+        "product_id": product_id,
+        "amount": str(amount),
+        "amount_aggregated": str(amount),
+        "amount_opened": str(opened),
+        "amount_opened_aggregated": str(opened),
+        "best_before_date": best_before,
+        "is_aggregated_amount": "0",
+        "product": {**PRODUCT_DATA, "id": product_id, "product_group_id": group_id},
+    }
+
+
+STOCK = [
+    _entry(1, 2, 1, "2022-07-11", "1"),
+    _entry(2, 5, 0, "2022-07-20", "2"),
+    _entry(3, 1, 0.5, "2022-07-08", "1"),
+    _entry(4, 3, 2, "2999-12-31", ""),
+    _entry(5, 4, 0, "2022-07-13 00:00:00", "2"),
+]
+CONTENT = json.dumps(STOCK).encode()
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "array"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def _ids(table: StockTable) -> list[int]:
+    return list(table["product_id"])
+
+
+class TestStockTable:
+    def test_columns(self, use_numpy):
+        table = StockTable.from_json(CONTENT, use_numpy)
+
+        assert table.uses_numpy is use_numpy
+        assert len(table) == 5
+        assert list(table["amount_opened"]) == [1, 0, 0.5, 2, 0]
+        assert list(table["product_group_id"]) == [1, 2, 1, NO_GROUP, 2]
+        assert table["best_before_days"][0] == epoch_days(datetime.date(2022, 7, 11))
+        assert table.rows()[1] == {
+            "product_id": 2,
+            "amount": 5.0,
+            "amount_opened": 0.0,
+            "amount_aggregated": 5.0,
+            "best_before_days": epoch_days(datetime.date(2022, 7, 20)),
+            "product_group_id": 2,
+        }
+
+    def test_expiring_within(self, use_numpy):
+        table = StockTable.from_json(CONTENT, use_numpy)
+
+        assert _ids(table.expiring_within(3, today=TODAY)) == [1, 3, 5]
+        assert _ids(table.expiring_within(0, today=TODAY)) == [3]
+
+    def test_where_and_filter(self, use_numpy):
+        table = StockTable.from_json(CONTENT, use_numpy)
+
+        opened = table.where("amount_opened", ">", 0)
+        assert _ids(opened) == [1, 3, 4]
+        assert _ids(opened.where("product_group_id", "==", 1)) == [1, 3]
+        mask = [amount >= 3 for amount in table["amount"]]
+        assert _ids(table.filter(mask)) == [2, 4, 5]
+
+    def test_sum_by(self, use_numpy):
+        table = StockTable.from_json(CONTENT, use_numpy)
+
+        assert table.sum_by("amount_opened") == {NO_GROUP: 2.0, 1: 1.5, 2: 0.0}
+        assert table.where("product_group_id", "!=", NO_GROUP).sum_by("amount") == {
+            1: 3.0,
+            2: 9.0,
+        }
+
+    def test_sort_by(self, use_numpy):
+        table = StockTable.from_json(CONTENT, use_numpy)
+
+        assert _ids(table.sort_by("best_before_days")) == [3, 1, 5, 2, 4]
+        assert _ids(table.sort_by("amount_opened", descending=True)) == [4, 1, 3, 2, 5]
+
+    def test_empty_body(self, use_numpy):
+        table = StockTable.from_json(b"[]", use_numpy)
+
+        assert len(table) == 0
+        assert table.sum_by("amount") == {}
+        assert len(table.expiring_within(3)) == 0
+
+    @responses.activate
+    def test_grocy_stock_table(self):
+        responses.add(
+            responses.GET, f"{CONST_BASE_URL}:{CONST_PORT}/api/stock", body=CONTENT
+        )
+        grocy = Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT
+        )
+
+        table = grocy.stock_table(use_numpy=False)
+
+        assert table.sum_by("amount") == {NO_GROUP: 3.0, 1: 3.0, 2: 9.0}
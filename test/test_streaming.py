@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import responses
+
+from pygrocytoo.async_grocy import AsyncGrocy
+from pygrocytoo.data_models.generic import EntityType
+from pygrocytoo.data_models.product import Product
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.parsing import JsonArrayParser
+from test.payloads import PRODUCT_DATA, stock_entry
+from test.test_const import BASE_URL, CONST_BASE_URL, CONST_PORT
+
+ITEMS = [
+    stock_entry(1),
+    {"id": 2, "name": "Grüntee", "tags": [1, {"a": None}]},
+    12345,
+    -0.5e3,
+    "text",
+    True,
+    None,
+]
+
+
+def _parse(content: bytes, chunk_size: int) -> list:
+    parser = JsonArrayParser()
+    items = []
+    for start in range(0, len(content), chunk_size):
+        end = start + chunk_size
+        items += parser.feed(content[start:end])
+    return items + parser.close()
+
+
+class TestJsonArrayParser:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 1 << 20])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_any_chunking(self, chunk_size, indent):
+        content = json.dumps(ITEMS, indent=indent, ensure_ascii=False).encode()
+
+        assert _parse(content, chunk_size) == ITEMS
+
+    def test_items_are_returned_as_they_complete(self):
+        parser = JsonArrayParser()
+
+        assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b": 2}, 3") == [{"id": 2}]
+        assert parser.feed(b"4]") == [34]
+        assert parser.close() == []
+
+    @pytest.mark.parametrize("content", [b"", b"null", b"[]", b" [ ]\n"])
+    def test_empty(self, content):
+        assert _parse(content, 1) == []
+
+    @pytest.mark.parametrize(
+        "content", [b"[1, 2", b"{}", b"[1 2]", b"[1,]", b"[,1]", b"[1.x]", b"[]x"]
+    )
+    def test_invalid(self, content):
+        with pytest.raises(ValueError):
+            _parse(content, 1)
+
+
+class TestStreaming:
+    @responses.activate
+    def test_iter_stock(self, grocy):
+        responses.add(
+            responses.GET, f"{BASE_URL}/stock", json=[stock_entry(1), stock_entry(2)]
+        )
+
+        stock = grocy.iter_stock()
+
+        assert not isinstance(stock, list)
+        products = list(stock)
+        assert all(isinstance(product, Product) for product in products)
+        assert [product.id for product in products] == [1, 2]
+
+    @responses.activate
+    def test_iter_all_products(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/objects/products",
+            json=[PRODUCT_DATA, {**PRODUCT_DATA, "id": 2, "name": "Milk"}],
+        )
+
+        products = list(grocy.iter_all_products())
+
+        assert [product.name for product in products] == ["Cookies", "Milk"]
+        assert products[0].product_group_id is None
+
+    @responses.activate
+    def test_iter_generic_objects(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/objects/stock_log",
+            json=[{"id": 1}, {"id": 2}],
+        )
+
+        objects = grocy.iter_generic_objects(EntityType.STOCK_LOG, ["id<3"])
+
+        assert list(objects) == [{"id": 1}, {"id": 2}]
+        assert responses.calls[0].request.params == {"query[]": "id<3"}
+
+    @responses.activate
+    def test_error(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/stock",
+            status=400,
+            json={"error_message": "Nope"},
+        )
+
+        with pytest.raises(GrocyError) as exc_info:
+            list(grocy.iter_stock())
+        assert exc_info.value.message == "Nope"
+
+    def test_async_iter_stock(self):
+        def handler(request: httpx.Request):
+            return httpx.Response(200, json=[stock_entry(1), stock_entry(2)])
+
+        async def run():
+            async with AsyncGrocy(
+                CONST_BASE_URL,
+                "demo_mode",
+                port=CONST_PORT,
+                transport=httpx.MockTransport(handler),
+            ) as grocy:
+                return [product.id async for product in grocy.iter_stock()]
+
+        assert asyncio.run(run()) == [1, 2]
@@ -0,0 +1,188 @@
+import datetime
+import socket
+
+import pytest
+
+from benchmarks.dataset import BARCODE_BASE, PRESETS, generate_dataset
+from benchmarks.grocy_server import GrocyStandIn
+from pygrocytoo.errors import GrocyError
+from pygrocytoo.grocy import Grocy
+from pygrocytoo.transport import (
+    InProcessTransport,
+    Transport,
+    TransportResponse,
+    UnixSocketTransport,
+    _request_target,
+)
+
+TODAY = datetime.date(2022, 7, 10)
+
+
+def _tables():
+    return generate_dataset("small", seed=2, today=TODAY)
+
+
+@pytest.fixture
+def inprocess():
+    standin = GrocyStandIn(_tables(), today=TODAY)
+    yield standin
+    standin.stop()
+
+
+@pytest.fixture
+def unix_standin(tmp_path):
+    socket_path = str(tmp_path / "grocy.sock")
+    with GrocyStandIn(_tables(), today=TODAY, unix_socket=socket_path) as standin:
+        yield standin
+
+
+def _grocy(standin, transport) -> Grocy:
+    return Grocy(standin.url, "api_key", port=standin.port, transport=transport)
+
+
+class TestRequestTarget:
+    def test_params_are_encoded_like_requests(self):
+        target = _request_target(
+            "http://grocy.de:9192/api/objects/products",
+            {"query[]": ["id<5", "name=Tea"], "limit": 2, "offset": None},
+        )
+
+        assert target == (
+            "/api/objects/products?query%5B%5D=id%3C5&query%5B%5D=name%3DTea&limit=2"
+        )
+
+    def test_existing_query_is_kept(self):
+        assert _request_target("http://h/api/a?x=1", {"y": 2}) == "/api/a?x=1&y=2"
+        assert _request_target("http://h/api/a", None) == "/api/a"
+
+
+class TestTransport:
+    def test_request_must_be_implemented(self):
+        class Incomplete(Transport):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestTransportResponse:
+    def test_body(self):
+        response = TransportResponse(400, content=b'{"error_message": "No"}')
+
+        assert response.json() == {"error_message": "No"}
+        assert response.text == '{"error_message": "No"}'
+        assert list(response.iter_content(10)) == [
+            b'{"error_me',
+            b'ssage": "N',
+            b'o"}',
+        ]
+
+    def test_streamed_body_releases_connection_once_read(self):
+        chunks = [b"abc", b"de", b""]
+        released = []
+        response = TransportResponse(
+            200, read=lambda size: chunks.pop(0), release=released.append
+        )
+
+        with response:
+            assert list(response.iter_content(3)) == [b"abc", b"de"]
+
+        assert released == [True]
+
+    def test_unread_streamed_body_drops_connection(self):
+        released = []
+        response = TransportResponse(
+            200, read=lambda size: b"x", release=released.append
+        )
+
+        response.close()
+        response.close()
+
+        assert released == [False]
+
+
+class TestInProcessTransport:
+    def test_handler_gets_target_and_body(self):
+        calls = []
+
+        def handler(method, target, headers, body):
+            calls.append((method, target, body))
+            return 204, b""
+
+        client = Grocy("http://grocy.de", "key", transport=InProcessTransport(handler))
+        client.add_product(1, 2, 1.5)
+
+        assert calls[0][0] == "POST"
+        assert calls[0][1] == "/api/stock/products/1/add"
+        assert b'"amount": 2' in calls[0][2]
+
+    def test_reads_writes_and_errors(self, inprocess):
+        grocy = _grocy(inprocess, inprocess.transport())
+
+        product = grocy.stock()[0]
+        grocy.add_product(product.id, 3, 1.5)
+        assert (
+            grocy.product(product.id).available_amount == product.available_amount + 3
+        )
+        assert len(grocy.chores(get_details=True)) == PRESETS["small"]["chores"]
+        assert len(list(grocy.iter_all_products())) == PRESETS["small"]["products"]
+        with pytest.raises(GrocyError) as exc_info:
+            grocy.product_by_barcode("0")
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.message
+
+
+class TestUnixSocketTransport:
+    def test_reads_writes_and_errors(self, unix_standin):
+        transport = UnixSocketTransport(unix_standin.unix_socket)
+        with _grocy(unix_standin, transport) as grocy:
+            barcode = str(BARCODE_BASE + 1)
+            before = grocy.product_by_barcode(barcode).available_amount
+            grocy.add_product_by_barcode(barcode, 2, 1.0)
+
+            assert grocy.product_by_barcode(barcode).available_amount == before + 2
+            assert len(list(grocy.iter_stock())) == len(grocy.stock())
+            with pytest.raises(GrocyError) as exc_info:
+                grocy.consume_product_by_barcode(barcode, 10_000)
+            assert exc_info.value.status_code == 400
+
+    def test_connections_are_reused(self, unix_standin):
+        transport = UnixSocketTransport(unix_standin.unix_socket, pool_maxsize=1)
+        grocy = _grocy(unix_standin, transport)
+
+        grocy.get_system_info()
+        connection = transport._idle[0]
+        grocy.get_system_time()
+
+        assert transport._idle == [connection]
+        grocy.close()
+        assert transport._idle == []
+
+    def test_reconnects_after_server_closed_connection(self, unix_standin):
+        transport = UnixSocketTransport(unix_standin.unix_socket)
+        grocy = _grocy(unix_standin, transport)
+        grocy.get_system_info()
+        # The server closes its end once it reads EOF, like an idle timeout.
+        transport._idle[0].sock.shutdown(socket.SHUT_WR)
+
+        assert grocy.get_system_info().grocy_version == "4.2.0"
+
+    @pytest.mark.parametrize("method, retried", [("GET", True), ("POST", False)])
+    def test_only_gets_are_retried_once_sent(self, unix_standin, method, retried):
+        transport = UnixSocketTransport(unix_standin.unix_socket)
+        _grocy(unix_standin, transport).get_system_info()
+        connection = transport._idle[0]
+        getresponse = connection.getresponse
+
+        def lost_response():
+            getresponse().read()
+            raise ConnectionResetError("lost")
+
+        connection.getresponse = lost_response
+        url = f"{unix_standin.url}:{unix_standin.port}/api/system/info"
+
+        if retried:
+            assert transport.request(method, url, {}).status_code == 200
+        else:
+            with pytest.raises(ConnectionResetError):
+                transport.request(method, url, {})
@@ -0,0 +1,82 @@
+import json
+import re
+
+import pytest
+import responses
+
+from pygrocytoo.data_models.product import VolatileStock
+from test.payloads import product_details, stock_entry
+from test.test_const import BASE_URL
+
+VOLATILE_STOCK = {
+    "due_products": [stock_entry(1)],
+    "overdue_products": [stock_entry(2)],
+    "expired_products": [stock_entry(3)],
+    "missing_products": [
+        {"id": 4, "name": "Flour", "amount_missing": 2, "is_partly_in_stock": 0}
+    ],
+}
+
+
+class TestVolatileStock:
+    @responses.activate
+    def test_all_categories_from_one_request(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/stock/volatile", json=VOLATILE_STOCK)
+
+        volatile = grocy.volatile_stock()
+
+        assert isinstance(volatile, VolatileStock)
+        assert len(responses.calls) == 1
+        assert [product.id for product in volatile.due_products] == [1]
+        assert [product.id for product in volatile.overdue_products] == [2]
+        assert [product.id for product in volatile.expired_products] == [3]
+        assert [product.name for product in volatile.missing_products] == ["Flour"]
+        assert [product.id for product in volatile.all_products] == [1, 2, 3, 4]
+
+    @responses.activate
+    def test_missing_categories_are_empty(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/stock/volatile", json={})
+
+        volatile = grocy.volatile_stock()
+
+        assert volatile.due_products == []
+        assert volatile.missing_products == []
+
+    @responses.activate
+    def test_due_soon_days_is_sent(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/stock/volatile", json=VOLATILE_STOCK)
+
+        grocy.volatile_stock(due_soon_days=3)
+        grocy.due_products(due_soon_days=7)
+        grocy.overdue_products()
+
+        assert [call.request.params for call in responses.calls] == [
+            {"due_soon_days": "3"},
+            {"due_soon_days": "7"},
+            {},
+        ]
+        with pytest.raises(TypeError):
+            grocy.due_products(True, 3)
+
+    @responses.activate
+    def test_details_for_every_category(self, grocy):
+        responses.add(responses.GET, f"{BASE_URL}/stock/volatile", json=VOLATILE_STOCK)
+        responses.add_callback(
+            responses.GET,
+            re.compile(rf"{BASE_URL}/stock/products/\d+"),
+            callback=lambda request: (
+                200,
+                {},
+                json.dumps(product_details(int(request.url.rsplit("/", 1)[-1]))),
+            ),
+        )
+
+        volatile = grocy.volatile_stock(get_details=True)
+
+        assert [product.name for product in volatile.all_products] == [
+            "P1",
+            "P2",
+            "P3",
+            "P4",
+        ]
+        assert len(responses.calls) == 5